@@ -202,7 +202,9 @@ function EnhancedQuestionCard({ question, confidenceRating, onUpdateConfidence,
                 React.createElement('pre', {
                     key: 'code',
                     className: 'code-block'
-                }, React.createElement('code', {}, question.codeExample.code)),
+                }, question.codeExample.html
+                    ? React.createElement('code', { className: 'hljs', dangerouslySetInnerHTML: { __html: question.codeExample.html } })
+                    : React.createElement('code', {}, question.codeExample.code)),
                 React.createElement('button', {
                     key: 'copy',
                     className: 'copy-btn',
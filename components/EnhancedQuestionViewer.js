@@ -50,12 +50,14 @@ class EnhancedQuestionViewer {
                     <div class="answer-section" id="answerSection" style="display: none">
                         <div class="answer-content">
                             <h3>📖 Detailed Answer</h3>
-                            <div class="answer-text">${this.formatAnswer(this.getCurrentQuestion().answer)}</div>
+                            <div class="answer-text">${this.getCurrentQuestion().answerHtml || this.formatAnswer(this.getCurrentQuestion().answer)}</div>
                             
                             ${this.getCurrentQuestion().codeExample ? `
                                 <div class="code-example">
                                     <h4>💻 Code Example</h4>
-                                    <pre><code class="language-jsx">${this.getCurrentQuestion().codeExample.code}</code></pre>
+                                    ${this.getCurrentQuestion().codeExample.html
+                                        ? `<pre><code class="hljs language-jsx" data-highlighted="yes">${this.getCurrentQuestion().codeExample.html}</code></pre>`
+                                        : `<pre><code class="language-jsx">${this.getCurrentQuestion().codeExample.code}</code></pre>`}
                                     <button class="copy-code-btn" data-code="${this.getCurrentQuestion().codeExample.code}">📋 Copy Code</button>
                                 </div>
                             ` : ''}
@@ -63,7 +65,7 @@ class EnhancedQuestionViewer {
                             ${this.getCurrentQuestion().keyPoints ? `
                                 <div class="key-points">
                                     <h4>🎯 Key Points</h4>
-                                    <ul>${this.getCurrentQuestion().keyPoints.map(point => `<li>${point}</li>`).join('')}</ul>
+                                    <ul>${(this.getCurrentQuestion().keyPointsHtml || this.getCurrentQuestion().keyPoints).map(point => `<li>${point}</li>`).join('')}</ul>
                                 </div>
                             ` : ''}
                             
@@ -122,6 +124,7 @@ class EnhancedQuestionViewer {
         return labels[level];
     }
 
+    // Fallback for data that has not been through the build's render stage (answerHtml)
     formatAnswer(answer) {
         return answer
             .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
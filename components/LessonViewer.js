@@ -173,7 +173,9 @@ function LessonViewer({ lesson, onComplete, onProgress, isCompleted }) {
                 ),
                 React.createElement('div', { className: 'code-editor-wrapper' },
                   React.createElement('pre', { className: `code-block language-${example.lang || 'jsx'}` },
-                    React.createElement('code', {}, example.code)
+                    example.html
+                      ? React.createElement('code', { className: 'hljs', dangerouslySetInnerHTML: { __html: example.html } })
+                      : React.createElement('code', {}, example.code)
                   )
                 ),
                 example.explanation && React.createElement('div', { className: 'code-explanation' },
@@ -37,8 +37,10 @@ class ReactInterviewPrepApp {
 
   async init() {
     this.showLoading('Initializing application...');
-    await this.loadAllDataFiles();
-    this.organizeAllData();
+    if (!(await this.loadContentStore())) {
+      await this.loadAllDataFiles();
+      this.organizeAllData();
+    }
     this.setupUI();
     this.setupEventListeners();
     this.applyTheme();
@@ -51,18 +53,40 @@ class ReactInterviewPrepApp {
   // DATA LOADING AND ORGANIZATION
   // ==============================================
 
+  // All data files in one request, already organized at build time; false falls back
+  // to loading the files one by one and organizing them here
+  async loadContentStore() {
+    if (typeof ContentStore === 'undefined') return false;
+
+    try {
+      this.updateLoadingProgress(0, 'Loading content store...');
+      const response = await fetch(await DataService.dataUrl('content-store.json'));
+      if (!response.ok) return false;
+
+      const organized = new ContentStore(await response.json()).organized();
+      if (!organized) return false;
+      Object.assign(this.organizedData, organized);
+      this.updateLoadingProgress(75, 'Finalizing organization...');
+      console.log('📦 Loaded content store:', Object.keys(organized));
+      return true;
+    } catch (error) {
+      console.warn('⚠️ Content store unavailable, loading data files:', error);
+      return false;
+    }
+  }
+
   async loadAllDataFiles() {
     const dataFiles = [
-      { name: 'top10', file: 'data/top-10-questions.json' },
-      { name: 'top20', file: 'data/top-20-questions.json' },
-      { name: 'top50', file: 'data/top-50-questions.json' },
-      { name: 'top100', file: 'data/top-100-questions.json' },
-      { name: 'flashcards', file: 'data/flashcards.json' },
-      { name: 'challenges', file: 'data/challenges.json' },
-      { name: 'enhanced', file: 'data/enhanced-questions.json' },
-      { name: 'complete', file: 'data/react-interview-questions-complete.json' },
-      { name: 'interviewSystem', file: 'data/enhanced-interview-system.json' },
-      { name: 'tiers', file: 'data/tier-system.json' }
+      { name: 'top10', file: 'top-10-questions.json' },
+      { name: 'top20', file: 'top-20-questions.json' },
+      { name: 'top50', file: 'top-50-questions.json' },
+      { name: 'top100', file: 'top-100-questions.json' },
+      { name: 'flashcards', file: 'flashcards.json' },
+      { name: 'challenges', file: 'challenges.json' },
+      { name: 'enhanced', file: 'enhanced-questions.json' },
+      { name: 'complete', file: 'react-interview-questions-complete.json' },
+      { name: 'interviewSystem', file: 'enhanced-interview-system.json' },
+      { name: 'tiers', file: 'tier-system.json' }
     ];
 
     this.updateLoadingProgress(0, 'Loading data files...');
@@ -70,7 +94,7 @@ class ReactInterviewPrepApp {
     const loadPromises = dataFiles.map(async ({ name, file }, index) => {
       try {
         console.log(`📥 Loading ${file}...`);
-        const response = await fetch(file);
+        const response = await fetch(await DataService.dataUrl(file));
         
         if (!response.ok) {
           console.warn(`⚠️ Could not load ${file}: ${response.statusText}`);
@@ -709,14 +733,16 @@ class ReactInterviewPrepApp {
             
             <div class="answer-content" id="answer-${question.id}" style="display: none;">
               <div class="answer-text">
-                ${this.formatAnswer(question.answer || 'Answer not available')}
+                ${question.answerHtml || this.formatAnswer(question.answer || 'Answer not available')}
               </div>
               
               ${question.codeExample ? `
                 <div class="code-example">
                   <h4>💻 Code Example</h4>
                   <div class="code-block">
-                    <pre><code>${this.escapeHtml(typeof question.codeExample === 'string' ? question.codeExample : question.codeExample.code || '')}</code></pre>
+                    ${question.codeExample.html
+                      ? `<pre><code class="hljs language-jsx" data-highlighted="yes">${question.codeExample.html}</code></pre>`
+                      : `<pre><code>${this.escapeHtml(typeof question.codeExample === 'string' ? question.codeExample : question.codeExample.code || '')}</code></pre>`}
                     <button class="copy-code-btn" onclick="app.copyCode('${question.id}')">
                       📋 Copy
                     </button>
@@ -728,7 +754,7 @@ class ReactInterviewPrepApp {
                 <div class="key-points">
                   <h4>🔑 Key Points</h4>
                   <ul>
-                    ${question.keyPoints.map(point => `<li>${point}</li>`).join('')}
+                    ${(question.keyPointsHtml || question.keyPoints).map(point => `<li>${point}</li>`).join('')}
                   </ul>
                 </div>
               ` : ''}
@@ -9,56 +9,62 @@ data = [
     {"tier": "Top 100", "beginner": 13, "intermediate": 34, "advanced": 53, "total": 100}
 ]
 
-df = pd.DataFrame(data)
+def create_chart(data=data, output_name='react_interview_chart', show=True):
+    df = pd.DataFrame(data)
 
-# Create stacked bar chart
-fig = go.Figure()
+    # Create stacked bar chart
+    fig = go.Figure()
 
-# Add bars for each difficulty level using brand colors
-fig.add_trace(go.Bar(
-    name='Beginner',
-    x=df['tier'],
-    y=df['beginner'],
-    marker_color='#1FB8CD',  # Strong cyan
-    text=df['beginner'],
-    textposition='inside',
-    textfont=dict(color='white', size=12)
-))
+    # Add bars for each difficulty level using brand colors
+    fig.add_trace(go.Bar(
+        name='Beginner',
+        x=df['tier'],
+        y=df['beginner'],
+        marker_color='#1FB8CD',  # Strong cyan
+        text=df['beginner'],
+        textposition='inside',
+        textfont=dict(color='white', size=12)
+    ))
 
-fig.add_trace(go.Bar(
-    name='Intermediate', 
-    x=df['tier'],
-    y=df['intermediate'],
-    marker_color='#2E8B57',  # Sea green
-    text=df['intermediate'],
-    textposition='inside',
-    textfont=dict(color='white', size=12)
-))
+    fig.add_trace(go.Bar(
+        name='Intermediate',
+        x=df['tier'],
+        y=df['intermediate'],
+        marker_color='#2E8B57',  # Sea green
+        text=df['intermediate'],
+        textposition='inside',
+        textfont=dict(color='white', size=12)
+    ))
 
-fig.add_trace(go.Bar(
-    name='Advanced',
-    x=df['tier'],
-    y=df['advanced'], 
-    marker_color='#DB4545',  # Bright red
-    text=df['advanced'],
-    textposition='inside',
-    textfont=dict(color='white', size=12)
-))
+    fig.add_trace(go.Bar(
+        name='Advanced',
+        x=df['tier'],
+        y=df['advanced'],
+        marker_color='#DB4545',  # Bright red
+        text=df['advanced'],
+        textposition='inside',
+        textfont=dict(color='white', size=12)
+    ))
 
-# Update layout
-fig.update_layout(
-    title='React Questions Difficulty by Tier',
-    xaxis_title='Tier',
-    yaxis_title='Questions',
-    barmode='stack',
-    legend=dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5)
-)
+    # Update layout
+    fig.update_layout(
+        title='React Questions Difficulty by Tier',
+        xaxis_title='Tier',
+        yaxis_title='Questions',
+        barmode='stack',
+        legend=dict(orientation='h', yanchor='bottom', y=1.05, xanchor='center', x=0.5)
+    )
 
-# Update traces
-fig.update_traces(cliponaxis=False)
+    # Update traces
+    fig.update_traces(cliponaxis=False)
 
-# Save as PNG and SVG
-fig.write_image('react_interview_chart.png')
-fig.write_image('react_interview_chart.svg', format='svg')
+    # Save as PNG and SVG
+    fig.write_image(f'{output_name}.png')
+    fig.write_image(f'{output_name}.svg', format='svg')
 
-fig.show()
\ No newline at end of file
+    if show:
+        fig.show()
+    return fig
+
+if __name__ == "__main__":
+    create_chart()
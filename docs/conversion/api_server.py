@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Question Bank API Server
+A small asyncio HTTP/1.1 service over the converted tier files. The bank is
+loaded once into Question objects with indexes by tier, category and
+difficulty, and clients fetch just the slice they need:
+
+    GET /api/tiers
+    GET /api/questions?tier=top-10&category=React%20Hooks&difficulty=Beginner&page=1&perPage=20
+    GET /api/questions/<tier>/<id>
+
+Every response body is rendered once, gzipped once and given a strong ETag,
+then served from memory; If-None-Match revalidations are answered with an
+empty 304. Connections are kept alive between requests.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import os
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import parse_qsl, unquote
+
+from convert_csv_to_json import FILE_MAPPINGS
+from question_model import Question, load_questions
+from tier_names import tier_key
+
+DEFAULT_PORT = 8765
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+KEEP_ALIVE_SECONDS = 15
+MIN_GZIP_BYTES = 256
+
+STATUS_TEXT = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed"}
+
+class Resource:
+    """A rendered response body with its gzip variant and ETags"""
+
+    __slots__ = ("status", "body", "etag", "gzip_body", "gzip_etag")
+
+    def __init__(self, status: int, payload: Any):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_body = None
+        self.gzip_etag = None
+        if len(self.body) >= MIN_GZIP_BYTES:
+            self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+            self.gzip_etag = f'"{digest}-gz"'
+
+class QuestionBank:
+    """All tiers in memory, with position indexes for filtering"""
+
+    def __init__(self):
+        self.questions: List[Question] = []
+        self.tiers: Dict[str, Dict[str, Any]] = {}
+        self.by_id: Dict[Tuple[str, str], int] = {}
+        self.by_tier: Dict[str, List[int]] = {}
+        self.by_category: Dict[str, List[int]] = {}
+        self.by_difficulty: Dict[str, List[int]] = {}
+
+    @classmethod
+    def from_directory(cls, data_dir: str) -> "QuestionBank":
+        bank = cls()
+        for _, json_file, title in FILE_MAPPINGS:
+            path = os.path.join(data_dir, json_file)
+            if os.path.exists(path):
+                tier = tier_key(json_file)
+                bank.add_tier(tier, f"{title} React Interview Questions", load_questions(path, tier))
+        return bank
+
+    def add_tier(self, tier: str, title: str, questions: List[Question]) -> None:
+        for question in questions:
+            position = len(self.questions)
+            self.questions.append(question)
+            self.by_id[(tier, question.id)] = position
+            self.by_tier.setdefault(tier, []).append(position)
+            self.by_category.setdefault(question.category, []).append(position)
+            self.by_difficulty.setdefault(question.difficulty, []).append(position)
+
+        tier_positions = self.by_tier.get(tier, [])
+        self.tiers[tier] = {
+            "tier": tier,
+            "title": title,
+            "totalQuestions": len(tier_positions),
+            "categories": list(dict.fromkeys(self.questions[p].category for p in tier_positions)),
+            "difficulties": list(dict.fromkeys(self.questions[p].difficulty for p in tier_positions)),
+        }
+
+    def select(self, tier: Optional[str] = None, category: Optional[str] = None,
+               difficulty: Optional[str] = None) -> List[int]:
+        """Positions matching every given filter, in bank order"""
+        filters = [(index, value) for index, value in ((self.by_tier, tier), (self.by_category, category),
+                                                       (self.by_difficulty, difficulty)) if value is not None]
+        if not filters:
+            return list(range(len(self.questions)))
+
+        # Walk the smallest matching index and check the rest against it
+        lists = sorted((index.get(value, []) for index, value in filters), key=len)
+        others = [set(positions) for positions in lists[1:]]
+        return [p for p in lists[0] if all(p in other for other in others)]
+
+def _question_payload(question: Question) -> Dict[str, Any]:
+    data = question.to_dict()
+    data["tier"] = question.tier
+    return data
+
+class QuestionApi:
+    """Maps request paths to cached Resources"""
+
+    def __init__(self, bank: QuestionBank):
+        self.bank = bank
+
+    @staticmethod
+    def _error(status: int, message: str) -> Resource:
+        return Resource(status, {"error": message})
+
+    @lru_cache(maxsize=4096)
+    def resource(self, path: str, query: Tuple[Tuple[str, str], ...]) -> Resource:
+        """Render a path and canonical query once; repeats are served from cache"""
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+        if parts[:1] != ["api"]:
+            return self._error(404, "Not found")
+
+        if parts[1:] == ["tiers"]:
+            return Resource(200, {"tiers": list(self.bank.tiers.values())})
+        if parts[1:] == ["questions"]:
+            return self._questions(dict(query))
+        if len(parts) == 4 and parts[1] == "questions":
+            position = self.bank.by_id.get((parts[2], parts[3]))
+            if position is None:
+                return self._error(404, f"No question {parts[3]} in tier {parts[2]}")
+            return Resource(200, _question_payload(self.bank.questions[position]))
+
+        return self._error(404, "Not found")
+
+    def _questions(self, params: Dict[str, str]) -> Resource:
+        try:
+            page = int(params.get("page", 1))
+            per_page = int(params.get("perPage", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return self._error(400, "page and perPage must be integers")
+        if page < 1 or not 1 <= per_page <= MAX_PAGE_SIZE:
+            return self._error(400, f"page must be >= 1 and perPage between 1 and {MAX_PAGE_SIZE}")
+
+        tier = params.get("tier")
+        if tier is not None and tier not in self.bank.tiers:
+            return self._error(404, f"Unknown tier {tier}")
+
+        positions = self.bank.select(tier, params.get("category"), params.get("difficulty"))
+        start = (page - 1) * per_page
+        return Resource(200, {
+            "total": len(positions),
+            "page": page,
+            "perPage": per_page,
+            "pages": math.ceil(len(positions) / per_page),
+            "questions": [_question_payload(self.bank.questions[p]) for p in positions[start:start + per_page]]
+        })
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        if coding.strip().lower() in ("gzip", "*"):
+            name, _, quality = params.replace(' ', '').partition('=')
+            try:
+                return name != "q" or float(quality) > 0
+            except ValueError:
+                return True
+    return False
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(','))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+class ApiServer:
+    """Keep-alive HTTP/1.1 front end for a QuestionApi"""
+
+    def __init__(self, api: QuestionApi):
+        self.api = api
+
+    def respond(self, method: str, target: str, headers: Dict[str, str], keep_alive: bool) -> bytes:
+        if method not in ("GET", "HEAD"):
+            resource = self.api._error(405, f"{method} not allowed")
+        else:
+            path, _, query = target.partition('?')
+            resource = self.api.resource(path, tuple(sorted(dict(parse_qsl(query)).items())))
+
+        body, etag = resource.body, resource.etag
+        encoding = None
+        if resource.gzip_body is not None and accepts_gzip(headers.get("accept-encoding", "")):
+            body, etag, encoding = resource.gzip_body, resource.gzip_etag, "gzip"
+
+        status = resource.status
+        if status == 200 and etag_matches(headers.get("if-none-match"), etag):
+            status = 304
+
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}",
+            f"ETag: {etag}",
+            "Cache-Control: no-cache",
+            "Vary: Accept-Encoding",
+            "Access-Control-Allow-Origin: *",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 304:
+            return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+        lines.append("Content-Type: application/json; charset=utf-8")
+        lines.append(f"Content-Length: {len(body)}")
+        if encoding:
+            lines.append(f"Content-Encoding: {encoding}")
+        if status == 405:
+            lines.append("Allow: GET, HEAD")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+        return head if method == "HEAD" else head + body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                # Requests are read-only; discard any body so the next request parses cleanly
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                writer.write(self.respond(method, target, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+async def start_server(data_dir: str, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+    bank = QuestionBank.from_directory(data_dir)
+    server = ApiServer(QuestionApi(bank))
+    print(f"Loaded {len(bank.questions):,} questions in {len(bank.tiers)} tier(s) from {data_dir}")
+    return await asyncio.start_server(server.handle_connection, host, port)
+
+def serve(data_dir: str = "json_output", host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> None:
+    """Run the API until interrupted"""
+    async def run():
+        server = await start_server(data_dir, host, port)
+        print(f"Question API on http://{host}:{port}/api/questions (Ctrl+C to stop)")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nStopping API server")
+
+def self_check(data_dir: str = "json_output") -> List[str]:
+    """
+    Start an instance on a free local port and exercise it over one
+    keep-alive connection; returns the failed checks
+    """
+    import http.client
+
+    def run_checks(port: int) -> List[str]:
+        failures = []
+
+        def check(condition: bool, message: str) -> None:
+            if not condition:
+                failures.append(message)
+
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+
+        def get(path: str, headers: Dict[str, str] = None) -> Tuple[http.client.HTTPResponse, bytes]:
+            connection.request("GET", path, headers=headers or {})
+            response = connection.getresponse()
+            return response, response.read()
+
+        response, body = get("/api/tiers")
+        tiers = json.loads(body)["tiers"] if response.status == 200 else []
+        check(response.status == 200 and tiers, "GET /api/tiers returns the loaded tiers")
+        if not tiers:
+            return failures
+        tier = tiers[0]["tier"]
+
+        response, body = get(f"/api/questions?tier={tier}&perPage=3&page=2")
+        page = json.loads(body)
+        check(response.status == 200 and len(page["questions"]) <= 3 and page["page"] == 2,
+              "pagination returns the requested page")
+        check(all(q["tier"] == tier for q in page["questions"]), "tier filter only returns that tier")
+        check(page["total"] == tiers[0]["totalQuestions"], "filtered total matches the tier size")
+
+        etag = response.getheader("ETag")
+        response, body = get(f"/api/questions?perPage=3&page=2&tier={tier}", {"If-None-Match": etag})
+        check(response.status == 304 and body == b"", "matching If-None-Match returns an empty 304")
+
+        response, body = get(f"/api/questions?tier={tier}", {"Accept-Encoding": "gzip"})
+        check(response.getheader("Content-Encoding") == "gzip"
+              and json.loads(gzip.decompress(body))["total"] == tiers[0]["totalQuestions"],
+              "gzip is served when accepted")
+        check(response.getheader("ETag") != etag, "gzip and identity bodies have distinct ETags")
+
+        category = tiers[0]["categories"][0]
+        response, body = get(f"/api/questions?tier={tier}&category={category.replace(' ', '%20')}")
+        check(all(q["category"] == category for q in json.loads(body)["questions"]),
+              "category filter only returns that category")
+
+        response, body = get(f"/api/questions/{tier}/q1")
+        check(response.status == 200 and json.loads(body)["id"] == "q1", "single question lookup by id")
+
+        for path, status in ((f"/api/questions/{tier}/missing", 404), ("/api/questions?page=0", 400),
+                             ("/api/questions?tier=nope", 404), ("/elsewhere", 404)):
+            response, _ = get(path)
+            check(response.status == status, f"GET {path} returns {status}")
+
+        connection.close()
+        return failures
+
+    async def run() -> List[str]:
+        server = await start_server(data_dir, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.get_running_loop().run_in_executor(None, run_checks, port)
+
+    return asyncio.run(run())
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "check":
+        failures = self_check(sys.argv[2] if len(sys.argv) > 2 else "json_output")
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        print("All checks passed" if not failures else f"{len(failures)} check(s) failed")
+        sys.exit(1 if failures else 0)
+
+    serve(
+        sys.argv[1] if len(sys.argv) > 1 else "json_output",
+        port=int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    )
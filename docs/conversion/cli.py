@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Unified Command Line for the Interview Prep Content Tools
+Run from this directory as `python -m cli <command>`. Each command imports
+its implementation (and any heavy dependency such as plotly or pandas) only
+when it runs, so quick commands like validate and stats start instantly.
+"""
+
+import argparse
+import os
+import sys
+
+# Reports the converter writes next to its output, which are not question files
+REPORT_SUFFIXES = ('.metrics.json', '.slow-rows.json', '.checkpoint.json')
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.normpath(os.path.join(HERE, '..', '..'))
+
+def _add_path(path: str) -> None:
+    if path not in sys.path:
+        sys.path.append(path)
+
+def _json_outputs(paths):
+    """Expand directories into the tier files they contain"""
+    from tier_names import SPLIT_FILE
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith('.json') and not name.endswith(REPORT_SUFFIXES)
+                         and not name.startswith('.') and not SPLIT_FILE.match(name))
+        else:
+            files.append(path)
+    return files
+
+def _size(value: str) -> int:
+    from conversion_metrics import parse_size
+
+    try:
+        return parse_size(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def cmd_convert(args) -> int:
+    from convert_csv_to_json import batch_convert_files, convert_csv_to_json
+
+    from conversion_checkpoint import DEFAULT_CHECKPOINT_ROWS
+
+    options = dict(profile=args.profile, cprofile=args.cprofile,
+                   track_memory=args.memory, max_memory=args.max_memory, row_budget=args.row_budget,
+                   resume=args.resume, sort=args.sort)
+
+    if args.input:
+        output = args.output or args.input.replace('.csv', '.json')
+        convert_csv_to_json(args.input, output, args.title or "", checkpoint_every=args.checkpoint_every,
+                            split_dir=args.split, **options)
+    else:
+        checkpoint_every = DEFAULT_CHECKPOINT_ROWS if args.checkpoint_every is None else args.checkpoint_every
+        batch_convert_files(args.input_dir, args.output_dir, sqlite_path=args.sqlite,
+                            checkpoint_every=checkpoint_every, split=not args.no_split, **options)
+    return 0
+
+def cmd_build(args) -> int:
+    from pipeline import DEFAULT_PIPELINE, run_pipeline
+
+    ok = run_pipeline(args.pipeline or DEFAULT_PIPELINE, args.stages or None, args.jobs,
+                      force=args.force, dry_run=args.dry_run, verbose=args.verbose)
+    return 0 if ok else 1
+
+def cmd_watch(args) -> int:
+    from watch_conversion import DEFAULT_DEST_DIR, watch
+
+    watch(args.input_dir, args.output_dir, args.port, data_dir=args.data_dir or DEFAULT_DEST_DIR)
+    return 0
+
+def cmd_parse(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    from parse_questions import main as parse_main
+
+    parse_main(args.input, args.output)
+    print(f"Parsed {args.input} -> {args.output}")
+    return 0
+
+def cmd_chart(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'docs'))
+    try:
+        from chart_script import create_chart, data as default_data
+    except ImportError as e:
+        print(f"Chart dependencies missing ({e.name}). Install with: pip install plotly pandas kaleido")
+        return 1
+
+    chart_data = default_data
+    if args.files:
+        from convert_csv_to_json import FILE_MAPPINGS
+        from validate_questions import file_stats
+
+        titles = {json_file: title for _, json_file, title in FILE_MAPPINGS}
+        chart_data = []
+        for path in _json_outputs(args.files):
+            difficulties = file_stats(path)["difficulties"]
+            chart_data.append({
+                "tier": titles.get(os.path.basename(path), os.path.basename(path)),
+                "beginner": difficulties.get("Beginner", 0),
+                "intermediate": difficulties.get("Intermediate", 0),
+                "advanced": difficulties.get("Advanced", 0),
+                "total": sum(difficulties.values())
+            })
+
+    create_chart(chart_data, args.output, show=args.show)
+    print(f"Chart written to {args.output}.png and {args.output}.svg")
+    return 0
+
+def cmd_publish(args) -> int:
+    from publish_assets import DEFAULT_DEST_DIR, publish
+
+    publish(args.source_dir, args.dest_dir or DEFAULT_DEST_DIR, args.url_prefix, args.files or None,
+            prune=not args.keep_old, deltas=not args.no_deltas, delta_max_ratio=args.delta_max_ratio)
+    return 0
+
+def cmd_store(args) -> int:
+    from content_store import SOURCES, build, write_views
+
+    if args.views:
+        import json
+
+        with open(args.output, 'r', encoding='utf-8') as file:
+            written = write_views(json.load(file), args.views)
+        print(f"Wrote {len(written)} view(s) to {args.views}")
+        return 0
+
+    files = args.files or [os.path.join(REPO_ROOT, 'public', 'data', name) for _, name in SOURCES]
+    build(files, args.output)
+    return 0
+
+def cmd_serve(args) -> int:
+    from api_server import self_check, serve
+
+    if args.check:
+        failures = self_check(args.data_dir)
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        print("All checks passed" if not failures else f"{len(failures)} check(s) failed")
+        return 1 if failures else 0
+
+    serve(args.data_dir, args.host, args.port)
+    return 0
+
+def cmd_tiers(args) -> int:
+    from tier_builder import build_tiers, parse_weights
+
+    build_tiers(args.bank, args.output_dir, args.tier_system,
+                parse_weights(args.weights) if args.weights else None)
+    return 0
+
+def cmd_user_stats(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    from datetime import date
+    from refresh_user_stats import refresh_user_stats
+
+    as_of = date.fromisoformat(args.as_of) if args.as_of else None
+    refresh_user_stats(args.progress, args.sessions, args.output, args.schema, as_of, args.data_only)
+    return 0
+
+def cmd_readiness(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    try:
+        from readiness_scores import score_all_users
+    except ImportError as e:
+        print(f"Readiness scoring needs numpy ({e.name} missing). Install with: pip install numpy")
+        return 1
+
+    score_all_users(args.progress, args.questions, args.output, args.sql)
+    return 0
+
+def cmd_compact_history(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    from compact_confidence_history import compact_export
+
+    compact_export(args.export, args.output, args.keep_days, args.daily_days, args.batch_size)
+    return 0
+
+def cmd_load_data(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    from datetime import date
+    from generate_load_data import generate_load_data
+
+    as_of = date.fromisoformat(args.as_of) if args.as_of else None
+    generate_load_data(args.output, args.users, args.seed, as_of, args.flashcards, args.questions, args.jobs)
+    return 0
+
+def cmd_query_bench(args) -> int:
+    _add_path(os.path.join(REPO_ROOT, 'scripts'))
+    from datetime import date
+    try:
+        from benchmark_queries import benchmark
+    except ImportError as e:
+        print(f"The query benchmark needs psycopg 3 ({e.name} missing). Install with: pip install 'psycopg[binary]'")
+        return 1
+
+    as_of = date.fromisoformat(args.as_of) if args.as_of else None
+    benchmark(args.dsn, args.sizes, args.output, args.data_dir, args.clients, args.duration, args.seed, as_of)
+    return 0
+
+def cmd_validate(args) -> int:
+    from validate_questions import validate_file
+
+    failed = 0
+    for path in _json_outputs(args.files):
+        errors = validate_file(path)
+        if errors:
+            failed += 1
+            print(f"{path}: {len(errors)} problem(s)")
+            for error in errors:
+                print(f"   - {error}")
+        else:
+            print(f"{path}: OK")
+    return 1 if failed else 0
+
+def cmd_stats(args) -> int:
+    from validate_questions import file_stats
+
+    for path in _json_outputs(args.files):
+        stats = file_stats(path)
+        print(f"{os.path.basename(path)}: {stats['questions']} questions, "
+              f"{stats['withCodeExample']} with code examples")
+        print(f"   Categories: {stats['categories']}")
+        print(f"   Difficulties: {stats['difficulties']}")
+    return 0
+
+def cmd_setup(args) -> int:
+    from setup_conversion import main as setup_main
+
+    setup_main()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description="React interview prep content tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert CSV files to JSON (batch mode by default)")
+    convert.add_argument("input", nargs="?", help="Single CSV file to convert")
+    convert.add_argument("output", nargs="?", help="Output JSON file for a single conversion")
+    convert.add_argument("--title", help="Title prefix for a single conversion")
+    convert.add_argument("--input-dir", default=".")
+    convert.add_argument("--output-dir", default="json_output")
+    convert.add_argument("--profile", action="store_true", help="Write per-stage timings to <output>.metrics.json")
+    convert.add_argument("--cprofile", action="store_true", help="Write a cProfile dump to <output>.prof")
+    convert.add_argument("--memory", action="store_true", help="Record tracemalloc peak memory per stage and file")
+    convert.add_argument("--max-memory", type=_size, metavar="SIZE",
+                         help="Memory budget (e.g. 256MB); spill to disk instead of exceeding it")
+    convert.add_argument("--row-budget", type=float, default=5.0, metavar="SECONDS",
+                         help="Per-row enrichment time limit; slower rows are written unenriched (0 disables)")
+    convert.add_argument("--checkpoint-every", type=int, metavar="ROWS",
+                         help="Commit progress every ROWS rows (batch default 1000, 0 disables)")
+    convert.add_argument("--resume", action="store_true",
+                         help="Continue an interrupted conversion from its last checkpoint")
+    convert.add_argument("--sort", action="store_true",
+                         help="Write questions in rank order; with --max-memory, sort in runs on disk")
+    convert.add_argument("--split", metavar="DIR",
+                         help="Also write a summary index and detail blocks to DIR (single file; batch does this by default)")
+    convert.add_argument("--no-split", action="store_true", help="Skip the summary/detail files in batch mode")
+    convert.add_argument("--sqlite", metavar="PATH",
+                         help="Also compile the batch output into a SQLite database with FTS5 search")
+    convert.set_defaults(func=cmd_convert)
+
+    build = commands.add_parser("build", help="Run the content pipeline (pipeline.json), skipping up-to-date stages")
+    build.add_argument("stages", nargs="*", help="Stages to build with their dependencies (default: all non-optional)")
+    build.add_argument("--pipeline", help="Pipeline definition (default: pipeline.json next to this tool)")
+    build.add_argument("--jobs", "-j", type=int, help="Parallel workers (default: one per CPU core)")
+    build.add_argument("--force", action="store_true", help="Rebuild every selected stage")
+    build.add_argument("--dry-run", action="store_true", help="Print the selected stages and their dependencies")
+    build.add_argument("--verbose", action="store_true", help="Show each stage's output")
+    build.set_defaults(func=cmd_build)
+
+    watch = commands.add_parser("watch", help="Rebuild changed sources and notify open pages")
+    watch.add_argument("--input-dir", default=".")
+    watch.add_argument("--output-dir", default="json_output")
+    watch.add_argument("--data-dir", help="Served directory rebuilt files are copied to (default: public/data)")
+    watch.add_argument("--port", type=int, default=35729)
+    watch.set_defaults(func=cmd_watch)
+
+    parse = commands.add_parser("parse", help="Parse a markdown question file into JSON")
+    parse.add_argument("input", nargs="?", default="questions_input.md")
+    parse.add_argument("output", nargs="?", default="react-top-20.json")
+    parse.set_defaults(func=cmd_parse)
+
+    chart = commands.add_parser("chart", help="Render the difficulty-by-tier chart (needs plotly, pandas)")
+    chart.add_argument("files", nargs="*", help="Converted JSON files or directories to chart")
+    chart.add_argument("--output", default="react_interview_chart")
+    chart.add_argument("--show", action="store_true", help="Open the chart after saving")
+    chart.set_defaults(func=cmd_chart)
+
+    publish = commands.add_parser("publish", help="Copy converted files to content-hashed names and write asset-manifest.json")
+    publish.add_argument("files", nargs="*", help="Files to publish (default: the tier files and their summary/detail files)")
+    publish.add_argument("--source-dir", default="json_output")
+    publish.add_argument("--dest-dir", help="Destination directory (default: public/data)")
+    publish.add_argument("--url-prefix", default="/data/")
+    publish.add_argument("--keep-old", action="store_true", help="Keep hashed files older than the previous release")
+    publish.add_argument("--no-deltas", action="store_true", help="Skip JSON Patch deltas from earlier releases")
+    publish.add_argument("--delta-max-ratio", type=float, default=0.5, metavar="RATIO",
+                         help="Drop patch chains larger than this fraction of the full file")
+    publish.set_defaults(func=cmd_publish)
+
+    store = commands.add_parser("store", help="Normalize the data files into one ID-referenced content store")
+    store.add_argument("files", nargs="*", help="Data files to ingest (default: the files in public/data)")
+    store.add_argument("--output", default="build/render/content-store.json")
+    store.add_argument("--views", metavar="DIR", help="Instead, regenerate every legacy file from --output into DIR")
+    store.set_defaults(func=cmd_store)
+
+    serve = commands.add_parser("serve", help="Serve converted questions as a paginated JSON API")
+    serve.add_argument("--data-dir", default="json_output")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--check", action="store_true", help="Start a local instance, exercise every endpoint and exit")
+    serve.set_defaults(func=cmd_serve)
+
+    tiers = commands.add_parser("tiers", help="Rank a question bank by score and write tier CSVs + tier-system.json")
+    tiers.add_argument("bank", help="CSV export of the questions table")
+    tiers.add_argument("--output-dir", default=".", help="Where to write the tier CSVs")
+    tiers.add_argument("--tier-system", default="tier-system.json")
+    tiers.add_argument("--weights", help="Score weights, e.g. frequency_score=1,importance_level=10")
+    tiers.set_defaults(func=cmd_tiers)
+
+    user_stats = commands.add_parser("user-stats", help="Recompute user_stats from progress/session exports")
+    user_stats.add_argument("progress", help="user_question_progress CSV export, ordered by user_id")
+    user_stats.add_argument("sessions", help="study_sessions CSV export, ordered by user_id")
+    user_stats.add_argument("--output", default="user_stats_refresh.sql")
+    user_stats.add_argument("--schema", choices=["confidence", "progress"], default="confidence",
+                            help="user_stats layout: 003_confidence_tracking or 002_progress_tracking")
+    user_stats.add_argument("--as-of", help="Date streaks are measured against (default: today)")
+    user_stats.add_argument("--data-only", action="store_true", help="Write bare COPY data instead of a psql script")
+    user_stats.set_defaults(func=cmd_user_stats)
+
+    readiness = commands.add_parser("readiness", help="Score interview readiness and percentile rank for every user")
+    readiness.add_argument("progress", help="user_question_progress CSV export (user_id, question_id, confidence_level)")
+    readiness.add_argument("questions", help="questions CSV export (id, tier_id)")
+    readiness.add_argument("--output", default="readiness_scores.csv")
+    readiness.add_argument("--sql", help="Also write a psql script that updates user_stats.interview_readiness_score")
+    readiness.set_defaults(func=cmd_readiness)
+
+    compact = commands.add_parser("compact-history",
+                                  help="Roll old confidence_history points into daily/weekly summaries")
+    compact.add_argument("export", help="CSV export of user_question_progress (id, confidence_history)")
+    compact.add_argument("--output", default="compact_confidence_history.sql")
+    compact.add_argument("--keep-days", type=int, default=30, help="Keep raw points newer than this")
+    compact.add_argument("--daily-days", type=int, default=180,
+                         help="Summarize by day up to this age, by ISO week beyond it")
+    compact.add_argument("--batch-size", type=int, default=500, help="Rows per UPDATE statement")
+    compact.set_defaults(func=cmd_compact_history)
+
+    load_data = commands.add_parser("load-data", help="Generate seeded synthetic rows for load testing the database")
+    load_data.add_argument("users", type=int, help="Number of users to generate")
+    load_data.add_argument("--output", default="loaddata", help="Directory for the COPY files and load.sql")
+    load_data.add_argument("--seed", type=int, default=1)
+    load_data.add_argument("--as-of", help="Last day of generated activity (default: today)")
+    load_data.add_argument("--flashcards", type=int, default=400)
+    load_data.add_argument("--questions", type=int, default=100)
+    load_data.add_argument("--jobs", type=int, help="Worker processes (default: one per core)")
+    load_data.set_defaults(func=cmd_load_data)
+
+    query_bench = commands.add_parser("query-bench",
+                                      help="Benchmark the app's hot queries against a local throwaway Postgres")
+    query_bench.add_argument("dsn", help="Superuser connection to a local server, e.g. postgresql://postgres@localhost/postgres")
+    query_bench.add_argument("sizes", nargs="+", type=int, help="User counts to benchmark, one database each")
+    query_bench.add_argument("--output", default="query_benchmark.json", help="Latencies and EXPLAIN plans")
+    query_bench.add_argument("--data-dir", default="loaddata", help="Generated data, reused across runs")
+    query_bench.add_argument("--clients", type=int, default=8, help="Concurrent connections")
+    query_bench.add_argument("--duration", type=int, default=30, help="Measured seconds per size")
+    query_bench.add_argument("--seed", type=int, default=1)
+    query_bench.add_argument("--as-of", help="Last day of generated activity (default: today)")
+    query_bench.set_defaults(func=cmd_query_bench)
+
+    validate = commands.add_parser("validate", help="Check converted JSON files")
+    validate.add_argument("files", nargs="*", default=["json_output"])
+    validate.set_defaults(func=cmd_validate)
+
+    stats = commands.add_parser("stats", help="Summarize converted JSON files")
+    stats.add_argument("files", nargs="*", default=["json_output"])
+    stats.set_defaults(func=cmd_stats)
+
+    setup = commands.add_parser("setup", help="Check prerequisites, back up data and run the batch conversion")
+    setup.set_defaults(func=cmd_setup)
+
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
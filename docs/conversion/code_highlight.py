@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Build-Time Syntax Highlighting
+Turns code examples into highlighted HTML at build time so viewers never
+tokenize on the main thread. Output is the inner HTML of a <code> element,
+with highlight.js class names (hljs-keyword, hljs-string, ...) so existing
+highlight.js themes style it, whichever engine produced it:
+
+- Pygments, when installed, for any language it has a lexer for
+- otherwise a built-in JS/JSX tokenizer (js, jsx, ts, tsx); other languages
+  are escaped only
+
+ENGINE names the engine in use; it is part of every cache key, so
+installing Pygments re-highlights everything once.
+
+    python code_highlight.py example.jsx [language]
+"""
+
+import html
+import json
+import re
+import sys
+from typing import List, Optional, Tuple
+
+try:
+    import pygments
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import Token
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+# Bump when the built-in tokenizer's output changes
+TOKENIZER_VERSION = 1
+ENGINE = f"pygments-{pygments.__version__}" if pygments else f"builtin-{TOKENIZER_VERSION}"
+BUILTIN_LANGUAGES = {"js", "jsx", "javascript", "ts", "tsx", "typescript", "mjs", "cjs"}
+
+KEYWORDS = {
+    "as", "async", "await", "break", "case", "catch", "class", "const", "continue", "debugger", "default",
+    "delete", "do", "else", "export", "extends", "finally", "for", "from", "function", "get", "if",
+    "implements", "import", "in", "instanceof", "interface", "let", "new", "of", "return", "set", "static",
+    "super", "switch", "this", "throw", "try", "type", "typeof", "var", "void", "while", "with", "yield",
+}
+LITERALS = {"true", "false", "null", "undefined", "NaN", "Infinity"}
+BUILT_INS = {
+    "Array", "Boolean", "console", "Date", "document", "Error", "fetch", "JSON", "Map", "Math", "Number",
+    "Object", "Promise", "React", "RegExp", "Set", "String", "Symbol", "window",
+}
+
+TOKEN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+  | (?P<string>`(?:\\[\s\S]|[^\\`])*`|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<tag></?(?=[A-Za-z>])[\w.:-]*)
+  | (?P<number>\b(?:0[xX][\da-fA-F_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?n?)\b)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<arrow>=>)
+  | (?P<other>\s+|.)
+""", re.VERBOSE)
+# A JSX attribute name, which may contain dashes (data-id, aria-label)
+ATTRIBUTE = re.compile(r"[A-Za-z_$][\w$.:-]*(?=\s*=(?![=>]))")
+
+def _span(css: str, text: str) -> str:
+    return f'<span class="{css}">{html.escape(text, quote=False)}</span>' if css else html.escape(text, quote=False)
+
+def tokenize_js(code: str) -> List[Tuple[str, str]]:
+    """Split JS/JSX into (hljs class, text) pairs; text with no class is plain"""
+    tokens: List[Tuple[str, str]] = []
+    in_tag = closing = False
+    # Braces opened inside a JSX tag, e.g. onClick={() => ...}
+    tag_braces = 0
+    # Open JSX elements; inside one, text is children and "<" always starts a tag
+    depth = 0
+    previous = ""
+    position = 0
+    while position < len(code):
+        attribute = ATTRIBUTE.match(code, position) if in_tag and not tag_braces else None
+        if attribute:
+            tokens.append(("hljs-attr", attribute.group()))
+            previous, position = attribute.group(), attribute.end()
+            continue
+
+        match = TOKEN.match(code, position)
+        kind, text = match.lastgroup, match.group()
+        position = match.end()
+        if kind == "tag" and not depth and not text.startswith("</") and previous \
+                and previous[-1] not in "(,=:?&|{}[;>" and previous not in ("return", "=>"):
+            # A comparison, not a tag
+            tokens.append(("", "<"))
+            position = match.start() + 1
+            previous = "<"
+            continue
+
+        if kind == "tag":
+            closing = text.startswith("</")
+            bracket = "</" if closing else "<"
+            tokens.append(("", bracket))
+            if text[len(bracket):]:
+                tokens.append(("hljs-name", text[len(bracket):]))
+            in_tag, tag_braces = True, 0
+        elif kind == "other" and in_tag and text in "{}":
+            tag_braces += 1 if text == "{" else -1
+            tokens.append(("", text))
+        elif kind == "other" and in_tag and not tag_braces and text == ">":
+            if closing:
+                depth = max(0, depth - 1)
+            elif previous != "/":
+                depth += 1
+            in_tag = False
+            tokens.append(("", text))
+        elif kind == "name" and depth and not in_tag:
+            # JSX text
+            tokens.append(("", text))
+        elif kind == "name":
+            if text in KEYWORDS:
+                css = "hljs-keyword"
+            elif text in LITERALS:
+                css = "hljs-literal"
+            elif text in BUILT_INS:
+                css = "hljs-built_in"
+            elif re.match(r"\s*\(", code[position:]):
+                css = "hljs-title function_"
+            else:
+                css = ""
+            tokens.append((css, text))
+        elif kind == "comment":
+            tokens.append(("hljs-comment", text))
+        elif kind == "string" and not (depth and not in_tag):
+            tokens.append(("hljs-string", text))
+        elif kind == "number":
+            tokens.append(("hljs-number", text))
+        else:
+            tokens.append(("", text))
+        if not text.isspace():
+            previous = text
+    return tokens
+
+def _pygments_class(token_type) -> str:
+    """hljs class for a Pygments token type, checked from most to least specific"""
+    for parent, css in ((Token.Comment, "hljs-comment"), (Token.Literal.String.Regex, "hljs-regexp"),
+                        (Token.Literal.String, "hljs-string"), (Token.Literal.Number, "hljs-number"),
+                        (Token.Keyword.Constant, "hljs-literal"), (Token.Keyword.Type, "hljs-type"),
+                        (Token.Keyword, "hljs-keyword"), (Token.Name.Builtin, "hljs-built_in"),
+                        (Token.Name.Function, "hljs-title function_"), (Token.Name.Class, "hljs-title class_"),
+                        (Token.Name.Tag, "hljs-name"), (Token.Name.Attribute, "hljs-attr")):
+        if token_type in parent:
+            return css
+    return ""
+
+def _pygments_tokens(code: str, language: str) -> Optional[List[Tuple[str, str]]]:
+    try:
+        lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+    return [(_pygments_class(token_type), text) for token_type, text in lexer.get_tokens(code)]
+
+def highlight(code: str, language: str = "jsx") -> str:
+    """Highlighted inner HTML for a <code> element"""
+    language = (language or "").lower()
+    tokens = _pygments_tokens(code, language) if pygments and language else None
+    if tokens is None and language in BUILTIN_LANGUAGES:
+        tokens = tokenize_js(code)
+    if tokens is None:
+        return html.escape(code, quote=False)
+
+    # Neighbouring tokens of one class share a span
+    merged: List[Tuple[str, str]] = []
+    for css, text in tokens:
+        if merged and merged[-1][0] == css:
+            merged[-1] = (css, merged[-1][1] + text)
+        else:
+            merged.append((css, text))
+    return "".join(_span(css, text) for css, text in merged)
+
+# code: `...` in a script, and the lang: '...' that may follow within the same object
+CODE_LITERAL = re.compile(r"(\bcode:\s*)`((?:\\[\s\S]|[^\\`])*)`")
+LANG_FIELD = re.compile(r"""^[^{}]*?\blang:\s*['"]([\w+-]+)['"]""")
+
+def highlight_script(script: str) -> Tuple[str, int]:
+    """
+    Add an html: "..." property after every plain code: `...` template
+    literal in a JS data file; returns the new script and how many were
+    highlighted. Literals that interpolate with ${...} are left alone.
+    """
+    count = 0
+
+    def add_html(match: re.Match) -> str:
+        nonlocal count
+        raw = match.group(2)
+        if re.search(r"(?<!\\)\$\{", raw):
+            return match.group()
+        code = re.sub(r"\\([\s\S])", r"\1", raw)
+        lang = LANG_FIELD.match(script, match.end())
+        count += 1
+        return f"{match.group()}, html: {json.dumps(highlight(code, lang.group(1) if lang else 'jsx'))}"
+
+    return CODE_LITERAL.sub(add_html, script), count
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python code_highlight.py <file> [language]")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as file:
+        source = file.read()
+    print(highlight(source, sys.argv[2] if len(sys.argv) > 2 else "jsx"))
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Canonical Content Store
+The public data files each have their own shape and overlap heavily: the
+same question appears in up to five of them, and data-integrated-app.js
+re-normalizes them all on every load (organizeAllData). This builds one
+ID-referenced store that every legacy file is a view of:
+
+    entities    questions, flashcards ("cards") and challenges, one canonical
+                object each, keyed by "<kind>/<id>"
+    views       each legacy file with its entities replaced by references
+    texts       strings that still occur more than once, stored once
+    patches     "$set"/"$unset" pairs that several references share
+    links       cross-links between entities: cards asking the same thing as
+                a question, and the tier-system.json tiers each question is in
+    organized   the sections organizeAllData used to build in the browser
+
+A reference is {"$ref": "questions/q1"}, plus "$set" for fields where this
+copy differs from the canonical one and "$unset" for fields it lacks, or
+{"$p": <index into patches>} when the same pair recurs (the organized
+sections repeat a handful of them hundreds of times); a shared string is
+{"$t": <index into texts>}. resolve() turns any part of
+the store back into plain JSON, and build_store checks that every view
+resolves to exactly the file it came from.
+
+    python content_store.py <file.json> [...] <content-store.json>
+    python content_store.py --views <content-store.json> <output_dir>
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+
+STORE_VERSION = 2
+# Shorter strings cost less inline than as a {"$t": n} reference
+MIN_SHARED_TEXT = 12
+RESERVED_KEYS = {"$ref", "$set", "$unset", "$p", "$t"}
+
+# Data files as data-integrated-app.js names them, in its load order
+SOURCES = [
+    ("top10", "top-10-questions.json"),
+    ("top20", "top-20-questions.json"),
+    ("top50", "top-50-questions.json"),
+    ("top100", "top-100-questions.json"),
+    ("flashcards", "flashcards.json"),
+    ("challenges", "challenges.json"),
+    ("enhanced", "enhanced-questions.json"),
+    ("complete", "react-interview-questions-complete.json"),
+    ("interviewSystem", "enhanced-interview-system.json"),
+    ("tiers", "tier-system.json"),
+]
+
+# (source, group, id, title, description, icon, difficulty, priority); a None
+# description means the tier file's own, as organizeTopQuestions does
+TOP_SECTIONS = [
+    ("top10", "quickStart", "top-10-essential", "🚀 Top 10 Essential Questions", None, "⭐", "Beginner", "high"),
+    ("top20", "quickStart", "top-20-core", "🔥 Top 20 Core Questions", None, "💪", "Intermediate", "high"),
+    ("top50", "practice", "top-50-complete", "💯 Top 50 Questions", "Comprehensive question set", "📚",
+     "Mixed", "medium"),
+    ("top100", "practice", "top-100-complete", "🎯 Top 100 Questions", "Ultimate practice collection", "🏆",
+     "Advanced", "low"),
+]
+TOP_DESCRIPTIONS = {"top10": "Most important React questions", "top20": "Core React concepts"}
+
+# Keyword rules of categorizeQuestion, in its order; no match means fundamentals
+TOPIC_KEYWORDS = [
+    ("hooks", ["hook", "usestate", "useeffect", "usememo", "usecallback", "usecontext", "usereducer", "useref"]),
+    ("stateManagement", ["redux", "context api", "state management", "zustand", "provider", "store"]),
+    ("performance", ["performance", "optimization", "memo", "lazy", "suspense", "code splitting"]),
+    ("advanced", ["error boundary", "higher-order", "hoc", "render prop", "compound component", "portal"]),
+]
+CATEGORY_ICONS = {
+    "React Fundamentals": "⚛️", "React Hooks": "🎣", "Components": "🧩", "State Management": "🗃️",
+    "Props": "📦", "JSX": "📝", "Event Handling": "🎯", "Performance": "⚡", "Testing": "🧪",
+    "Advanced": "🔬", "Next.js": "▲",
+}
+
+def normalize_text(text: str) -> str:
+    """Case and punctuation-insensitive form used to recognise the same question"""
+    return re.sub(r"\W+", " ", text.lower()).strip()
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+def entity_kind(node: Dict[str, Any]) -> Optional[str]:
+    if isinstance(node.get("question"), str) and "answer" in node:
+        return "questions"
+    if isinstance(node.get("front"), str) and "back" in node:
+        return "cards"
+    if isinstance(node.get("title"), str) and ("requirements" in node or "code_skeleton" in node):
+        return "challenges"
+    return None
+
+def _identity(kind: str, node: Dict[str, Any]) -> Tuple[str, str]:
+    """(what makes two objects the same entity, the id to prefer for it)"""
+    if kind == "questions":
+        return normalize_text(node["question"]), str(node.get("id") or slugify(node["question"]))
+    if kind == "cards":
+        return str(node.get("id") or normalize_text(node["front"])), str(node.get("id") or slugify(node["front"]))
+    return normalize_text(node["title"]), slugify(node["title"])
+
+def _walk_entities(node: Any, found: List[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+    if isinstance(node, dict):
+        reserved = RESERVED_KEYS.intersection(node)
+        if reserved:
+            raise ValueError(f"Content uses reserved key(s) {sorted(reserved)}")
+        kind = entity_kind(node)
+        if kind:
+            found.append((kind, *_identity(kind, node), node))
+        for value in node.values():
+            _walk_entities(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            _walk_entities(value, found)
+
+def _reference(ref: str, node: Dict[str, Any], canonical: Dict[str, Any]) -> Dict[str, Any]:
+    """Reference to canonical carrying whatever node changes or drops"""
+    reference: Dict[str, Any] = {"$ref": ref}
+    changed = {key: value for key, value in node.items() if key not in canonical or canonical[key] != value}
+    missing = [key for key in canonical if key not in node]
+    if changed:
+        reference["$set"] = changed
+    if missing:
+        reference["$unset"] = missing
+    return reference
+
+class StoreBuilder:
+    """Collects entities from every source, then writes views against the canonical copies"""
+
+    def __init__(self):
+        self.refs: Dict[Tuple[str, str], str] = {}
+        self.entities: Dict[str, Dict[str, Any]] = {}
+        self.links: Dict[str, Dict[str, List[str]]] = {}
+        self._versions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._preferred: Dict[Tuple[str, str], str] = {}
+
+    def collect(self, data: Any) -> None:
+        found: List[Tuple[str, str, str, Dict[str, Any]]] = []
+        _walk_entities(data, found)
+        for kind, identity, preferred_id, node in found:
+            self._versions.setdefault((kind, identity), []).append(node)
+            self._preferred.setdefault((kind, identity), preferred_id)
+
+    def finish(self) -> None:
+        """
+        Pick the canonical copy of each entity: the most common variant, so
+        the fewest references need "$set", then the one with most fields
+        """
+        taken = set()
+        for key, versions in self._versions.items():
+            kind = key[0]
+            variants = Counter(json.dumps(version, sort_keys=True) for version in versions)
+            canonical = max(versions, key=lambda version: (variants[json.dumps(version, sort_keys=True)], len(version)))
+            entity_id = str(canonical.get("id") or self._preferred[key])
+            ref, suffix = f"{kind}/{entity_id}", 2
+            while ref in taken:
+                ref, suffix = f"{kind}/{entity_id}~{suffix}", suffix + 1
+            taken.add(ref)
+            self.refs[key] = ref
+            self.entities[ref] = canonical
+
+    def ref_for(self, node: Dict[str, Any]) -> Optional[str]:
+        kind = entity_kind(node)
+        return self.refs.get((kind, _identity(kind, node)[0])) if kind else None
+
+    def view(self, node: Any) -> Any:
+        """node with every entity replaced by a reference"""
+        if isinstance(node, dict):
+            ref = self.ref_for(node)
+            if ref:
+                return _reference(ref, node, self.entities[ref])
+            return {key: self.view(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self.view(value) for value in node]
+        return node
+
+    def _link(self, ref: str, relation: str, target: str) -> None:
+        self.links.setdefault(ref, {}).setdefault(relation, []).append(target)
+
+    def link(self, tier_system: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Cross-link cards and questions that ask the same thing, and each
+        question with the tiers that list it by number (q<n>)
+        """
+        questions = {normalize_text(entity["question"]): ref for ref, entity in self.entities.items()
+                     if ref.startswith("questions/")}
+        for ref, entity in self.entities.items():
+            question_ref = ref.startswith("cards/") and questions.get(normalize_text(entity["front"]))
+            if question_ref:
+                self._link(ref, "related", question_ref)
+                self._link(question_ref, "related", ref)
+
+        tiers = tier_system.get("tiers") if isinstance(tier_system, dict) else None
+        for tier, details in (tiers or {}).items():
+            for number in details.get("questions") or []:
+                if f"questions/q{number}" in self.entities:
+                    self._link(f"questions/q{number}", "tiers", tier)
+
+def categorize_question(question: Dict[str, Any]) -> List[str]:
+    """Port of categorizeQuestion in data-integrated-app.js"""
+    text = f"{question['question']} {question.get('answer') or ''} {question.get('category') or ''}".lower()
+    topics = [topic for topic, keywords in TOPIC_KEYWORDS if any(keyword in text for keyword in keywords)]
+    return topics or ["fundamentals"]
+
+def _normalized_question(question: Dict[str, Any], source: str, index: int) -> Dict[str, Any]:
+    """Port of normalizeQuestions; a missing id is derived from the position, not the clock"""
+    normalized = dict(question)
+    normalized.update({
+        "id": question.get("id") or f"{source}-{index}",
+        "source": source,
+        "category": question.get("category") or "General",
+        "difficulty": question.get("difficulty") or "Intermediate",
+        "keyPoints": question.get("keyPoints") or [],
+        "followUpQuestions": question.get("followUpQuestions") or [],
+        "codeExample": question.get("codeExample") or None,
+    })
+    return normalized
+
+def organize(builder: StoreBuilder, files: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The organizedData of data-integrated-app.js, built once here; questions
+    and cards are references, so the sections add almost no bytes
+    """
+    organized: Dict[str, Any] = {group: [] for group in ("quickStart", "fundamentals", "hooks", "stateManagement",
+                                                          "performance", "advanced", "practice")}
+    organized["flashcards"] = {}
+    organized["challenges"] = []
+
+    def reference(node: Dict[str, Any], copy: Dict[str, Any]) -> Dict[str, Any]:
+        """copy of entity node as a reference to its canonical object"""
+        ref = builder.ref_for(node)
+        return _reference(ref, copy, builder.entities[ref]) if ref else copy
+
+    for source, group, section_id, title, description, icon, difficulty, priority in TOP_SECTIONS:
+        data = files.get(source)
+        if isinstance(data, dict) and data.get("questions"):
+            organized[group].append({
+                "id": section_id,
+                "title": title,
+                "description": description or data.get("description") or TOP_DESCRIPTIONS[source],
+                "icon": icon,
+                "questions": [reference(question, _normalized_question(question, source, index))
+                              for index, question in enumerate(data["questions"])],
+                "difficulty": difficulty,
+                "priority": priority,
+            })
+
+    placed = {topic: set() for topic, _ in TOPIC_KEYWORDS}
+    placed["fundamentals"] = set()
+    for source, _ in SOURCES:
+        data = files.get(source)
+        if not isinstance(data, dict) or not isinstance(data.get("questions"), list):
+            continue
+        for index, question in enumerate(data["questions"]):
+            normalized = _normalized_question(question, source, index)
+            for topic in categorize_question(normalized):
+                if normalized["id"] in placed[topic]:
+                    continue
+                placed[topic].add(normalized["id"])
+                category = normalized["category"]
+                section = next((s for s in organized[topic] if s["category"] == category), None)
+                if section is None:
+                    slug = re.sub(r"\s+", "-", category.lower())
+                    section = {
+                        "id": f"{topic}-{slug}",
+                        "title": category,
+                        "description": f"Questions about {category.lower()}",
+                        "icon": CATEGORY_ICONS.get(category, "📄"),
+                        "questions": [],
+                        "difficulty": normalized["difficulty"],
+                        "category": category,
+                    }
+                    organized[topic].append(section)
+                section["questions"].append(reference(question, normalized))
+
+    flashcards = files.get("flashcards")
+    if isinstance(flashcards, dict) and isinstance(flashcards.get("categories"), dict):
+        for key, category in flashcards["categories"].items():
+            cards = category.get("cards") or []
+            organized["flashcards"][key] = {
+                "id": key,
+                "title": category.get("title"),
+                "description": category.get("description"),
+                "icon": category.get("icon") or "🎴",
+                "color": category.get("color") or "#007bff",
+                "cards": [reference(card, card) for card in cards],
+                "totalCards": len(cards),
+            }
+
+    challenges = files.get("challenges")
+    if isinstance(challenges, dict) and isinstance(challenges.get("react_challenges"), dict):
+        for difficulty, entries in challenges["react_challenges"].items():
+            if not isinstance(entries, list):
+                continue
+            for challenge in entries:
+                ref = builder.ref_for(challenge)
+                organized["challenges"].append({
+                    "id": challenge.get("id") or (ref.split("/", 1)[1] if ref else slugify(challenge["title"])),
+                    "title": challenge.get("title"),
+                    "description": challenge.get("description"),
+                    "difficulty": difficulty,
+                    "requirements": challenge.get("requirements") or [],
+                    "hints": challenge.get("hints") or [],
+                    "solution": challenge.get("solution") or "",
+                    "category": "React Challenges",
+                })
+    return organized
+
+def _patch_key(node: Dict[str, Any]) -> Optional[str]:
+    if "$ref" not in node or not ("$set" in node or "$unset" in node):
+        return None
+    return json.dumps([node.get("$set"), node.get("$unset")], sort_keys=True)
+
+def _count_patches(node: Any, counts: Counter, first: Dict[str, Dict[str, Any]]) -> None:
+    if isinstance(node, dict):
+        key = _patch_key(node)
+        if key:
+            counts[key] += 1
+            first.setdefault(key, {name: node[name] for name in ("$set", "$unset") if name in node})
+        else:
+            for value in node.values():
+                _count_patches(value, counts, first)
+    elif isinstance(node, list):
+        for value in node:
+            _count_patches(value, counts, first)
+
+def _share_patches(node: Any, index: Dict[str, int]) -> Any:
+    if isinstance(node, dict):
+        key = _patch_key(node)
+        if key:
+            return {"$ref": node["$ref"], "$p": index[key]} if key in index else node
+        return {key: _share_patches(value, index) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_share_patches(value, index) for value in node]
+    return node
+
+def _count_texts(node: Any, counts: Counter) -> None:
+    if isinstance(node, str):
+        if len(node) >= MIN_SHARED_TEXT:
+            counts[node] += 1
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            if key not in ("$ref", "$unset"):
+                _count_texts(value, counts)
+    elif isinstance(node, list):
+        for value in node:
+            _count_texts(value, counts)
+
+def _share_texts(node: Any, index: Dict[str, int]) -> Any:
+    if isinstance(node, str):
+        return {"$t": index[node]} if node in index else node
+    if isinstance(node, dict):
+        return {key: value if key in ("$ref", "$unset") else _share_texts(value, index)
+                for key, value in node.items()}
+    if isinstance(node, list):
+        return [_share_texts(value, index) for value in node]
+    return node
+
+def resolve(store: Dict[str, Any], node: Any) -> Any:
+    """Plain JSON for any part of the store"""
+    if isinstance(node, list):
+        return [resolve(store, value) for value in node]
+    if not isinstance(node, dict):
+        return node
+    if "$t" in node:
+        return store["texts"][node["$t"]]
+    if "$ref" in node:
+        resolved = resolve(store, store["entities"][node["$ref"]])
+        patch = store["patches"][node["$p"]] if "$p" in node else node
+        resolved.update(resolve(store, patch.get("$set", {})))
+        for key in patch.get("$unset", []):
+            resolved.pop(key, None)
+        return resolved
+    return {key: resolve(store, value) for key, value in node.items()}
+
+def build_store(paths: List[str]) -> Dict[str, Any]:
+    """Ingest the data files into one store, checking every view reproduces its source"""
+    sources = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as file:
+            sources[os.path.basename(path)] = json.load(file)
+
+    builder = StoreBuilder()
+    for data in sources.values():
+        builder.collect(data)
+    builder.finish()
+
+    views = {name: builder.view(data) for name, data in sources.items()}
+    builder.link(sources.get("tier-system.json"))
+    app_names = {file_name: source for source, file_name in SOURCES}
+    organized = organize(builder, {app_names[name]: data for name, data in sources.items() if name in app_names})
+
+    body = {"entities": builder.entities, "views": views, "organized": organized}
+    patch_counts: Counter = Counter()
+    patches: Dict[str, Dict[str, Any]] = {}
+    _count_patches(body, patch_counts, patches)
+    shared = sorted(key for key, count in patch_counts.items() if count > 1)
+    body = _share_patches(body, {key: position for position, key in enumerate(shared)})
+    body["patches"] = [patches[key] for key in shared]
+
+    counts: Counter = Counter()
+    _count_texts(body, counts)
+    texts = sorted(text for text, count in counts.items() if count > 1)
+    index = {text: position for position, text in enumerate(texts)}
+    store = {"version": STORE_VERSION, "texts": texts, "links": builder.links}
+    store.update(_share_texts(body, index))
+
+    for name, data in sources.items():
+        if resolve(store, store["views"][name]) != data:
+            raise ValueError(f"View {name} does not reproduce its source")
+    return store
+
+def write_store(store: Dict[str, Any], path: str) -> int:
+    """Write the store compactly; returns its size in bytes"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(store, file, ensure_ascii=False, separators=(',', ':'))
+    os.replace(path + ".tmp", path)
+    return os.path.getsize(path)
+
+def write_views(store: Dict[str, Any], output_dir: str) -> List[str]:
+    """Regenerate every legacy file from the store"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for name, view in store["views"].items():
+        target = os.path.join(output_dir, name)
+        with open(target + ".tmp", 'w', encoding='utf-8') as file:
+            json.dump(resolve(store, view), file, indent=2, ensure_ascii=False)
+        os.replace(target + ".tmp", target)
+        written.append(target)
+    return written
+
+def build(paths: List[str], output_path: str) -> Dict[str, int]:
+    """Build and write the store, and report how it compares with the files it replaces"""
+    store = build_store(paths)
+    size = write_store(store, output_path)
+    with open(output_path, 'rb') as file:
+        store_gzip_bytes = len(gzip.compress(file.read()))
+
+    # Sources are measured minified and gzipped one by one, as a host would serve them
+    source_bytes = source_gzip_bytes = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as file:
+            minified = json.dumps(json.load(file), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        source_bytes += len(minified)
+        source_gzip_bytes += len(gzip.compress(minified))
+
+    organized_bytes = len(json.dumps(store["organized"], ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    kinds = Counter(ref.split("/", 1)[0] for ref in store["entities"])
+    stats = {"files": len(paths), "entities": len(store["entities"]), "texts": len(store["texts"]),
+             "patches": len(store["patches"]), "sourceBytes": source_bytes, "storeBytes": size,
+             "organizedBytes": organized_bytes, "sourceGzipBytes": source_gzip_bytes,
+             "storeGzipBytes": store_gzip_bytes}
+    print(f"{len(paths)} file(s) -> {output_path}: "
+          + ", ".join(f"{count} {kind}" for kind, count in sorted(kinds.items()))
+          + f", {len(store['texts'])} shared text(s), {len(store['patches'])} shared patch(es)")
+    print(f"{source_bytes:,} bytes of minified source JSON -> {size:,} bytes of store "
+          f"({organized_bytes:,} of them the organized sections)")
+    print(f"gzipped: {source_gzip_bytes:,} bytes across the sources -> {store_gzip_bytes:,} bytes of store")
+    return stats
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--views":
+        with open(sys.argv[2], 'r', encoding='utf-8') as file:
+            written = write_views(json.load(file), sys.argv[3])
+        print(f"Wrote {len(written)} view(s) to {sys.argv[3]}")
+    elif len(sys.argv) >= 3:
+        build(sys.argv[1:-1], sys.argv[-1])
+    else:
+        print("Usage: python content_store.py <file.json> [...] <content-store.json>\n"
+              "       python content_store.py --views <content-store.json> <output_dir>")
+        sys.exit(1)
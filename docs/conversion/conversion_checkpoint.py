@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Checkpoints for Resumable Conversion
+While a file converts, each enriched question is appended to
+<output>.checkpoint.jsonl and, every N rows, the log is flushed to disk and
+<output>.checkpoint.json records how many CSV rows and log bytes are
+committed. After a crash or kill, a resumed run truncates the log to the
+committed length, reloads those questions and skips the rows already done,
+so no row is enriched twice. Both files are removed once the output has
+been written.
+"""
+
+import json
+import os
+from typing import Dict, Any, Iterator, Optional
+
+from question_model import Question
+from streaming_output import encode_question
+
+DEFAULT_CHECKPOINT_ROWS = 1000
+
+def _base(output_file_path: str) -> str:
+    return output_file_path[:-5] if output_file_path.endswith('.json') else output_file_path
+
+def checkpoint_path_for(output_file_path: str) -> str:
+    """Return the checkpoint state path that sits next to a converted JSON file"""
+    return f"{_base(output_file_path)}.checkpoint.json"
+
+def source_fingerprint(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtimeNs": stat.st_mtime_ns}
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON through a temp file and rename, so readers never see a partial file"""
+    with open(path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(path + ".tmp", path)
+
+class RowCheckpoint:
+    """Durable progress log for one CSV -> JSON conversion"""
+
+    def __init__(self, output_file_path: str, source_path: str, every: int = DEFAULT_CHECKPOINT_ROWS):
+        self.state_path = checkpoint_path_for(output_file_path)
+        self.log_path = f"{_base(output_file_path)}.checkpoint.jsonl"
+        self.source_path = source_path
+        self.every = max(1, every)
+        self.rows_committed = 0
+        self._log = None
+
+    def restore(self, tier: Optional[str] = None) -> Iterator[Question]:
+        """
+        Yield the committed questions of an interrupted run, then reopen the
+        log for appending; rows_committed says how many CSV rows to skip.
+        Starts fresh when there is no usable checkpoint for this source.
+        """
+        state = None
+        if os.path.exists(self.state_path) and os.path.exists(self.log_path):
+            with open(self.state_path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+            if state.get("source") != source_fingerprint(self.source_path):
+                print(f"{self.source_path} changed since the checkpoint; starting over")
+                state = None
+
+        if not state:
+            self.start()
+            return
+
+        # Anything past the committed length was written after the last commit
+        with open(self.log_path, 'r+b') as log:
+            log.truncate(state["logBytes"])
+        with open(self.log_path, 'r', encoding='utf-8') as log:
+            for line in log:
+                yield Question.from_dict(json.loads(line), tier)
+
+        self.rows_committed = state["rowsCommitted"]
+        self._log = open(self.log_path, 'a', encoding='utf-8')
+        print(f"Resuming {self.source_path} after row {self.rows_committed:,}")
+
+    def start(self) -> None:
+        """Begin a new checkpoint, discarding any earlier one"""
+        self._log = open(self.log_path, 'w', encoding='utf-8')
+        self.rows_committed = 0
+        self.commit(0)
+
+    def record(self, question: Question) -> None:
+        self._log.write(encode_question(question) + '\n')
+
+    def maybe_commit(self, rows_done: int) -> None:
+        if rows_done - self.rows_committed >= self.every:
+            self.commit(rows_done)
+
+    def commit(self, rows_done: int) -> None:
+        """Make every recorded question durable and mark rows_done CSV rows as finished"""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        write_json_atomic(self.state_path, {
+            "source": source_fingerprint(self.source_path),
+            "rowsCommitted": rows_done,
+            "logBytes": self._log.tell()
+        })
+        self.rows_committed = rows_done
+
+    def close(self) -> None:
+        """Close the log but keep the checkpoint so the run can be resumed"""
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def finish(self) -> None:
+        """Remove the checkpoint after the output has been written"""
+        self.close()
+        for path in (self.state_path, self.log_path):
+            if os.path.exists(path):
+                os.remove(path)
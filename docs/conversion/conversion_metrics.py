@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Conversion Metrics for the CSV to JSON Conversion Tool
+Collects wall time and call counts per pipeline stage and per regex pattern,
+optionally tracemalloc peak memory per stage, and writes them as a
+machine-readable JSON file next to the converted output.
+"""
+
+import json
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, List
+
+SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2, "G": 1024 ** 3, "GB": 1024 ** 3}
+
+def parse_size(value: str) -> int:
+    """Parse a memory size such as '512MB', '2G' or '1048576' into bytes"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*', str(value).upper())
+    if not match:
+        raise ValueError(f"Invalid memory size: {value}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+def format_size(num_bytes: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+def metrics_path_for(output_file_path: str) -> str:
+    """Return the metrics file path that sits next to a converted JSON file"""
+    base = output_file_path[:-5] if output_file_path.endswith('.json') else output_file_path
+    return f"{base}.metrics.json"
+
+class ConversionMetrics:
+    """
+    Accumulates inclusive wall time and call counts per named stage
+
+    With track_memory=True, tracemalloc must be running; each stage also
+    records the peak traced memory reached while it was active. Nested
+    stages propagate their peaks to the enclosing stage.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.patterns: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.track_memory = track_memory and tracemalloc.is_tracing()
+        self.peak_memory = 0
+        self._peaks: List[int] = []
+        self._started = time.perf_counter()
+
+    def _add(self, table: Dict[str, Dict[str, float]], name: str, seconds: float) -> Dict[str, float]:
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = {"seconds": 0.0, "calls": 0}
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+        return entry
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.track_memory:
+            self._enter_memory_stage()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self._add(self.stages, name, time.perf_counter() - started)
+            if self.track_memory:
+                peak = self._exit_memory_stage()
+                entry["peakMemoryBytes"] = max(entry.get("peakMemoryBytes", 0), peak)
+
+    def _enter_memory_stage(self) -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peak_memory = max(self.peak_memory, peak)
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        self._peaks.append(0)
+        tracemalloc.reset_peak()
+
+    def _exit_memory_stage(self) -> int:
+        peak = max(tracemalloc.get_traced_memory()[1], self._peaks.pop())
+        self.peak_memory = max(self.peak_memory, peak)
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        return peak
+
+    def current_memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+
+    def regex(self, pattern: str, func, *args):
+        """Run a re function for pattern, timing it and counting matches"""
+        started = time.perf_counter()
+        result = func(pattern, *args)
+        entry = self._add(self.patterns, pattern, time.perf_counter() - started)
+        entry["matches"] = entry.get("matches", 0) + (1 if result else 0)
+        return result
+
+    def iter_stage(self, name: str, iterable: Iterable) -> Iterator:
+        """Time each step of an iterator (e.g. CSV row parsing) as a stage"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._add(self.stages, name, time.perf_counter() - started)
+                return
+            self._add(self.stages, name, time.perf_counter() - started)
+            yield item
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self, **extra: Any) -> Dict[str, Any]:
+        def rounded(table):
+            return {
+                name: {key: round(value, 6) if isinstance(value, float) else value
+                       for key, value in entry.items()}
+                for name, entry in sorted(table.items(), key=lambda item: -item[1]["seconds"])
+            }
+
+        data = {
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "totalSeconds": round(time.perf_counter() - self._started, 6),
+        }
+        if self.track_memory:
+            self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+            data["peakMemoryBytes"] = self.peak_memory
+        data.update(extra)
+        data["counters"] = dict(self.counters)
+        data["stages"] = rounded(self.stages)
+        data["regexPatterns"] = rounded(self.patterns)
+        return data
+
+    def write(self, path: str, **extra: Any) -> Dict[str, Any]:
+        data = self.to_dict(**extra)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+        return data
@@ -8,21 +8,52 @@ import csv
 import json
 import re
 import os
+import tracemalloc
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 
-def clean_text(text: str) -> str:
-    """Clean and format text content"""
-    if not text:
-        return ""
-
-    # Remove extra whitespace and normalize line breaks
-    text = re.sub(r'\s+', ' ', text.strip())
+from conversion_checkpoint import (DEFAULT_CHECKPOINT_ROWS, RowCheckpoint, checkpoint_path_for,
+                                   source_fingerprint, write_json_atomic)
+from conversion_metrics import ConversionMetrics, format_size, metrics_path_for
+from question_model import Question
+from row_watchdog import DEFAULT_ROW_BUDGET, RowTimeout, RowWatchdog, slow_rows_path_for
+from rule_engine import load_rules
+from text_normalization import NORMALIZER
+from streaming_output import QuestionBuffer, write_question_file
+
+# Records which files an interrupted batch finished, for --resume
+BATCH_STATE_FILE = ".batch-checkpoint.json"
+
+# Source CSV -> output JSON -> title prefix for each question tier
+FILE_MAPPINGS = [
+    ("top_10_react_interview_questions.csv", "top-10-questions.json", "Top 10"),
+    ("top_20_react_interview_questions.csv", "top-20-questions.json", "Top 20"),
+    ("top_50_react_interview_questions.csv", "top-50-questions.json", "Top 50"),
+    ("top_100_react_interview_questions.csv", "top-100-questions.json", "Top 100"),
+]
+
+# Metrics for the conversion currently being profiled (None when not profiling)
+_metrics: Optional[ConversionMetrics] = None
+
+# Keyword rules from enrichment_rules.json, compiled once
+RULES = load_rules()
+
+# Fraction of --max-memory at which buffered questions are spilled to disk
+SPILL_FRACTION = 0.75
+
+def _stage(name: str):
+    """Time a block as a named stage when profiling is enabled"""
+    return _metrics.stage(name) if _metrics else nullcontext()
+
+def _regex(func, pattern: str, text: str):
+    """Run a re function, recording per-pattern timings when profiling"""
+    if _metrics:
+        return _metrics.regex(pattern, func, text)
+    return func(pattern, text)
 
-    # Fix common encoding issues
-    text = text.replace('\"', '"')
-    text = text.replace('\n', '\n')
-
-    return text
+def clean_text(text: str) -> str:
+    """Clean and format text content (memoized per distinct string)"""
+    return NORMALIZER.clean(text)
 
 def extract_code_example(answer: str) -> Optional[Dict[str, str]]:
     """Extract code examples from answer text"""
@@ -35,7 +66,7 @@ def extract_code_example(answer: str) -> Optional[Dict[str, str]]:
     ]
 
     for pattern in code_patterns:
-        match = re.search(pattern, answer)
+        match = _regex(re.search, pattern, answer)
         if match:
             code = match.group(1).strip()
             if len(code) > 10 and ('{' in code or '<' in code or 'function' in code):
@@ -59,230 +90,402 @@ def generate_key_points(answer: str, question: str) -> List[str]:
     ]
 
     for pattern in bullet_patterns:
-        matches = re.findall(pattern, answer)
+        matches = _regex(re.findall, pattern, answer)
         if matches:
             key_points.extend([clean_text(match) for match in matches[:4]])
             break
 
-    # If no bullet points found, extract key phrases
-    if not key_points:
-        if 'Virtual DOM' in answer:
-            key_points.append("Virtual DOM for performance")
-        if 'component' in answer.lower():
-            key_points.append("Component-based architecture")
-        if 'state' in answer.lower():
-            key_points.append("State management")
-        if 'hook' in answer.lower():
-            key_points.append("React Hooks")
-        if 'prop' in answer.lower():
-            key_points.append("Props and data flow")
-
-    # Ensure we have at least 2-3 key points
-    if len(key_points) < 2:
-        if 'performance' in answer.lower():
-            key_points.append("Performance optimization")
-        if 'render' in answer.lower():
-            key_points.append("Efficient rendering")
-        if not key_points:
-            # Fallback key points based on question
-            if 'what is' in question.lower():
-                key_points.append("Core concept understanding")
-            if 'how' in question.lower():
-                key_points.append("Implementation knowledge")
-
-    return key_points[:4]  # Limit to 4 key points
+    # Complete with keyword rules (single pass over the answer)
+    return RULES.key_points(answer, question, key_points)
 
 def generate_follow_up_questions(question: str, category: str, difficulty: str) -> List[str]:
     """Generate relevant follow-up questions"""
-    follow_ups = []
-
-    # Category-based follow-ups
-    category_questions = {
-        'React Fundamentals': [
-            "How does React differ from vanilla JavaScript?",
-            "What are the benefits of using React?",
-            "When would you choose React over other frameworks?"
-        ],
-        'React Hooks': [
-            "What are the rules of hooks?",
-            "How do custom hooks work?",
-            "When should you use useCallback vs useMemo?"
-        ],
-        'State Management': [
-            "What are the different ways to manage state in React?",
-            "When should you lift state up?",
-            "How do you avoid prop drilling?"
-        ],
-        'Performance': [
-            "How do you measure React performance?",
-            "What causes unnecessary re-renders?",
-            "How do you optimize large lists?"
-        ],
-        'Forms': [
-            "How do you handle form validation?",
-            "What's the difference between controlled and uncontrolled components?",
-            "How do you handle file uploads?"
-        ]
-    }
-
-    # Get category-specific questions
-    if category in category_questions:
-        follow_ups.extend(category_questions[category][:2])
-
-    # Difficulty-based questions
-    if difficulty == 'Beginner':
-        follow_ups.append("Can you provide a simple example?")
-    elif difficulty == 'Advanced':
-        follow_ups.append("How would you implement this in a production app?")
-
-    # Question-specific follow-ups
-    if 'useEffect' in question:
-        follow_ups.append("How do you clean up effects?")
-    elif 'Virtual DOM' in question:
-        follow_ups.append("How does reconciliation work?")
-    elif 'component' in question.lower():
-        follow_ups.append("What are the lifecycle methods?")
-
-    return follow_ups[:3]  # Limit to 3 follow-up questions
-
-def convert_csv_to_json(csv_file_path: str, output_file_path: str, title_prefix: str = "") -> None:
+    return RULES.follow_ups(question, category, difficulty)
+
+def convert_csv_to_json(csv_file_path: str, output_file_path: str, title_prefix: str = "",
+                        profile: bool = False, cprofile: bool = False,
+                        track_memory: bool = False, max_memory: Optional[int] = None,
+                        row_budget: Optional[float] = DEFAULT_ROW_BUDGET,
+                        checkpoint_every: Optional[int] = None, resume: bool = False,
+                        sort: bool = False, split_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Convert CSV file to JSON format matching your repository structure
+
+    The output is written to a temporary file and renamed into place. With
+    checkpoint_every, progress is committed every that many rows; resume
+    continues an interrupted run from its last commit instead of row one.
+
+    sort writes questions in rank order (question id breaking ties) however
+    the CSV rows are ordered. Together with max_memory the ordering becomes
+    an external merge sort, so inputs larger than the budget can be sorted.
+    split_dir also writes the tier as a summary index plus detail blocks
+    (see summary_split) into that directory while the output streams out.
+
+    Each row's enrichment must finish within row_budget seconds (None or 0
+    disables the watchdog); rows that overrun are written unenriched and
+    listed in <output>.slow-rows.json.
+
+    With profile=True, per-stage and per-regex timings are written to a
+    <output>.metrics.json file; with cprofile=True a cProfile dump is
+    written to <output>.prof for inspection with pstats or snakeviz.
+    track_memory adds tracemalloc peak memory per stage and per file.
+    max_memory (bytes) implies track_memory and spills converted questions
+    to disk once traced memory nears the budget, so the file is written
+    in streaming mode instead of being held in RAM.
     """
-    questions = []
+    global _metrics
+
+    track_memory = track_memory or bool(max_memory)
+    started_tracing = track_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    metrics = ConversionMetrics(track_memory) if profile or track_memory else None
+    profiler = None
+    if cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+    _metrics = metrics
 
     try:
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
+        if profiler:
+            profiler.enable()
+        question_count = _convert_file(csv_file_path, output_file_path, title_prefix, max_memory, row_budget,
+                                       checkpoint_every, resume, sort, split_dir)
+    finally:
+        if profiler:
+            profiler.disable()
+        _metrics = None
+
+    if profiler:
+        prof_path = os.path.splitext(output_file_path)[0] + '.prof'
+        profiler.dump_stats(prof_path)
+        print(f"cProfile dump written to {prof_path}")
+
+    if metrics:
+        metrics_path = metrics_path_for(output_file_path)
+        data = metrics.write(metrics_path, source=csv_file_path, output=output_file_path,
+                             questions=question_count, maxMemoryBytes=max_memory,
+                             normalizationCache=NORMALIZER.stats())
+        if started_tracing:
+            tracemalloc.stop()
+
+        print(f"Metrics written to {metrics_path}")
+        for name, entry in list(data["stages"].items())[:5]:
+            line = f"   {name}: {entry['seconds'] * 1000:.1f} ms over {entry['calls']} calls"
+            if "peakMemoryBytes" in entry:
+                line += f", peak {format_size(entry['peakMemoryBytes'])}"
+            print(line)
+        if "peakMemoryBytes" in data:
+            print(f"Peak memory: {format_size(data['peakMemoryBytes'])}")
+            if max_memory and data["peakMemoryBytes"] > max_memory:
+                print(f"Warning: peak memory exceeded the {format_size(max_memory)} budget")
+        return data
+
+    return None
+
+def _convert_file(csv_file_path: str, output_file_path: str, title_prefix: str = "",
+                  max_memory: Optional[int] = None, row_budget: Optional[float] = DEFAULT_ROW_BUDGET,
+                  checkpoint_every: Optional[int] = None, resume: bool = False, sort: bool = False,
+                  split_dir: Optional[str] = None) -> int:
+    """Convert one CSV file and return the number of questions written"""
+    questions = QuestionBuffer(spill_dir=os.path.dirname(output_file_path) or None, sort=sort)
+    watchdog = RowWatchdog(row_budget)
+    checkpoint = None
+    if checkpoint_every or resume:
+        checkpoint = RowCheckpoint(output_file_path, csv_file_path, checkpoint_every or DEFAULT_CHECKPOINT_ROWS)
+
+    def spill_if_needed() -> None:
+        # Switch to the streaming path before the budget is exceeded
+        if (max_memory and not questions.spilled
+                and _metrics.current_memory() >= max_memory * SPILL_FRACTION):
+            with _stage("spill"):
+                spill_path = questions.spill()
+            _metrics.count("spilled_at_row", len(questions))
+            if sort:
+                print(f"Memory budget nearly reached; sorting in runs of {len(questions):,} questions")
+            else:
+                print(f"Memory budget nearly reached; spilling questions to {spill_path}")
+
+    try:
+        if checkpoint and resume:
+            for question_obj in checkpoint.restore(title_prefix or None):
+                questions.append(question_obj)
+                spill_if_needed()
+        elif checkpoint:
+            checkpoint.start()
+
+        with open(csv_file_path, 'r', encoding='utf-8') as file, watchdog:
             reader = csv.DictReader(file)
+            rows = _metrics.iter_stage("csv_parse", reader) if _metrics else reader
+            rows_done = checkpoint.rows_committed if checkpoint else 0
+
+            for row_number, row in enumerate(rows, 1):
+                # Rows up to the last commit were already converted by the interrupted run
+                if row_number <= rows_done:
+                    continue
+                if checkpoint:
+                    checkpoint.maybe_commit(row_number - 1)
 
-            for row in reader:
                 try:
                     # Extract basic fields
                     rank = row.get('rank', '1')
-                    question_text = clean_text(row.get('question', ''))
-                    answer_text = clean_text(row.get('answer', ''))
+                    with _stage("clean_text"):
+                        question_text = clean_text(row.get('question', ''))
+                        answer_text = clean_text(row.get('answer', ''))
                     difficulty = row.get('difficulty', 'Intermediate').strip()
                     category = row.get('category', 'React Fundamentals').strip()
 
                     if not question_text or not answer_text:
                         print(f"Skipping row with missing data: {rank}")
+                        if _metrics:
+                            _metrics.count("rows_skipped")
                         continue
 
                     # Generate unique ID
                     question_id = f"q{rank}"
 
                     # Create question object
-                    question_obj = {
-                        "id": question_id,
-                        "question": question_text,
-                        "difficulty": difficulty,
-                        "category": category,
-                        "answer": answer_text
-                    }
-
-                    # Extract code example if present
-                    code_example = extract_code_example(answer_text)
-                    if code_example:
-                        question_obj["codeExample"] = code_example
-
-                    # Generate key points
-                    key_points = generate_key_points(answer_text, question_text)
-                    if key_points:
-                        question_obj["keyPoints"] = key_points
-
-                    # Generate follow-up questions
-                    follow_ups = generate_follow_up_questions(question_text, category, difficulty)
-                    if follow_ups:
-                        question_obj["followUpQuestions"] = follow_ups
+                    question_obj = Question(question_id, question_text, difficulty, category, answer_text,
+                                            tier=title_prefix or None,
+                                            rank=int(rank) if str(rank).isdigit() else None)
+
+                    try:
+                        with watchdog.guard(question_id):
+                            # Extract code example if present
+                            with _stage("extract_code_example"):
+                                question_obj.code_example = extract_code_example(answer_text)
+
+                            # Generate key points
+                            with _stage("generate_key_points"):
+                                question_obj.key_points = generate_key_points(answer_text, question_text)
+
+                            # Generate follow-up questions
+                            with _stage("generate_follow_up_questions"):
+                                question_obj.follow_up_questions = generate_follow_up_questions(
+                                    question_text, category, difficulty)
+                    except RowTimeout:
+                        # Keep the row, without enrichment, rather than stall the build
+                        print(f"Row {rank} exceeded the {watchdog.budget}s budget; writing it unenriched")
+                        question_obj.code_example = None
+                        question_obj.key_points = None
+                        question_obj.follow_up_questions = None
+                        if _metrics:
+                            _metrics.count("rows_timed_out")
 
                     questions.append(question_obj)
+                    if checkpoint:
+                        checkpoint.record(question_obj)
+                    spill_if_needed()
 
                 except Exception as e:
                     print(f"Error processing row {rank}: {str(e)}")
+                    if _metrics:
+                        _metrics.count("rows_failed")
                     continue
 
         # Determine title based on number of questions
         if not title_prefix:
             title_prefix = f"Top {len(questions)}"
 
-        # Create final JSON structure
-        output_data = {
+        # Create final JSON structure (questions are streamed in after the header)
+        output_header = {
             "title": f"{title_prefix} React Interview Questions",
             "description": "Master the most frequently asked React interview questions with detailed explanations and examples",
             "lastUpdated": "2025-09-25",
             "totalQuestions": len(questions),
-            "categories": list(set(q["category"] for q in questions)),
-            "difficulties": list(set(q["difficulty"] for q in questions)),
-            "questions": questions
+            "categories": list(questions.category_counts),
+            "difficulties": list(questions.difficulty_counts)
         }
 
-        # Write to JSON file
-        with open(output_file_path, 'w', encoding='utf-8') as file:
-            json.dump(output_data, file, indent=2, ensure_ascii=False)
+        splitter = None
+        if split_dir:
+            from summary_split import TierSplitter
+            os.makedirs(split_dir, exist_ok=True)
+            splitter = TierSplitter(split_dir, os.path.basename(output_file_path), output_header)
+
+        def question_dicts():
+            for question in questions:
+                data = question.to_dict()
+                if splitter:
+                    splitter.add(data)
+                yield data
+
+        # Write to a temporary file and rename, so an interrupted write never replaces good output
+        with _stage("json_write"):
+            temp_path = output_file_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                write_question_file(file, output_header, question_dicts())
+            os.replace(temp_path, output_file_path)
+            if splitter:
+                split = splitter.finish()
+        if checkpoint:
+            checkpoint.finish()
 
         print(f"Successfully converted {len(questions)} questions to {output_file_path}")
+        if splitter:
+            print(f"Summary index {split['summary']} ({split['bytes']:,} bytes) + {split['blocks']} detail block(s)")
 
-        # Print summary
-        categories = {}
-        difficulties = {}
-        for q in questions:
-            categories[q["category"]] = categories.get(q["category"], 0) + 1
-            difficulties[q["difficulty"]] = difficulties.get(q["difficulty"], 0) + 1
+        if watchdog.slow_rows:
+            report_path = slow_rows_path_for(output_file_path)
+            watchdog.write_report(report_path, csv_file_path)
+            print(f"{len(watchdog.slow_rows)} slow row(s) listed in {report_path}")
 
-        print(f"Categories: {dict(categories)}")
-        print(f"Difficulties: {dict(difficulties)}")
+        # Print summary
+        print(f"Categories: {dict(questions.category_counts)}")
+        print(f"Difficulties: {dict(questions.difficulty_counts)}")
 
     except FileNotFoundError:
         print(f"Error: File {csv_file_path} not found")
     except Exception as e:
         print(f"Error converting {csv_file_path}: {str(e)}")
-
-def batch_convert_files(input_dir: str = ".", output_dir: str = "json_output") -> None:
+    finally:
+        questions.close()
+        if checkpoint:
+            checkpoint.close()
+
+    return len(questions)
+
+def batch_convert_files(input_dir: str = ".", output_dir: str = "json_output",
+                        profile: bool = False, cprofile: bool = False,
+                        track_memory: bool = False, max_memory: Optional[int] = None,
+                        row_budget: Optional[float] = DEFAULT_ROW_BUDGET,
+                        sqlite_path: Optional[str] = None,
+                        checkpoint_every: Optional[int] = DEFAULT_CHECKPOINT_ROWS, resume: bool = False,
+                        sort: bool = False, split: bool = True) -> None:
     """
-    Convert all CSV files in the input directory
+    Convert all CSV files in the input directory, optionally compiling the
+    results into a SQLite database as well
+
+    With split, each tier also gets a summary index and detail blocks next
+    to it for list views that load answers on demand.
+
+    Progress is checkpointed every checkpoint_every rows. With resume, files
+    a previous interrupted batch finished (and whose CSV is unchanged) are
+    skipped and a partly converted file continues from its last checkpoint.
     """
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    # Define file mappings
-    file_mappings = [
-        ("top_10_react_interview_questions.csv", "top-10-questions.json", "Top 10"),
-        ("top_20_react_interview_questions.csv", "top-20-questions.json", "Top 20"),
-        ("top_50_react_interview_questions.csv", "top-50-questions.json", "Top 50"),
-        ("top_100_react_interview_questions.csv", "top-100-questions.json", "Top 100"),
-    ]
-
     converted_files = []
+    peak_memory = {}
+    incomplete = []
 
-    for csv_file, json_file, title_prefix in file_mappings:
+    state_path = os.path.join(output_dir, BATCH_STATE_FILE)
+    completed = {}
+    if resume and os.path.exists(state_path):
+        with open(state_path, 'r', encoding='utf-8') as file:
+            completed = json.load(file)
+
+    for csv_file, json_file, title_prefix in FILE_MAPPINGS:
         csv_path = os.path.join(input_dir, csv_file)
         json_path = os.path.join(output_dir, json_file)
 
         if os.path.exists(csv_path):
+            fingerprint = source_fingerprint(csv_path)
+            if resume and completed.get(json_file) == fingerprint and os.path.exists(json_path):
+                print(f"\nSkipping {csv_file}: converted by the interrupted batch")
+                converted_files.append(json_file)
+                continue
+
             print(f"\nConverting {csv_file}...")
-            convert_csv_to_json(csv_path, json_path, title_prefix)
+            metrics = convert_csv_to_json(csv_path, json_path, title_prefix, profile=profile, cprofile=cprofile,
+                                          track_memory=track_memory, max_memory=max_memory,
+                                          row_budget=row_budget, checkpoint_every=checkpoint_every,
+                                          resume=resume, sort=sort, split_dir=output_dir if split else None)
             converted_files.append(json_file)
+            if metrics and "peakMemoryBytes" in metrics:
+                peak_memory[json_file] = metrics["peakMemoryBytes"]
+
+            # A checkpoint left behind means the file did not finish
+            if os.path.exists(checkpoint_path_for(json_path)):
+                incomplete.append(json_file)
+            elif checkpoint_every:
+                completed[json_file] = fingerprint
+                write_json_atomic(state_path, completed)
         else:
             print(f"File not found: {csv_path}")
 
     print(f"\nConversion complete! Generated files:")
     for file in converted_files:
-        print(f"   - {file}")
+        if file in peak_memory:
+            print(f"   - {file} (peak memory {format_size(peak_memory[file])})")
+        else:
+            print(f"   - {file}")
+
+    if incomplete:
+        print(f"Not finished: {', '.join(incomplete)}; rerun with --resume to continue")
+    elif os.path.exists(state_path):
+        os.remove(state_path)
+
+    if sqlite_path and converted_files:
+        from sqlite_export import build_from_output_dir
+        build_from_output_dir(output_dir, sqlite_path)
 
     return converted_files
 
 if __name__ == "__main__":
     import sys
 
+    # Optional flags: --profile (metrics JSON), --cprofile (cProfile dump),
+    # --memory (tracemalloc peaks), --max-memory SIZE (spill past budget)
+    # --row-budget SECONDS (per-row enrichment time limit, 0 disables)
+    # --sqlite PATH (also build a SQLite database, batch mode only),
+    # --checkpoint-every ROWS and --resume (continue an interrupted run),
+    # --sort (write questions in rank order; external sort with --max-memory),
+    # --split DIR (summary index + detail blocks; batch mode writes them unless --no-split)
+    profile = "--profile" in sys.argv
+    cprofile = "--cprofile" in sys.argv
+    track_memory = "--memory" in sys.argv
+    max_memory = None
+    if "--max-memory" in sys.argv:
+        from conversion_metrics import parse_size
+        index = sys.argv.index("--max-memory")
+        max_memory = parse_size(sys.argv[index + 1])
+        del sys.argv[index:index + 2]
+    row_budget = DEFAULT_ROW_BUDGET
+    if "--row-budget" in sys.argv:
+        index = sys.argv.index("--row-budget")
+        row_budget = float(sys.argv[index + 1])
+        del sys.argv[index:index + 2]
+    sqlite_path = None
+    if "--sqlite" in sys.argv:
+        index = sys.argv.index("--sqlite")
+        sqlite_path = sys.argv[index + 1]
+        del sys.argv[index:index + 2]
+    checkpoint_every = None
+    if "--checkpoint-every" in sys.argv:
+        index = sys.argv.index("--checkpoint-every")
+        checkpoint_every = int(sys.argv[index + 1])
+        del sys.argv[index:index + 2]
+    resume = "--resume" in sys.argv
+    sort = "--sort" in sys.argv
+    split = "--no-split" not in sys.argv
+    split_dir = None
+    if "--split" in sys.argv:
+        index = sys.argv.index("--split")
+        split_dir = sys.argv[index + 1]
+        del sys.argv[index:index + 2]
+    sys.argv = [arg for arg in sys.argv
+                if arg not in ("--profile", "--cprofile", "--memory", "--resume", "--sort", "--no-split")]
+    options = dict(profile=profile, cprofile=cprofile, track_memory=track_memory, max_memory=max_memory,
+                   row_budget=row_budget, checkpoint_every=checkpoint_every, resume=resume, sort=sort)
+
     if len(sys.argv) > 1:
         if sys.argv[1] == "batch":
             # Batch convert all files
-            batch_convert_files()
+            if checkpoint_every is None:
+                options["checkpoint_every"] = DEFAULT_CHECKPOINT_ROWS
+            batch_convert_files(sqlite_path=sqlite_path, split=split, **options)
+        elif sys.argv[1] == "watch":
+            # Rebuild changed files and notify open pages
+            from watch_conversion import watch
+            watch()
         else:
             # Convert single file
             input_file = sys.argv[1]
             output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.csv', '.json')
-            convert_csv_to_json(input_file, output_file)
+            convert_csv_to_json(input_file, output_file, split_dir=split_dir, **options)
     else:
         # Interactive mode
         print("React Interview Questions CSV to JSON Converter")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+JSON Patch Deltas Between Data Releases
+Diffs two versions of a question file by question ID and emits an RFC 6902
+JSON Patch: header fields and individual question fields are replaced in
+place, deleted questions are removed, new ones added and reordered ones
+moved. apply_patch() is a standalone RFC 6902 applier used to verify every
+delta round-trips before it is published.
+"""
+
+import copy
+import json
+import sys
+from typing import List, Dict, Any
+
+class PatchError(Exception):
+    """Raised when a patch cannot be applied to a document"""
+
+def escape_pointer(token: Any) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+def _diff_fields(old: Dict[str, Any], new: Dict[str, Any], prefix: str) -> List[Dict[str, Any]]:
+    ops = [{"op": "remove", "path": f"{prefix}/{escape_pointer(key)}"} for key in old if key not in new]
+    for key, value in new.items():
+        if key not in old:
+            ops.append({"op": "add", "path": f"{prefix}/{escape_pointer(key)}", "value": value})
+        elif old[key] != value:
+            ops.append({"op": "replace", "path": f"{prefix}/{escape_pointer(key)}", "value": value})
+    return ops
+
+def diff_questions(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Patch operations turning the old questions array into the new one, matched by id"""
+    old_ids = [question.get("id") for question in old]
+    new_ids = [question.get("id") for question in new]
+    if None in old_ids or None in new_ids or len(set(old_ids)) != len(old_ids) or len(set(new_ids)) != len(new_ids):
+        return [] if old == new else [{"op": "replace", "path": "/questions", "value": new}]
+
+    keep = set(new_ids)
+    ops = [{"op": "remove", "path": f"/questions/{index}"}
+           for index in range(len(old) - 1, -1, -1) if old_ids[index] not in keep]
+    current = [question for question in old if question["id"] in keep]
+    current_ids = [question["id"] for question in current]
+
+    for index, question in enumerate(new):
+        if index >= len(current) or current_ids[index] != question["id"]:
+            try:
+                source = current_ids.index(question["id"], index)
+            except ValueError:
+                ops.append({"op": "add", "path": f"/questions/{index}", "value": question})
+                current.insert(index, question)
+                current_ids.insert(index, question["id"])
+                continue
+            ops.append({"op": "move", "from": f"/questions/{source}", "path": f"/questions/{index}"})
+            current.insert(index, current.pop(source))
+            current_ids.insert(index, current_ids.pop(source))
+
+        ops.extend(_diff_fields(current[index], question, f"/questions/{index}"))
+
+    return ops
+
+def diff_documents(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """RFC 6902 patch from one version of a question file to the next"""
+    old_header = {key: value for key, value in old.items() if key != "questions"}
+    new_header = {key: value for key, value in new.items() if key != "questions"}
+    ops = _diff_fields(old_header, new_header, "")
+
+    if "questions" in old and "questions" in new:
+        ops.extend(diff_questions(old["questions"], new["questions"]))
+    elif "questions" in new:
+        ops.append({"op": "add", "path": "/questions", "value": new["questions"]})
+    elif "questions" in old:
+        ops.append({"op": "remove", "path": "/questions"})
+    return ops
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith('/'):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+def _array_index(container: list, token: str, allow_end: bool) -> int:
+    if token == '-' and allow_end:
+        return len(container)
+    if not token.isdigit() or (token != '0' and token.startswith('0')):
+        raise PatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchError(f"Array index out of range: {index}")
+    return index
+
+def _walk(document: Any, tokens: List[str]) -> Any:
+    target = document
+    for token in tokens:
+        try:
+            target = target[_array_index(target, token, False)] if isinstance(target, list) else target[token]
+        except (KeyError, TypeError):
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+    return target
+
+def _get(document: Any, pointer: str) -> Any:
+    return _walk(document, _parse_pointer(pointer))
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    parent = _walk(document, tokens[:-1])
+    if isinstance(parent, list):
+        parent.insert(_array_index(parent, tokens[-1], True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise PatchError(f"Cannot add to a scalar at {pointer}")
+    return document
+
+def _remove(document: Any, pointer: str) -> Any:
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        raise PatchError("Cannot remove the whole document")
+    parent = _walk(document, tokens[:-1])
+    try:
+        if isinstance(parent, list):
+            return parent.pop(_array_index(parent, tokens[-1], False))
+        return parent.pop(tokens[-1])
+    except (KeyError, AttributeError):
+        raise PatchError(f"Path not found: {pointer}")
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """Apply an RFC 6902 patch to a copy of document and return the result"""
+    document = copy.deepcopy(document)
+    for op in patch:
+        kind, path = op.get("op"), op.get("path")
+        if path is None:
+            raise PatchError(f"Operation without a path: {op}")
+
+        if kind == "add":
+            document = _add(document, path, copy.deepcopy(op["value"]))
+        elif kind == "remove":
+            _remove(document, path)
+        elif kind == "replace":
+            if _parse_pointer(path):
+                _remove(document, path)
+            document = _add(document, path, copy.deepcopy(op["value"]))
+        elif kind == "move":
+            if path.startswith(op["from"] + '/'):
+                raise PatchError(f"Cannot move {op['from']} into its own child {path}")
+            document = _add(document, path, _remove(document, op["from"]))
+        elif kind == "copy":
+            document = _add(document, path, copy.deepcopy(_get(document, op["from"])))
+        elif kind == "test":
+            if _get(document, path) != op["value"]:
+                raise PatchError(f"Test failed at {path}")
+        else:
+            raise PatchError(f"Unknown operation: {kind!r}")
+    return document
+
+def write_delta(old_path: str, new_path: str, patch_path: str) -> Dict[str, int]:
+    """Diff two files, verify the patch round-trips and write it"""
+    with open(old_path, 'r', encoding='utf-8') as file:
+        old = json.load(file)
+    with open(new_path, 'r', encoding='utf-8') as file:
+        new = json.load(file)
+
+    patch = diff_documents(old, new)
+    if apply_patch(old, patch) != new:
+        raise PatchError(f"Patch from {old_path} to {new_path} does not round-trip")
+
+    body = json.dumps(patch, ensure_ascii=False, separators=(',', ':'))
+    with open(patch_path, 'w', encoding='utf-8') as file:
+        file.write(body)
+    return {"operations": len(patch), "size": len(body.encode('utf-8'))}
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Usage: python data_deltas.py <old.json> <new.json> <output.patch.json>")
+        sys.exit(1)
+
+    result = write_delta(sys.argv[1], sys.argv[2], sys.argv[3])
+    print(f"{result['operations']} operation(s), {result['size']:,} bytes -> {sys.argv[3]}")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+External Merge Sort under a Memory Budget
+Items are collected in memory until a run fills up, then sorted and written
+to a temporary file as one run; iteration k-way merges every run (and the
+unsorted remainder, sorted last) with a heap. Only one item per run is held
+while merging, so inputs far larger than RAM come out fully ordered.
+
+Used by QuestionBuffer to write tiers in rank order, and on its own to order
+a merged CSV import before conversion:
+
+    python external_sort.py merged.csv sorted.csv [rows_per_run]
+"""
+
+import csv
+import heapq
+import json
+import os
+import sys
+import tempfile
+from typing import List, Any, Callable, Dict, Iterator, Optional, Tuple
+
+DEFAULT_RUN_SIZE = 100_000
+# Most runs merged at once; beyond this, runs are first merged into longer ones
+MAX_FAN_IN = 64
+
+class ExternalSorter:
+    """Sorts any number of items by key, spilling sorted runs to disk"""
+
+    def __init__(self, key: Callable[[Any], Any], run_size: Optional[int] = DEFAULT_RUN_SIZE,
+                 spill_dir: Optional[str] = None, encode: Callable[[Any], str] = json.dumps,
+                 decode: Callable[[str], Any] = json.loads):
+        self.key = key
+        self.run_size = run_size
+        self.spill_dir = spill_dir
+        self.encode = encode
+        self.decode = decode
+        self.pending: List[Any] = []
+        self.run_paths: List[str] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, item: Any) -> None:
+        self.pending.append(item)
+        self._count += 1
+        if self.run_size and len(self.pending) >= self.run_size:
+            self.flush_run()
+
+    def flush_run(self) -> Optional[str]:
+        """Sort the pending items and write them out as one run"""
+        if not self.pending:
+            return None
+        self.pending.sort(key=self.key)
+        fd, path = tempfile.mkstemp(prefix="sort-run-", suffix=".jsonl", dir=self.spill_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            for item in self.pending:
+                file.write(self.encode(item) + '\n')
+        self.run_paths.append(path)
+        self.pending = []
+        return path
+
+    def _read_run(self, path: str) -> Iterator[Any]:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield self.decode(line)
+
+    def _merge_pass(self) -> None:
+        """Merge each group of MAX_FAN_IN neighbouring runs into one, keeping run order"""
+        merged_paths = []
+        for start in range(0, len(self.run_paths), MAX_FAN_IN):
+            group = self.run_paths[start:start + MAX_FAN_IN]
+            if len(group) == 1:
+                merged_paths.extend(group)
+                continue
+            fd, path = tempfile.mkstemp(prefix="sort-run-", suffix=".jsonl", dir=self.spill_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                # Lines are copied as written; only the keys are decoded
+                for _, line in heapq.merge(*(self._keyed_lines(run) for run in group), key=lambda pair: pair[0]):
+                    file.write(line)
+            for run in group:
+                os.remove(run)
+            merged_paths.append(path)
+        self.run_paths = merged_paths
+
+    def _keyed_lines(self, path: str) -> Iterator[Tuple[Any, str]]:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield self.key(self.decode(line)), line
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield every item in key order; equal keys keep insertion order"""
+        self.pending.sort(key=self.key)
+        if not self.run_paths:
+            yield from self.pending
+            return
+        while len(self.run_paths) >= MAX_FAN_IN:
+            self._merge_pass()
+        # heapq.merge is stable across its inputs, and runs are listed in the order they were written
+        yield from heapq.merge(*(self._read_run(path) for path in self.run_paths), self.pending, key=self.key)
+
+    def close(self) -> None:
+        for path in self.run_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self.run_paths = []
+        self.pending = []
+
+def rank_order(rank: Any, question_id: str) -> Tuple[bool, int, str]:
+    """Sort key for rank order with the question id as tiebreaker; rows without a rank go last"""
+    try:
+        return (False, int(rank), question_id or "")
+    except (TypeError, ValueError):
+        return (True, 0, question_id or "")
+
+def sort_csv(input_path: str, output_path: str, run_size: int = DEFAULT_RUN_SIZE) -> Dict[str, int]:
+    """Order a CSV of questions by rank (then id, falling back to q<rank>) in bounded memory"""
+    with open(input_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        fieldnames = reader.fieldnames
+        sorter = ExternalSorter(lambda row: rank_order(row.get("rank"), row.get("id") or f"q{row.get('rank')}"),
+                                run_size, os.path.dirname(os.path.abspath(output_path)))
+        try:
+            for row in reader:
+                sorter.add(row)
+            runs = len(sorter.run_paths) + (1 if sorter.pending else 0)
+
+            with open(output_path + ".tmp", 'w', encoding='utf-8', newline='') as out:
+                writer = csv.DictWriter(out, fieldnames=fieldnames)
+                writer.writeheader()
+                for row in sorter:
+                    writer.writerow(row)
+            os.replace(output_path + ".tmp", output_path)
+        finally:
+            sorter.close()
+
+    return {"rows": len(sorter), "runs": runs}
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python external_sort.py <input.csv> <output.csv> [rows_per_run]")
+        sys.exit(1)
+
+    result = sort_csv(sys.argv[1], sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_RUN_SIZE)
+    print(f"Sorted {result['rows']:,} rows in {result['runs']} run(s) -> {sys.argv[2]}")
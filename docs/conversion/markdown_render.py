@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Build-Time Markdown Rendering of Answers
+Pre-renders the Markdown the viewers used to format on every display, so
+the client only injects ready HTML. Every object with an "answer" gains
+
+    answerHtml      block HTML: paragraphs, lists, headings, code blocks
+    keyPointsHtml   one inline HTML fragment per key point
+
+and code is highlighted once here instead of in the browser (see
+code_highlight.py): codeExample objects gain "html", objects with a
+"code_skeleton" gain "code_skeleton_html", and fenced blocks in answers are
+emitted already highlighted, marked data-highlighted="yes".
+
+All source text is escaped before any markup is added, so raw HTML in the
+content never reaches the page; links are kept only for http(s) and
+relative URLs. Fragments are cached by content hash in .render-cache.json
+next to the outputs, and files are rendered in parallel.
+
+    python markdown_render.py <input.json> [...] <output_dir>
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+from code_highlight import ENGINE, highlight
+from conversion_checkpoint import write_json_atomic
+
+CACHE_NAME = ".render-cache.json"
+# Bump when the rendered HTML changes, so cached fragments are discarded
+RENDERER_VERSION = 3
+
+FENCE = re.compile(r"^```[ \t]*([\w+-]*)[ \t]*\n(.*?)\n?```[ \t]*$", re.MULTILINE | re.DOTALL)
+HEADING = re.compile(r"^(#{1,3})\s+(.*)$")
+BULLET = re.compile(r"^\s*[-*•]\s+(.*)$")
+NUMBERED = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+CODE_SPAN = re.compile(r"`([^`\n]+)`")
+BOLD = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*")
+EMPHASIS = re.compile(r"(?<![\w*])\*(?=\S)([^*\n]+?)(?<=\S)\*(?![\w*])")
+LINK = re.compile(r"\[([^\]\n]+)\]\(([^)\s]+)\)")
+# A leading "//" (or "/\", which browsers read the same way) is a protocol-relative
+# link to another host, so only single-slash paths count as local
+SAFE_URL = re.compile(r"^(https?://|/(?![/\\])|\./|#)", re.IGNORECASE)
+
+def render_inline(text: str) -> str:
+    """Escape text and apply code spans, bold, emphasis and safe links"""
+    spans: List[str] = []
+
+    def keep_code(match: re.Match) -> str:
+        spans.append(f"<code>{match.group(1)}</code>")
+        return f"\x00{len(spans) - 1}\x00"
+
+    def link(match: re.Match) -> str:
+        label, url = match.groups()
+        # url is already escaped, so &quot; cannot break out of the attribute
+        if not SAFE_URL.match(html.unescape(url)):
+            return label
+        return f'<a href="{url}" rel="noopener">{label}</a>'
+
+    result = CODE_SPAN.sub(keep_code, html.escape(text))
+    result = LINK.sub(link, result)
+    result = BOLD.sub(r"<strong>\1</strong>", result)
+    result = EMPHASIS.sub(r"<em>\1</em>", result)
+    return re.sub("\x00(\\d+)\x00", lambda match: spans[int(match.group(1))], result)
+
+def _render_lines(lines: List[str]) -> List[str]:
+    """One blank-line separated block: runs of list items become lists, other lines a paragraph"""
+    parts: List[str] = []
+    paragraph: List[str] = []
+    items: List[str] = []
+    list_tag = ""
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            parts.append("<p>" + "<br>".join(render_inline(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+
+    def flush_list() -> None:
+        nonlocal list_tag
+        if items:
+            parts.append(f"<{list_tag}>" + "".join(f"<li>{render_inline(item)}</li>" for item in items)
+                         + f"</{list_tag}>")
+            items.clear()
+        list_tag = ""
+
+    for line in lines:
+        heading = HEADING.match(line)
+        bullet = BULLET.match(line)
+        numbered = NUMBERED.match(line)
+        if heading:
+            flush_paragraph()
+            flush_list()
+            level = len(heading.group(1))
+            parts.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>")
+        elif bullet or numbered:
+            flush_paragraph()
+            tag = "ul" if bullet else "ol"
+            if list_tag and list_tag != tag:
+                flush_list()
+            list_tag = tag
+            items.append((bullet or numbered).group(1))
+        elif items and line.startswith((" ", "\t")):
+            # Indented continuation of the previous list item
+            items[-1] += " " + line.strip()
+        else:
+            flush_list()
+            paragraph.append(line.strip())
+    flush_paragraph()
+    flush_list()
+    return parts
+
+def render_code_block(code: str, language: str = "") -> str:
+    css = f"hljs language-{html.escape(language)}" if language else "hljs"
+    return f'<pre><code class="{css}" data-highlighted="yes">{highlight(code, language)}</code></pre>'
+
+def render_markdown(text: str) -> str:
+    """Render answer Markdown to a sanitized HTML fragment"""
+    parts: List[str] = []
+    position = 0
+    text = text.replace("\r\n", "\n")
+    for fence in FENCE.finditer(text):
+        parts.extend(_render_prose(text[position:fence.start()]))
+        parts.append(render_code_block(fence.group(2), fence.group(1)))
+        position = fence.end()
+    parts.extend(_render_prose(text[position:]))
+    return "".join(parts)
+
+def _render_prose(text: str) -> List[str]:
+    parts = []
+    for block in re.split(r"\n\s*\n", text):
+        lines = [line for line in block.split("\n") if line.strip()]
+        if lines:
+            parts.extend(_render_lines(lines))
+    return parts
+
+def content_hash(kind: str, text: str) -> str:
+    # The highlighting engine is part of the key, so installing Pygments re-renders code
+    return hashlib.sha256(f"{RENDERER_VERSION}:{ENGINE}:{kind}:{text}".encode('utf-8')).hexdigest()
+
+def load_cache(path: str) -> Dict[str, str]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return data.get("fragments", {}) if data.get("version") == RENDERER_VERSION else {}
+
+class FragmentRenderer:
+    """Renders through a hash-keyed cache and records which fragments were used"""
+
+    def __init__(self, cache: Optional[Dict[str, str]] = None):
+        self.cache = cache or {}
+        self.used: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.code = 0
+
+    def render(self, kind: str, text: str) -> str:
+        """kind is "block", "inline" or "code:<language>" """
+        key = content_hash(kind, text)
+        fragment = self.cache.get(key)
+        if fragment is None:
+            if kind == "block":
+                fragment = render_markdown(text)
+            elif kind.startswith("code:"):
+                fragment = highlight(text, kind[len("code:"):])
+            else:
+                fragment = render_inline(text)
+            self.misses += 1
+        else:
+            self.hits += 1
+        self.used[key] = fragment
+        return fragment
+
+    def render_questions(self, data: Any) -> int:
+        """Add rendered fields to every question and code object in data; returns how many questions were rendered"""
+        count = 0
+        if isinstance(data, dict):
+            if isinstance(data.get("answer"), str):
+                data["answerHtml"] = self.render("block", data["answer"])
+                if isinstance(data.get("keyPoints"), list):
+                    data["keyPointsHtml"] = [self.render("inline", str(point)) for point in data["keyPoints"]]
+                count += 1
+            example = data.get("codeExample")
+            if isinstance(example, dict) and isinstance(example.get("code"), str):
+                example["html"] = self.render(f"code:{example.get('language') or 'jsx'}", example["code"])
+                self.code += 1
+            if isinstance(data.get("code_skeleton"), str):
+                data["code_skeleton_html"] = self.render("code:jsx", data["code_skeleton"])
+                self.code += 1
+            for value in data.values():
+                count += self.render_questions(value)
+        elif isinstance(data, list):
+            for value in data:
+                count += self.render_questions(value)
+        return count
+
+def render_file(source: str, target: str, cache_path: str) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """Render one file; returns the fragments it used and its counts"""
+    with open(source, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    renderer = FragmentRenderer(load_cache(cache_path))
+    questions = renderer.render_questions(data)
+    with open(target + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
+    os.replace(target + ".tmp", target)
+    return renderer.used, {"questions": questions, "code": renderer.code, "hits": renderer.hits,
+                           "misses": renderer.misses}
+
+def render_files(pairs: List[Tuple[str, str]], cache_path: str, jobs: Optional[int] = None) -> Dict[str, int]:
+    """
+    Render (source, target) pairs on a process pool. Workers read the cache;
+    the fragments used this run are written back once all files are done, so
+    the cache never outgrows the content.
+    """
+    for _, target in pairs:
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+
+    used: Dict[str, str] = {}
+    totals = {"files": 0, "questions": 0, "code": 0, "hits": 0, "misses": 0}
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs or os.cpu_count() or 1, len(pairs)))) as pool:
+        futures = [(target, pool.submit(render_file, source, target, cache_path)) for source, target in pairs]
+        for target, future in futures:
+            fragments, counts = future.result()
+            used.update(fragments)
+            totals["files"] += 1
+            for key, value in counts.items():
+                totals[key] += value
+            print(f"{os.path.basename(target)}: {counts['questions']} question(s), {counts['code']} code block(s), "
+                  f"{counts['misses']} fragment(s) rendered, {counts['hits']} cached")
+
+    write_json_atomic(cache_path, {"version": RENDERER_VERSION, "fragments": used})
+    return totals
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python markdown_render.py <input.json> [...] <output_dir>")
+        sys.exit(1)
+
+    output_dir = sys.argv[-1]
+    pairs = [(path, os.path.join(output_dir, os.path.basename(path))) for path in sys.argv[1:-1]]
+    totals = render_files(pairs, os.path.join(output_dir, CACHE_NAME))
+    print(f"Rendered {totals['questions']} question(s) and {totals['code']} code block(s) "
+          f"in {totals['files']} file(s) -> {output_dir}")
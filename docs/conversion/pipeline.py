@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Content Build Pipeline Scheduler
+Reads pipeline.json, links stages into a dependency graph (a stage depends
+on whichever stages produce its inputs, plus any listed under "after") and
+runs every stage whose dependencies are done in parallel on a process pool.
+A stage is skipped when the hash of its action, arguments and input files
+matches the last successful run and its outputs still exist.
+
+    python pipeline.py                 # build every default stage
+    python pipeline.py index chart     # build these stages and what they need
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+from importlib import import_module
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from conversion_checkpoint import write_json_atomic
+
+DEFAULT_PIPELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pipeline.json")
+
+class Stage:
+    """One step of the build, with paths resolved against the pipeline file"""
+
+    def __init__(self, config: Dict[str, Any], base_dir: str):
+        self.name = config["name"]
+        self.action = config["action"]
+        self.description = config.get("description", "")
+        self.inputs = [os.path.normpath(os.path.join(base_dir, path)) for path in config.get("inputs", [])]
+        self.outputs = [os.path.normpath(os.path.join(base_dir, path)) for path in config.get("outputs", [])]
+        self.after = list(config.get("after", []))
+        self.args = config.get("args", {})
+        self.optional = bool(config.get("optional", False))
+        self.base_dir = base_dir
+
+    def stamp(self) -> str:
+        """Hash of everything that determines this stage's outputs"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.action, self.args], sort_keys=True).encode('utf-8'))
+        for path in self.inputs:
+            digest.update(os.path.relpath(path, self.base_dir).encode('utf-8'))
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+def load_pipeline(path: str = DEFAULT_PIPELINE) -> Tuple[List[Stage], str]:
+    """Return the stages and the state file path of a pipeline definition"""
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, 'r', encoding='utf-8') as file:
+        config = json.load(file)
+    stages = [Stage(entry, base_dir) for entry in config["stages"]]
+    state_path = os.path.join(base_dir, config.get("stateFile", ".pipeline-state.json"))
+    return stages, state_path
+
+def dependency_graph(stages: List[Stage]) -> Dict[str, Set[str]]:
+    """Map each stage to the stages it waits for; raises ValueError on unknown names or cycles"""
+    names = {stage.name for stage in stages}
+    producers = {output: stage.name for stage in stages for output in stage.outputs}
+
+    graph = {}
+    for stage in stages:
+        unknown = [name for name in stage.after if name not in names]
+        if unknown:
+            raise ValueError(f"Stage {stage.name} runs after unknown stage(s): {', '.join(unknown)}")
+        graph[stage.name] = {producers[path] for path in stage.inputs if path in producers} | set(stage.after)
+        graph[stage.name].discard(stage.name)
+
+    # Kahn's algorithm: anything never freed is on a cycle
+    waiting = {name: len(deps) for name, deps in graph.items()}
+    dependents = {name: [] for name in graph}
+    for name, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(name)
+    ready = [name for name, count in waiting.items() if not count]
+    while ready:
+        for name in dependents[ready.pop()]:
+            waiting[name] -= 1
+            if not waiting[name]:
+                ready.append(name)
+    cyclic = sorted(name for name, count in waiting.items() if count)
+    if cyclic:
+        raise ValueError(f"Pipeline has a dependency cycle through: {', '.join(cyclic)}")
+    return graph
+
+def select_stages(stages: List[Stage], graph: Dict[str, Set[str]], targets: Optional[List[str]] = None) -> Set[str]:
+    """The requested stages (default: all non-optional ones) plus everything they depend on"""
+    names = {stage.name for stage in stages}
+    if targets:
+        unknown = [name for name in targets if name not in names]
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)}")
+        wanted = list(targets)
+    else:
+        wanted = [stage.name for stage in stages if not stage.optional]
+
+    selected = set()
+    while wanted:
+        name = wanted.pop()
+        if name not in selected:
+            selected.add(name)
+            wanted.extend(graph[name])
+    return selected
+
+def _run_action(action: str, inputs: List[str], outputs: List[str], args: Dict[str, Any]) -> Tuple[bool, str]:
+    """Worker entry point: run one stage, capturing what it prints"""
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            module_name, _, function_name = action.partition(':')
+            getattr(import_module(module_name), function_name)(inputs, outputs, **args)
+        missing = [path for path in outputs if not os.path.exists(path)]
+        if missing:
+            log.write(f"Declared output(s) not written: {', '.join(missing)}\n")
+            return False, log.getvalue()
+        return True, log.getvalue()
+    except Exception:
+        log.write(traceback.format_exc())
+        return False, log.getvalue()
+
+def run_pipeline(path: str = DEFAULT_PIPELINE, targets: Optional[List[str]] = None, jobs: Optional[int] = None,
+                 force: bool = False, dry_run: bool = False, verbose: bool = False) -> bool:
+    """
+    Build the selected stages; returns True if nothing failed
+    """
+    stages, state_path = load_pipeline(path)
+    graph = dependency_graph(stages)
+    selected = select_stages(stages, graph, targets)
+    by_name = {stage.name: stage for stage in stages}
+    order = [stage.name for stage in stages if stage.name in selected]
+
+    state = {}
+    if os.path.exists(state_path) and not force:
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+
+    if dry_run:
+        for name in order:
+            deps = sorted(graph[name] & selected)
+            print(f"{name}{' <- ' + ', '.join(deps) if deps else ''}")
+        return True
+
+    jobs = jobs or os.cpu_count() or 1
+    started = time.perf_counter()
+    done: Set[str] = set()
+    failed: Set[str] = set()
+    running = {}
+    launched = {}
+    counts = {"built": 0, "up to date": 0, "failed": 0, "skipped": 0}
+    print(f"Building {len(order)} stage(s) on {jobs} worker(s)")
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while len(done) + len(failed) < len(order):
+            progressed = False
+            for name in order:
+                if name in done or name in failed or name in launched:
+                    continue
+                deps = graph[name] & selected
+                if deps & failed:
+                    failed.add(name)
+                    counts["skipped"] += 1
+                    print(f"   skipped  {name} (dependency failed)")
+                    progressed = True
+                    continue
+                if not deps <= done:
+                    continue
+
+                stage = by_name[name]
+                missing = [p for p in stage.inputs if not os.path.exists(p)]
+                if missing:
+                    failed.add(name)
+                    counts["failed"] += 1
+                    print(f"   FAILED   {name}: missing input(s) {', '.join(missing)}")
+                    progressed = True
+                    continue
+
+                stamp = stage.stamp()
+                if state.get(name) == stamp and all(os.path.exists(p) for p in stage.outputs):
+                    done.add(name)
+                    counts["up to date"] += 1
+                    print(f"   current  {name}")
+                    progressed = True
+                    continue
+
+                for output in stage.outputs:
+                    os.makedirs(os.path.dirname(output), exist_ok=True)
+                future = pool.submit(_run_action, stage.action, stage.inputs, stage.outputs, stage.args)
+                running[future] = name
+                launched[name] = (time.perf_counter(), stamp)
+                progressed = True
+
+            if not running:
+                if not progressed:
+                    break
+                continue
+
+            finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                stage_started, stamp = launched[name]
+                ok, log = future.result()
+                elapsed = time.perf_counter() - stage_started
+                if ok:
+                    done.add(name)
+                    counts["built"] += 1
+                    state[name] = stamp
+                    write_json_atomic(state_path, state)
+                    print(f"   built    {name} ({elapsed:.2f}s)")
+                    if verbose and log.strip():
+                        print("      " + log.strip().replace("\n", "\n      "))
+                else:
+                    failed.add(name)
+                    counts["failed"] += 1
+                    state.pop(name, None)
+                    write_json_atomic(state_path, state)
+                    print(f"   FAILED   {name} ({elapsed:.2f}s)")
+                    print("      " + log.strip().replace("\n", "\n      "))
+
+    summary = ", ".join(f"{count} {label}" for label, count in counts.items() if count)
+    print(f"Pipeline finished in {time.perf_counter() - started:.2f}s: {summary}")
+    return not failed
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    ok = run_pipeline(DEFAULT_PIPELINE, args or None, force="--force" in sys.argv,
+                      dry_run="--dry-run" in sys.argv, verbose="--verbose" in sys.argv)
+    sys.exit(0 if ok else 1)
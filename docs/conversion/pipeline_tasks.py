@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Stage Actions for the Content Build Pipeline
+Each action is referenced from pipeline.json as "pipeline_tasks:<name>" and
+called as action(inputs, outputs, **args) with absolute paths. An action
+raises on failure; the scheduler checks that every declared output exists
+afterwards. Inputs also list the scripts a stage runs, so that editing one
+rebuilds it; actions that take several data files pick them out with
+_data_files.
+"""
+
+import gzip
+import os
+import shutil
+from typing import List, Optional
+
+def _data_files(inputs: List[str]) -> List[str]:
+    """The JSON data among a stage's inputs, in order"""
+    return [path for path in inputs if path.endswith(".json")]
+
+def ingest_notebook(inputs: List[str], outputs: List[str]) -> None:
+    """
+    Re-run the question-authoring notebook cells (docs/script*.py) in order
+    in one shared namespace, writing their files next to the first output.
+    A failing cell is reported and the next one runs, as it did in the
+    notebook (script_4.py redoes the export script_3.py gets wrong).
+    """
+    namespace = {"__name__": "__notebook__"}
+    previous_dir = os.getcwd()
+    os.chdir(os.path.dirname(outputs[0]))
+    try:
+        for path in inputs:
+            with open(path, 'r', encoding='utf-8') as file:
+                code = compile(file.read(), path, 'exec')
+            try:
+                exec(code, namespace)
+            except Exception as e:
+                print(f"Cell {os.path.basename(path)} failed: {e}")
+    finally:
+        os.chdir(previous_dir)
+
+def convert_tier(inputs: List[str], outputs: List[str], title: str = "") -> None:
+    """Convert one tier CSV (inputs[0]); other inputs, such as the rules file, only affect staleness"""
+    from convert_csv_to_json import convert_csv_to_json
+
+    before = os.stat(outputs[0]).st_mtime_ns if os.path.exists(outputs[0]) else None
+    convert_csv_to_json(inputs[0], outputs[0], title)
+    # The converter reports errors instead of raising; an untouched output means it failed
+    if not os.path.exists(outputs[0]) or os.stat(outputs[0]).st_mtime_ns == before:
+        raise RuntimeError(f"Conversion of {os.path.basename(inputs[0])} did not write {outputs[0]}")
+
+def validate(inputs: List[str], outputs: List[str]) -> None:
+    from validate_questions import validate_file
+
+    files = _data_files(inputs)
+    problems = []
+    for path in files:
+        problems.extend(f"{os.path.basename(path)}: {error}" for error in validate_file(path))
+    if problems:
+        raise ValueError("Validation failed:\n   - " + "\n   - ".join(problems))
+    print(f"{len(files)} file(s) valid")
+
+def build_sqlite(inputs: List[str], outputs: List[str]) -> None:
+    from sqlite_export import build_database
+
+    counts = build_database(_data_files(inputs), outputs[0])
+    print(f"{counts['questions']} questions -> {outputs[0]}")
+
+def render_markdown(inputs: List[str], outputs: List[str], jobs: Optional[int] = None) -> None:
+    """Pre-render each data input into the matching output"""
+    from markdown_render import CACHE_NAME, render_files
+
+    totals = render_files(list(zip(_data_files(inputs), outputs)),
+                          os.path.join(os.path.dirname(outputs[0]), CACHE_NAME), jobs)
+    print(f"{totals['questions']} question(s), {totals['code']} code block(s): "
+          f"{totals['misses']} fragment(s) rendered, {totals['hits']} cached")
+
+def highlight_lessons(inputs: List[str], outputs: List[str]) -> None:
+    """Copy the lesson script (inputs[0]) with every code example pre-highlighted"""
+    from code_highlight import ENGINE, highlight_script
+
+    with open(inputs[0], 'r', encoding='utf-8') as file:
+        script, count = highlight_script(file.read())
+    os.makedirs(os.path.dirname(outputs[0]), exist_ok=True)
+    with open(outputs[0] + ".tmp", 'w', encoding='utf-8') as file:
+        file.write(script)
+    os.replace(outputs[0] + ".tmp", outputs[0])
+    print(f"{os.path.basename(outputs[0])}: {count} code example(s) highlighted with {ENGINE}")
+
+def build_store(inputs: List[str], outputs: List[str]) -> None:
+    """Normalize the JSON inputs into the content store (outputs[0])"""
+    from content_store import build
+
+    build(_data_files(inputs), outputs[0])
+
+def split_tiers(inputs: List[str], outputs: List[str], block_size: int = 20) -> None:
+    """Write the summary index and detail blocks of each tier file next to the first output"""
+    from summary_split import split_tier, summary_name
+
+    for source in _data_files(inputs):
+        result = split_tier(source, os.path.dirname(outputs[0]), block_size)
+        print(f"{summary_name(os.path.basename(source))}: {result['bytes']:,} bytes, "
+              f"{result['blocks']} detail block(s)")
+
+def compress(inputs: List[str], outputs: List[str], level: int = 9) -> None:
+    """Write a precompressed .gz copy of each input to the matching output"""
+    for source, target in zip(inputs, outputs):
+        with open(source, 'rb') as file, open(target + ".tmp", 'wb') as raw:
+            with gzip.GzipFile(filename='', mode='wb', fileobj=raw, compresslevel=level, mtime=0) as out:
+                shutil.copyfileobj(file, out)
+        os.replace(target + ".tmp", target)
+        print(f"{os.path.basename(target)}: {os.path.getsize(source):,} -> {os.path.getsize(target):,} bytes")
+
+def chart(inputs: List[str], outputs: List[str]) -> None:
+    """Render the difficulty-by-tier chart from the converted files (needs plotly, pandas and kaleido)"""
+    import sys
+    from convert_csv_to_json import FILE_MAPPINGS
+    from validate_questions import file_stats
+
+    docs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    if docs_dir not in sys.path:
+        sys.path.append(docs_dir)
+    from chart_script import create_chart
+
+    titles = {json_file: title for _, json_file, title in FILE_MAPPINGS}
+    data = []
+    for path in _data_files(inputs):
+        difficulties = file_stats(path)["difficulties"]
+        data.append({
+            "tier": titles.get(os.path.basename(path), os.path.basename(path)),
+            "beginner": difficulties.get("Beginner", 0),
+            "intermediate": difficulties.get("Intermediate", 0),
+            "advanced": difficulties.get("Advanced", 0),
+            "total": sum(difficulties.values())
+        })
+    create_chart(data, os.path.splitext(outputs[0])[0], show=False)
+
+def publish(inputs: List[str], outputs: List[str], url_prefix: str = "/data/") -> None:
+    """
+    Publish fingerprinted copies into the directory of outputs[0] (the asset
+    manifest); summary inputs bring the detail blocks they list along
+    """
+    import json
+    from publish_assets import publish as publish_assets
+
+    names = []
+    for path in _data_files(inputs):
+        names.append(os.path.basename(path))
+        if path.endswith(".summary.json"):
+            with open(path, 'r', encoding='utf-8') as file:
+                names.extend(json.load(file)["blocks"])
+    publish_assets(os.path.dirname(inputs[0]), os.path.dirname(outputs[0]), url_prefix, list(dict.fromkeys(names)))
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted Data Publishing
+Copies each converted JSON artifact to a content-hashed filename
+(top-10-questions.json -> top-10-questions.3f9c2a7b1d04.json) and writes
+asset-manifest.json, which maps logical names to the hashed URLs with their
+sizes and SRI integrity hashes. The manifest's "precache" list uses the
+{url, revision, integrity} entries service-worker precaching expects; hashed
+URLs never change content, so revision is null and they can be cached as
+immutable.
+
+When a file changes, a JSON Patch from the previous release is published
+next to it and listed under the asset's "deltas", keyed by the content hash
+a returning client already has. Chains of patches reach clients several
+releases behind; once a chain outgrows DELTA_MAX_RATIO of the full file it
+is dropped and those clients download the file instead.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+from convert_csv_to_json import FILE_MAPPINGS
+from data_deltas import write_delta
+
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 12
+HASHED_NAME = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})\.json$" % HASH_LENGTH)
+PATCH_NAME = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{%d}-[0-9a-f]{%d}\.patch\.json$" % (HASH_LENGTH, HASH_LENGTH))
+DELTA_MAX_RATIO = 0.5
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DEST_DIR = os.path.normpath(os.path.join(HERE, '..', '..', 'public', 'data'))
+
+def fingerprint(path: str) -> Dict[str, Any]:
+    """Content hash for the filename, SRI integrity and size of one file"""
+    sha256 = hashlib.sha256()
+    sha384 = hashlib.sha384()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            sha256.update(chunk)
+            sha384.update(chunk)
+    return {
+        "hash": sha256.hexdigest()[:HASH_LENGTH],
+        "integrity": "sha384-" + base64.b64encode(sha384.digest()).decode('ascii'),
+        "size": os.path.getsize(path),
+    }
+
+def hashed_name(name: str, content_hash: str) -> str:
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{content_hash}{ext}"
+
+def _read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _delta_chains(previous: Dict[str, Any], target: str, info: Dict[str, Any], dest_dir: str,
+                  url_prefix: str, limit: float) -> Dict[str, Dict[str, Any]]:
+    """Patch chains from each earlier version of an asset to the one being published"""
+    previous_name = os.path.basename(previous["url"])
+    if previous_name == os.path.basename(target):
+        return previous.get("deltas", {})
+
+    previous_path = os.path.join(dest_dir, previous_name)
+    match = HASHED_NAME.match(previous_name)
+    if not match or not os.path.exists(previous_path):
+        return {}
+
+    patch_name = f"{match.group('stem')}.{match.group('hash')}-{info['hash']}.patch.json"
+    patch_size = write_delta(previous_path, target, os.path.join(dest_dir, patch_name))["size"]
+
+    earlier = {match.group("hash"): {"chain": [], "size": 0}}
+    earlier.update(previous.get("deltas", {}))
+    chains = {}
+    for version, delta in earlier.items():
+        if delta["size"] + patch_size <= limit:
+            chains[version] = {"chain": delta["chain"] + [url_prefix + patch_name],
+                               "size": delta["size"] + patch_size}
+    return chains
+
+def publish(source_dir: str = "json_output", dest_dir: str = DEFAULT_DEST_DIR, url_prefix: str = "/data/",
+            names: Optional[List[str]] = None, prune: bool = True,
+            deltas: bool = True, delta_max_ratio: float = DELTA_MAX_RATIO) -> Dict[str, Any]:
+    """
+    Copy artifacts to hashed names in dest_dir and write the asset manifest
+
+    Hashed copies from the previous release are kept so pages loaded before
+    the deploy can still fetch them; older ones are removed when prune is set.
+    """
+    if not names:
+        from summary_split import split_outputs
+        names = [json_file for _, json_file, _ in FILE_MAPPINGS] + split_outputs(source_dir)
+    os.makedirs(dest_dir, exist_ok=True)
+    manifest_path = os.path.join(dest_dir, MANIFEST_NAME)
+    previous = _read_manifest(manifest_path) or {}
+    previous_assets = previous.get("assets", {})
+
+    assets = {}
+    copied = 0
+    for name in names:
+        source = os.path.join(source_dir, name)
+        if not os.path.exists(source):
+            print(f"Skipping {name}: not found in {source_dir}")
+            continue
+
+        info = fingerprint(source)
+        target_name = hashed_name(name, info["hash"])
+        target = os.path.join(dest_dir, target_name)
+        if not os.path.exists(target):
+            shutil.copyfile(source, target + ".tmp")
+            os.replace(target + ".tmp", target)
+            copied += 1
+
+        asset = assets[name] = {"url": url_prefix + target_name, "size": info["size"],
+                                "integrity": info["integrity"]}
+        if deltas and name in previous_assets:
+            chains = _delta_chains(previous_assets[name], target, info, dest_dir, url_prefix,
+                                   delta_max_ratio * info["size"])
+            if chains:
+                asset["deltas"] = chains
+
+    version = hashlib.sha256("".join(asset["url"] for asset in assets.values()).encode('utf-8')).hexdigest()
+    manifest = {
+        "version": version[:HASH_LENGTH],
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "assets": assets,
+        "precache": [{"url": asset["url"], "revision": None, "integrity": asset["integrity"]}
+                     for asset in assets.values()]
+    }
+
+    # Readers see either the old manifest or the new one, never a partial file
+    with open(manifest_path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    removed = 0
+    if prune:
+        keep = {os.path.basename(asset["url"]) for asset in assets.values()}
+        keep.update(os.path.basename(asset["url"]) for asset in previous_assets.values())
+        for entry in os.listdir(dest_dir):
+            match = HASHED_NAME.match(entry)
+            if match and match.group("stem") + ".json" in assets and entry not in keep:
+                os.remove(os.path.join(dest_dir, entry))
+                removed += 1
+
+        patches = {os.path.basename(url) for asset in assets.values()
+                   for delta in asset.get("deltas", {}).values() for url in delta["chain"]}
+        for entry in os.listdir(dest_dir):
+            match = PATCH_NAME.match(entry)
+            if match and match.group("stem") + ".json" in assets and entry not in patches:
+                os.remove(os.path.join(dest_dir, entry))
+                removed += 1
+
+    unchanged = sum(1 for name, asset in assets.items()
+                    if previous_assets.get(name, {}).get("url") == asset["url"])
+    print(f"Published {len(assets)} asset(s) to {dest_dir}: {copied} new, {unchanged} unchanged, "
+          f"{removed} stale removed")
+    print(f"Manifest written to {manifest_path} (version {manifest['version']})")
+    return manifest
+
+if __name__ == "__main__":
+    publish(
+        sys.argv[1] if len(sys.argv) > 1 else "json_output",
+        sys.argv[2] if len(sys.argv) > 2 else DEFAULT_DEST_DIR,
+        sys.argv[3] if len(sys.argv) > 3 else "/data/"
+    )
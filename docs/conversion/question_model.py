@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Shared Question Model for the Python Tooling
+A slotted, compact in-memory representation of one interview question.
+Repeated values (category, difficulty, tier) are interned so a large bank
+shares one string object per distinct value.
+"""
+
+import json
+import sys
+from typing import List, Dict, Any, Optional
+
+class Question:
+    """One interview question, serialized in the repository's JSON layout"""
+
+    __slots__ = (
+        "id", "question", "difficulty", "category", "answer",
+        "code_example", "key_points", "follow_up_questions",
+        "tier", "rank",
+    )
+
+    def __init__(self, id: str, question: str, difficulty: str, category: str, answer: str,
+                 code_example: Optional[Dict[str, str]] = None, key_points: Optional[List[str]] = None,
+                 follow_up_questions: Optional[List[str]] = None, tier: Optional[str] = None,
+                 rank: Optional[int] = None):
+        self.id = id
+        self.question = question
+        self.difficulty = sys.intern(difficulty)
+        self.category = sys.intern(category)
+        self.answer = answer
+        self.code_example = code_example
+        self.key_points = key_points
+        self.follow_up_questions = follow_up_questions
+        self.tier = sys.intern(tier) if tier else None
+        self.rank = rank
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], tier: Optional[str] = None) -> "Question":
+        return cls(
+            data["id"], data["question"], data["difficulty"], data["category"], data["answer"],
+            code_example=data.get("codeExample"),
+            key_points=data.get("keyPoints"),
+            follow_up_questions=data.get("followUpQuestions"),
+            tier=tier,
+            rank=data.get("rank"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the question in the key order the converter has always written"""
+        data = {
+            "id": self.id,
+            "question": self.question,
+            "difficulty": self.difficulty,
+            "category": self.category,
+            "answer": self.answer
+        }
+        if self.code_example:
+            data["codeExample"] = self.code_example
+        if self.key_points:
+            data["keyPoints"] = self.key_points
+        if self.follow_up_questions:
+            data["followUpQuestions"] = self.follow_up_questions
+        return data
+
+    def __repr__(self) -> str:
+        return f"Question({self.id!r}, {self.difficulty!r}, {self.category!r})"
+
+def load_questions(path: str, tier: Optional[str] = None) -> List[Question]:
+    """Load a converted question file into Question objects"""
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    return [Question.from_dict(q, tier) for q in data.get("questions", [])]
+
+def benchmark_memory(count: int = 1_000_000) -> Dict[str, float]:
+    """
+    Compare traced memory of count synthetic questions held as dicts versus
+    Question objects. Category/difficulty/tier values are built fresh per row,
+    as the CSV reader does, so the dict version pays for every copy.
+    """
+    import gc
+    import tracemalloc
+
+    categories = ["React Fundamentals", "React Hooks", "State Management", "Performance", "Forms"]
+    difficulties = ["Beginner", "Intermediate", "Advanced"]
+    tiers = ["Top 10", "Top 20", "Top 50", "Top 100"]
+
+    def rows():
+        for i in range(count):
+            yield (f"q{i}", f"Question {i}?", "".join(difficulties[i % 3]), "".join(categories[i % 5]),
+                   f"Answer {i}.", "".join(tiers[i % 4]))
+
+    def measure(build) -> int:
+        gc.collect()
+        tracemalloc.start()
+        items = build()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del items
+        gc.collect()
+        return current
+
+    as_dicts = measure(lambda: [
+        {"id": i, "question": q, "difficulty": d, "category": c, "answer": a, "tier": t}
+        for i, q, d, c, a, t in rows()
+    ])
+    as_objects = measure(lambda: [Question(i, q, d, c, a, tier=t) for i, q, d, c, a, t in rows()])
+
+    return {
+        "questions": count,
+        "dictBytesPerQuestion": as_dicts / count,
+        "questionBytesPerQuestion": as_objects / count,
+        "reduction": 1 - as_objects / as_dicts,
+    }
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    result = benchmark_memory(count)
+    print(f"{result['questions']:,} synthetic questions")
+    print(f"   dict:     {result['dictBytesPerQuestion']:.0f} bytes/question")
+    print(f"   Question: {result['questionBytesPerQuestion']:.0f} bytes/question")
+    print(f"   Reduction: {result['reduction']:.0%}")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Per-Row Time Budget for Batch Conversion
+A watchdog timer interrupts row enrichment that runs past its budget (for
+example a pasted code blob that makes a regex backtrack), so the converter
+can fall back to an unenriched record and list the row in a slow-rows report.
+
+The budget is enforced with SIGALRM, which the regex engine checks while it
+runs. Where SIGALRM is unavailable (Windows, or conversions running off the
+main thread) rows are timed but not interrupted, and overruns are still
+reported.
+"""
+
+import json
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
+
+DEFAULT_ROW_BUDGET = 5.0
+
+class RowTimeout(Exception):
+    """Raised inside a row when its time budget runs out"""
+
+class RowWatchdog:
+    """Enforces a per-row wall-time budget and records slow rows"""
+
+    def __init__(self, budget: Optional[float] = DEFAULT_ROW_BUDGET):
+        self.budget = budget if budget and budget > 0 else None
+        self.enforced = bool(self.budget) and hasattr(signal, "setitimer") \
+            and threading.current_thread() is threading.main_thread()
+        self.slow_rows: List[Dict[str, Any]] = []
+        self._previous_handler = None
+        self._interrupted_in = None
+
+    def __enter__(self) -> "RowWatchdog":
+        if self.enforced:
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.enforced:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+
+    def _on_alarm(self, signum, frame) -> None:
+        self._interrupted_in = frame.f_code.co_name if frame else None
+        raise RowTimeout()
+
+    @contextmanager
+    def guard(self, row: str) -> Iterator[None]:
+        """Run one row's work under the budget; raises RowTimeout on overrun"""
+        started = time.perf_counter()
+        try:
+            if self.enforced:
+                signal.setitimer(signal.ITIMER_REAL, self.budget)
+            try:
+                yield
+            finally:
+                if self.enforced:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except RowTimeout:
+            self.slow_rows.append({
+                "row": row,
+                "seconds": round(time.perf_counter() - started, 3),
+                "interruptedIn": self._interrupted_in,
+                "fallback": "unenriched"
+            })
+            raise
+
+        elapsed = time.perf_counter() - started
+        if self.budget and elapsed > self.budget:
+            self.slow_rows.append({"row": row, "seconds": round(elapsed, 3), "fallback": None})
+
+    def write_report(self, path: str, source: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({
+                "source": source,
+                "rowBudgetSeconds": self.budget,
+                "enforced": self.enforced,
+                "slowRows": self.slow_rows
+            }, file, indent=2)
+
+def slow_rows_path_for(output_file_path: str) -> str:
+    """Return the slow-rows report path that sits next to a converted JSON file"""
+    base = output_file_path[:-5] if output_file_path.endswith('.json') else output_file_path
+    return f"{base}.slow-rows.json"
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Keyword Rule Engine for Key-Point and Follow-Up Generation
+Loads declarative keyword -> output rules from enrichment_rules.json and
+compiles them once into Aho-Corasick automata, so every rule is matched in a
+single pass over each answer or question no matter how many rules exist.
+"""
+
+import json
+import os
+from collections import deque
+from typing import List, Dict, Any, Optional, Set
+
+from text_normalization import NORMALIZER, TextNormalizer
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "enrichment_rules.json")
+
+class AhoCorasick:
+    """Multi-pattern substring matcher; reports which pattern indices occur in a text"""
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(index)
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def matches(self, text: str) -> Set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+class RuleSet:
+    """Named groups of keyword rules that are matched against the same text"""
+
+    def __init__(self, groups: Dict[str, List[Dict[str, Any]]], normalizer: TextNormalizer = NORMALIZER):
+        self.normalizer = normalizer
+        self.groups: Dict[str, List[int]] = {}
+        self.outputs: List[str] = []
+        sensitive, insensitive = [], []
+        self._sensitive_ids, self._insensitive_ids = [], []
+
+        for name, rules in groups.items():
+            ids = []
+            for rule in rules:
+                rule_id = len(self.outputs)
+                self.outputs.append(rule["output"])
+                if rule.get("caseSensitive"):
+                    sensitive.append(rule["keyword"])
+                    self._sensitive_ids.append(rule_id)
+                else:
+                    insensitive.append(rule["keyword"].lower())
+                    self._insensitive_ids.append(rule_id)
+                ids.append(rule_id)
+            self.groups[name] = ids
+
+        self._sensitive = AhoCorasick(sensitive) if sensitive else None
+        self._insensitive = AhoCorasick(insensitive) if insensitive else None
+
+    def scan(self, text: str) -> Set[int]:
+        """Return the ids of every rule whose keyword occurs in text"""
+        matched = set()
+        if self._sensitive:
+            matched.update(self._sensitive_ids[i] for i in self._sensitive.matches(text))
+        if self._insensitive:
+            matched.update(self._insensitive_ids[i] for i in self._insensitive.matches(self.normalizer.lower(text)))
+        return matched
+
+    def matched_outputs(self, group: str, matched: Set[int]) -> List[str]:
+        """Outputs of a group's matched rules, in rule order"""
+        return [self.outputs[rule_id] for rule_id in self.groups[group] if rule_id in matched]
+
+class EnrichmentRules:
+    """Compiled key-point and follow-up rules"""
+
+    def __init__(self, config: Dict[str, Any], normalizer: TextNormalizer = NORMALIZER):
+        key_points = config["keyPoints"]
+        follow_ups = config["followUps"]
+
+        self.key_point_limit = key_points.get("limit", 4)
+        self.follow_up_limit = follow_ups.get("limit", 3)
+        self.per_category = follow_ups.get("perCategory", 2)
+        self.category_follow_ups = follow_ups.get("categories", {})
+        self.difficulty_follow_ups = follow_ups.get("difficulties", {})
+
+        self.answer_rules = RuleSet({
+            "answerPhrases": key_points.get("answerPhrases", []),
+            "answerFallbacks": key_points.get("answerFallbacks", []),
+        }, normalizer)
+        self.question_rules = RuleSet({
+            "questionFallbacks": key_points.get("questionFallbacks", []),
+            "questionFirstMatch": follow_ups.get("questionFirstMatch", []),
+        }, normalizer)
+
+    def key_points(self, answer: str, question: str, key_points: Optional[List[str]] = None) -> List[str]:
+        """Complete key points (e.g. bullets already extracted) from keyword rules"""
+        key_points = list(key_points or [])
+        if len(key_points) >= 2:
+            return key_points[:self.key_point_limit]
+
+        matched = self.answer_rules.scan(answer)
+
+        # If no bullet points found, extract key phrases
+        if not key_points:
+            key_points.extend(self.answer_rules.matched_outputs("answerPhrases", matched))
+
+        # Ensure we have at least 2-3 key points
+        if len(key_points) < 2:
+            key_points.extend(self.answer_rules.matched_outputs("answerFallbacks", matched))
+            if not key_points:
+                # Fallback key points based on question
+                question_matched = self.question_rules.scan(question)
+                key_points.extend(self.question_rules.matched_outputs("questionFallbacks", question_matched))
+
+        return key_points[:self.key_point_limit]
+
+    def follow_ups(self, question: str, category: str, difficulty: str) -> List[str]:
+        """Category, difficulty and first-matching question follow-ups"""
+        follow_ups = list(self.category_follow_ups.get(category, [])[:self.per_category])
+
+        if difficulty in self.difficulty_follow_ups:
+            follow_ups.append(self.difficulty_follow_ups[difficulty])
+
+        matched = self.question_rules.scan(question)
+        question_follow_ups = self.question_rules.matched_outputs("questionFirstMatch", matched)
+        if question_follow_ups:
+            follow_ups.append(question_follow_ups[0])
+
+        return follow_ups[:self.follow_up_limit]
+
+def load_rules(path: str = DEFAULT_RULES_PATH, normalizer: TextNormalizer = NORMALIZER) -> EnrichmentRules:
+    """Load and compile a rules file; normalizer lowercases text for case-insensitive rules"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return EnrichmentRules(json.load(file), normalizer)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+SQLite Question Bank Artifact
+Compiles the converted tier files into one SQLite database with normalized
+tables (tiers, questions, key_points, follow_ups), covering indexes for the
+common category/difficulty/tier lookups and an FTS5 index over question and
+answer text. Tools and apps can open the single file read-only (or
+memory-mapped) and query it instead of re-parsing every JSON file.
+
+    SELECT q.tier_id, q.id, q.question FROM questions_fts
+    JOIN questions q ON q.pk = questions_fts.rowid
+    WHERE questions_fts MATCH 'useEffect cleanup' ORDER BY bm25(questions_fts);
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import List, Dict, Any, Iterable, Tuple
+
+from convert_csv_to_json import FILE_MAPPINGS
+from tier_names import tier_key
+
+SCHEMA = """
+CREATE TABLE tiers (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    last_updated TEXT,
+    total_questions INTEGER NOT NULL
+);
+
+CREATE TABLE questions (
+    pk INTEGER PRIMARY KEY,
+    tier_id TEXT NOT NULL REFERENCES tiers(id),
+    id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    category TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    code_title TEXT,
+    code_language TEXT,
+    code TEXT,
+    UNIQUE (tier_id, id)
+);
+
+CREATE TABLE key_points (
+    question_pk INTEGER NOT NULL REFERENCES questions(pk),
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (question_pk, position)
+) WITHOUT ROWID;
+
+CREATE TABLE follow_ups (
+    question_pk INTEGER NOT NULL REFERENCES questions(pk),
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (question_pk, position)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE questions_fts USING fts5(
+    question, answer, content='questions', content_rowid='pk', tokenize='porter unicode61'
+);
+"""
+
+# Created after the bulk load, which is faster than maintaining them per row.
+# Each one carries the columns its listing queries select, so they are answered
+# from the index without touching the table.
+INDEXES = [
+    "CREATE INDEX idx_questions_tier ON questions(tier_id, rank, difficulty, category)",
+    "CREATE INDEX idx_questions_category ON questions(category, difficulty, tier_id, rank)",
+    "CREATE INDEX idx_questions_difficulty ON questions(difficulty, tier_id, rank, category)",
+]
+
+def _tier_rows(tier_id: str, data: Dict[str, Any], start_pk: int) -> Tuple[tuple, List[tuple], List[tuple], List[tuple]]:
+    questions, key_points, follow_ups = [], [], []
+    for rank, question in enumerate(data.get("questions", []), 1):
+        pk = start_pk + rank - 1
+        code = question.get("codeExample") or {}
+        questions.append((pk, tier_id, question["id"], rank, question["question"], question["difficulty"],
+                          question["category"], question["answer"], code.get("title"), code.get("language"),
+                          code.get("code")))
+        key_points.extend((pk, position, text) for position, text in enumerate(question.get("keyPoints") or []))
+        follow_ups.extend((pk, position, text)
+                          for position, text in enumerate(question.get("followUpQuestions") or []))
+
+    tier = (tier_id, data.get("title", tier_id), data.get("description"), data.get("lastUpdated"), len(questions))
+    return tier, questions, key_points, follow_ups
+
+def build_database(json_paths: Iterable[str], db_path: str) -> Dict[str, Any]:
+    """
+    Build the database from converted JSON files in one transaction
+
+    The database is written to a temporary file and renamed into place, so
+    readers never see a half-built file.
+    """
+    started = time.perf_counter()
+    temp_path = db_path + ".tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    connection = sqlite3.connect(temp_path, isolation_level=None)
+    counts = {"tiers": 0, "questions": 0, "keyPoints": 0, "followUps": 0}
+    try:
+        # The file is discarded on failure, so skip the rollback journal and fsyncs
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(SCHEMA)
+
+        connection.execute("BEGIN")
+        next_pk = 1
+        for path in json_paths:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            tier, questions, key_points, follow_ups = _tier_rows(tier_key(os.path.basename(path)), data, next_pk)
+            next_pk += len(questions)
+
+            connection.execute("INSERT INTO tiers VALUES (?, ?, ?, ?, ?)", tier)
+            connection.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", questions)
+            connection.executemany("INSERT INTO key_points VALUES (?, ?, ?)", key_points)
+            connection.executemany("INSERT INTO follow_ups VALUES (?, ?, ?)", follow_ups)
+            counts["tiers"] += 1
+            counts["questions"] += len(questions)
+            counts["keyPoints"] += len(key_points)
+            counts["followUps"] += len(follow_ups)
+
+        for statement in INDEXES:
+            connection.execute(statement)
+        connection.execute("INSERT INTO questions_fts(questions_fts) VALUES ('rebuild')")
+        connection.execute("INSERT INTO questions_fts(questions_fts) VALUES ('optimize')")
+        connection.execute("COMMIT")
+        connection.execute("ANALYZE")
+    except Exception:
+        connection.close()
+        os.remove(temp_path)
+        raise
+    connection.close()
+    os.replace(temp_path, db_path)
+
+    counts["seconds"] = round(time.perf_counter() - started, 3)
+    counts["bytes"] = os.path.getsize(db_path)
+    return counts
+
+def build_from_output_dir(output_dir: str, db_path: str) -> Dict[str, Any]:
+    """Build the database from the tier files a batch conversion wrote"""
+    paths = [os.path.join(output_dir, json_file) for _, json_file, _ in FILE_MAPPINGS
+             if os.path.exists(os.path.join(output_dir, json_file))]
+    counts = build_database(paths, db_path)
+    print(f"SQLite question bank: {counts['questions']} questions in {counts['tiers']} tier(s) "
+          f"-> {db_path} ({counts['bytes']:,} bytes, {counts['seconds']:.2f}s)")
+    return counts
+
+if __name__ == "__main__":
+    build_from_output_dir(
+        sys.argv[1] if len(sys.argv) > 1 else "json_output",
+        sys.argv[2] if len(sys.argv) > 2 else os.path.join("json_output", "questions.sqlite")
+    )
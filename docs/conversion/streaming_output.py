@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Streaming Output for the CSV to JSON Conversion Tool
+Holds converted questions in memory until a memory budget is hit, then spills
+them to a temporary JSON Lines file, and writes question files incrementally
+so the full document never has to be built in RAM. A sorted buffer writes
+sorted runs instead and merges them back in rank order (see external_sort).
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+from external_sort import ExternalSorter, rank_order
+from question_model import Question
+
+class QuestionBuffer:
+    """Ordered Question store that can move its contents to disk on demand"""
+
+    def __init__(self, spill_dir: Optional[str] = None, sort: bool = False):
+        self.spill_dir = spill_dir
+        self._category_counts: Dict[str, int] = {}
+        self._difficulty_counts: Dict[str, int] = {}
+        self._items = []
+        self._count = 0
+        self._spill_file = None
+        self._spill_path = None
+        # Sorted buffers hold everything in one run until spill() fixes the run size
+        self._sorter = ExternalSorter(question_order, None, spill_dir, encode_question, decode_question) if sort else None
+        self._first_keys: Dict[str, Any] = {}
+
+    @property
+    def spilled(self) -> bool:
+        if self._sorter is not None:
+            return bool(self._sorter.run_paths)
+        return self._spill_file is not None
+
+    @property
+    def category_counts(self) -> Dict[str, int]:
+        """Counts per category, in the order categories first appear in the output"""
+        return self._in_output_order(self._category_counts)
+
+    @property
+    def difficulty_counts(self) -> Dict[str, int]:
+        return self._in_output_order(self._difficulty_counts)
+
+    def _in_output_order(self, counts: Dict[str, int]) -> Dict[str, int]:
+        if self._sorter is None:
+            return counts
+        return {name: counts[name] for name in sorted(counts, key=self._first_keys.__getitem__)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, question: Question) -> None:
+        self._category_counts[question.category] = self._category_counts.get(question.category, 0) + 1
+        self._difficulty_counts[question.difficulty] = self._difficulty_counts.get(question.difficulty, 0) + 1
+        self._count += 1
+        if self._sorter is not None:
+            key = question_order(question)
+            for name in (question.category, question.difficulty):
+                if name not in self._first_keys or key < self._first_keys[name]:
+                    self._first_keys[name] = key
+            self._sorter.add(question)
+        elif self._spill_file:
+            self._spill_file.write(json.dumps(question.to_dict(), ensure_ascii=False) + '\n')
+        else:
+            self._items.append(question)
+
+    def spill(self) -> str:
+        """
+        Move buffered questions to a temporary file; later appends go straight
+        to disk. A sorted buffer writes what it holds as one sorted run and
+        keeps later runs to the same number of questions.
+        """
+        if self._sorter is not None:
+            self._sorter.run_size = max(1, len(self._sorter.pending))
+            return self._sorter.flush_run() or ""
+        if not self._spill_file:
+            fd, self._spill_path = tempfile.mkstemp(prefix="questions-", suffix=".jsonl", dir=self.spill_dir)
+            self._spill_file = os.fdopen(fd, 'w', encoding='utf-8')
+            for question in self._items:
+                self._spill_file.write(json.dumps(question.to_dict(), ensure_ascii=False) + '\n')
+            self._items = []
+        return self._spill_path
+
+    def __iter__(self) -> Iterator[Question]:
+        if self._sorter is not None:
+            yield from self._sorter
+            return
+        if not self._spill_file:
+            yield from self._items
+            return
+
+        self._spill_file.flush()
+        with open(self._spill_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield Question.from_dict(json.loads(line))
+
+    def close(self) -> None:
+        if self._sorter is not None:
+            self._sorter.close()
+        if self._spill_file:
+            self._spill_file.close()
+            os.remove(self._spill_path)
+            self._spill_file = None
+        self._items = []
+
+def question_order(question: Question):
+    """Rank order, with the question id breaking ties"""
+    return rank_order(question.rank, question.id)
+
+def encode_question(question: Question) -> str:
+    """One JSON line that keeps the rank, which to_dict() leaves out"""
+    return json.dumps({**question.to_dict(), "rank": question.rank}, ensure_ascii=False)
+
+def decode_question(line: str) -> Question:
+    return Question.from_dict(json.loads(line))
+
+def write_question_file(file, header: Dict[str, Any], questions: Iterable[Dict[str, Any]]) -> int:
+    """
+    Write header fields followed by a "questions" array, one question at a time
+
+    Produces exactly what json.dump({**header, "questions": [...]}, indent=2,
+    ensure_ascii=False) would, without materializing the question list.
+    """
+    head = json.dumps(header, indent=2, ensure_ascii=False)
+    file.write(head[:-2] + ',\n  "questions": [' if header else '{\n  "questions": [')
+
+    count = 0
+    for question in questions:
+        body = json.dumps(question, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+        file.write(('\n    ' if count == 0 else ',\n    ') + body)
+        count += 1
+
+    file.write('\n  ]\n}' if count else ']\n}')
+    return count
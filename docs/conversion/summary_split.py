@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Summary / Detail Split of Tier Files
+List views only need each question's id, text, difficulty and category, so
+every tier is also written as a compact summary index plus detail blocks
+loaded on demand:
+
+    top-10.summary.json     header fields and [{id, question, difficulty, category, block}]
+    top-10.details-0.json   {"questions": [{id, answer, codeExample, keyPoints, followUpQuestions}]}
+
+Blocks hold DEFAULT_BLOCK_SIZE consecutive questions, so opening one answer
+costs one small request and its neighbours come along for free.
+
+    python summary_split.py [json_output] [block_size]
+"""
+
+import json
+import os
+import sys
+from typing import List, Dict, Any, Iterable
+
+from streaming_output import write_question_file
+from tier_names import SPLIT_FILE, tier_key
+
+DEFAULT_BLOCK_SIZE = 20
+SUMMARY_FIELDS = ("id", "question", "difficulty", "category")
+
+def summary_name(json_file: str) -> str:
+    return f"{tier_key(json_file)}.summary.json"
+
+def details_name(json_file: str, block: int) -> str:
+    return f"{tier_key(json_file)}.details-{block}.json"
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    with open(path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+class TierSplitter:
+    """
+    Receives a tier's questions in order and writes its summary and detail
+    blocks; only the current block's details are held in memory.
+    """
+
+    def __init__(self, dest_dir: str, json_file: str, header: Dict[str, Any],
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        self.dest_dir = dest_dir
+        self.json_file = json_file
+        self.header = header
+        self.block_size = max(1, block_size)
+        self.entries: List[Dict[str, Any]] = []
+        self.blocks: List[str] = []
+        self._details: List[Dict[str, Any]] = []
+
+    def add(self, question: Dict[str, Any]) -> None:
+        entry = {field: question[field] for field in SUMMARY_FIELDS}
+        entry["block"] = len(self.blocks)
+        self.entries.append(entry)
+        self._details.append({key: value for key, value in question.items()
+                              if key == "id" or key not in SUMMARY_FIELDS})
+        if len(self._details) >= self.block_size:
+            self._flush_block()
+
+    def _flush_block(self) -> None:
+        name = details_name(self.json_file, len(self.blocks))
+        _write_json(os.path.join(self.dest_dir, name), {"questions": self._details})
+        self.blocks.append(name)
+        self._details = []
+
+    def finish(self) -> Dict[str, Any]:
+        """Write the last block and the summary, and remove blocks left over from a longer tier"""
+        if self._details:
+            self._flush_block()
+
+        stale = len(self.blocks)
+        while os.path.exists(os.path.join(self.dest_dir, details_name(self.json_file, stale))):
+            os.remove(os.path.join(self.dest_dir, details_name(self.json_file, stale)))
+            stale += 1
+
+        path = os.path.join(self.dest_dir, summary_name(self.json_file))
+        header = {**self.header, "blockSize": self.block_size, "blocks": self.blocks}
+        with open(path + ".tmp", 'w', encoding='utf-8') as file:
+            write_question_file(file, header, self.entries)
+        os.replace(path + ".tmp", path)
+        return {"summary": path, "blocks": len(self.blocks), "bytes": os.path.getsize(path)}
+
+    def split(self, questions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        for question in questions:
+            self.add(question)
+        return self.finish()
+
+def split_tier(json_path: str, dest_dir: str = None, block_size: int = DEFAULT_BLOCK_SIZE) -> Dict[str, Any]:
+    """Split an already converted tier file"""
+    with open(json_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    questions = data.pop("questions", [])
+    splitter = TierSplitter(dest_dir or os.path.dirname(json_path) or ".", os.path.basename(json_path),
+                            data, block_size)
+    return splitter.split(questions)
+
+def split_outputs(output_dir: str) -> List[str]:
+    """Names of the summary and detail files in a directory, summaries first"""
+    if not os.path.isdir(output_dir):
+        return []
+    names = [name for name in sorted(os.listdir(output_dir)) if SPLIT_FILE.match(name)]
+    return sorted(names, key=lambda name: ".details-" in name)
+
+if __name__ == "__main__":
+    from convert_csv_to_json import FILE_MAPPINGS
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "json_output"
+    block_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BLOCK_SIZE
+
+    for _, json_file, _ in FILE_MAPPINGS:
+        path = os.path.join(output_dir, json_file)
+        if os.path.exists(path):
+            result = split_tier(path, output_dir, block_size)
+            print(f"{json_file}: {os.path.getsize(path):,} bytes -> summary {result['bytes']:,} bytes "
+                  f"+ {result['blocks']} detail block(s)")
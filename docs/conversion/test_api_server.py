@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for api_server.py, run against a real instance on an ephemeral port
+
+Run from docs/conversion: python -m unittest test_api_server
+"""
+
+import asyncio
+import contextlib
+import gzip
+import http.client
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from api_server import self_check, start_server
+from convert_csv_to_json import convert_csv_to_json
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+class ApiServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_csv_to_json(os.path.join(HERE, "top_10_react_interview_questions.csv"),
+                                os.path.join(cls.tmp.name, "top-10-questions.json"), "Top 10")
+
+        cls.loop = asyncio.new_event_loop()
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.server = asyncio.run_coroutine_threadsafe(
+                start_server(cls.tmp.name, "127.0.0.1", 0), cls.loop).result(timeout=10)
+        cls.port = cls.server.sockets[0].getsockname()[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        asyncio.run_coroutine_threadsafe(cls.server.wait_closed(), cls.loop).result(timeout=10)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join(timeout=10)
+        cls.loop.close()
+        cls.tmp.cleanup()
+
+    def get(self, path, headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.request("GET", path, headers=headers or {})
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+
+    def test_matching_etag_returns_empty_304(self):
+        response, body = self.get("/api/questions?tier=top-10&perPage=3")
+        self.assertEqual(response.status, 200)
+        etag = response.getheader("ETag")
+        self.assertTrue(etag)
+
+        response, body = self.get("/api/questions?perPage=3&tier=top-10", {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(response.getheader("ETag"), etag)
+
+        response, _ = self.get("/api/questions?tier=top-10&perPage=3", {"If-None-Match": '"stale"'})
+        self.assertEqual(response.status, 200)
+
+    def test_gzip_only_when_accepted(self):
+        plain, plain_body = self.get("/api/questions?tier=top-10")
+        self.assertIsNone(plain.getheader("Content-Encoding"))
+        self.assertEqual(plain.getheader("Vary"), "Accept-Encoding")
+
+        zipped, zipped_body = self.get("/api/questions?tier=top-10", {"Accept-Encoding": "br, gzip"})
+        self.assertEqual(zipped.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(zipped_body), plain_body)
+        self.assertNotEqual(zipped.getheader("ETag"), plain.getheader("ETag"))
+
+        refused, _ = self.get("/api/questions?tier=top-10", {"Accept-Encoding": "gzip;q=0"})
+        self.assertIsNone(refused.getheader("Content-Encoding"))
+
+    def test_gzip_etag_revalidates(self):
+        headers = {"Accept-Encoding": "gzip"}
+        response, _ = self.get("/api/questions?tier=top-10", headers)
+        response, body = self.get("/api/questions?tier=top-10",
+                                  dict(headers, **{"If-None-Match": response.getheader("ETag")}))
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_self_check_passes(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(self_check(self.tmp.name), [])
+
+if __name__ == "__main__":
+    unittest.main()
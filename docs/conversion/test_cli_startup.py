@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Startup cost checks for cli.py: the quick subcommands must not pull in the
+converter, the API server or the heavy optional packages.
+
+Run from docs/conversion: python -m unittest test_cli_startup
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("asyncio", "api_server", "convert_csv_to_json", "plotly", "pandas", "numpy")
+
+def imported_modules(*argv: str) -> set:
+    """Top-level names of every module imported while running python -m cli argv"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "cli", *argv],
+                            cwd=HERE, capture_output=True, text=True)
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+class QuickCommandImportTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "top-10-questions.json")
+        with open(cls.path, 'w', encoding='utf-8') as file:
+            json.dump({"title": "Top 10", "questions": []}, file)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def assert_light(self, *argv: str):
+        modules = imported_modules(*argv)
+        self.assertIn("validate_questions", modules, "importtime output was not captured")
+        self.assertFalse(modules.intersection(HEAVY_MODULES),
+                         f"cli {argv[0]} imported {sorted(modules.intersection(HEAVY_MODULES))}")
+
+    def test_validate(self):
+        self.assert_light("validate", self.path)
+
+    def test_stats(self):
+        self.assert_light("stats", self.path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the link handling in markdown_render.py
+
+Run from docs/conversion: python -m unittest test_markdown_render
+"""
+
+import unittest
+
+from markdown_render import render_inline
+
+
+class SafeLinkTests(unittest.TestCase):
+    def test_local_and_http_links_are_kept(self):
+        for url in ("https://react.dev/learn", "http://example.com", "/docs/hooks", "./hooks.html", "#state"):
+            with self.subTest(url=url):
+                self.assertEqual(render_inline(f"[docs]({url})"), f'<a href="{url}" rel="noopener">docs</a>')
+
+    def test_protocol_relative_links_are_dropped(self):
+        for url in ("//evil.example/a", "/\\evil.example/a"):
+            with self.subTest(url=url):
+                self.assertEqual(render_inline(f"[docs]({url})"), "docs")
+
+    def test_script_links_are_dropped(self):
+        self.assertEqual(render_inline("[click](javascript:void)"), "click")
+        self.assertEqual(render_inline("[click](JaVaScRiPt:alert)"), "click")
+
+    def test_escaped_quote_stays_inside_the_attribute(self):
+        self.assertEqual(render_inline('[x](/a"onmouseover="b)'),
+                         '<a href="/a&quot;onmouseover=&quot;b" rel="noopener">x</a>')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Checks that pipeline.json declares what each stage depends on and writes,
+so a stamp only stays fresh when nothing behind the stage changed.
+
+Run from docs/conversion: python -m unittest test_pipeline
+"""
+
+import ast
+import math
+import os
+import re
+import unittest
+
+from pipeline import load_pipeline
+from summary_split import DEFAULT_BLOCK_SIZE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_DIRS = (HERE, os.path.dirname(HERE))
+
+def _script_path(module: str):
+    for directory in SCRIPT_DIRS:
+        path = os.path.join(directory, module + ".py")
+        if os.path.exists(path):
+            return os.path.normpath(path)
+    return None
+
+def _imported(statements) -> list:
+    names = []
+    for node in statements:
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.append(node.module)
+        elif isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+    return names
+
+def script_closure(modules) -> set:
+    """Paths of the local scripts modules import at module level, transitively"""
+    found, pending = set(), list(modules)
+    while pending:
+        path = _script_path(pending.pop())
+        if path and path not in found:
+            found.add(path)
+            with open(path, 'r', encoding='utf-8') as file:
+                pending.extend(_imported(ast.parse(file.read()).body))
+    return found
+
+def action_modules() -> dict:
+    """Local modules imported inside each pipeline_tasks action"""
+    with open(os.path.join(HERE, "pipeline_tasks.py"), 'r', encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    return {node.name: [name for name in _imported(ast.walk(node)) if _script_path(name)]
+            for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+class PipelineDeclarationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.stages, _ = load_pipeline()
+        cls.modules = action_modules()
+
+    def test_stages_declare_the_scripts_they_run(self):
+        for stage in self.stages:
+            with self.subTest(stage=stage.name):
+                function = stage.action.split(":", 1)[1]
+                missing = script_closure(self.modules[function]) - set(stage.inputs)
+                self.assertFalse(missing, f"undeclared script(s): {sorted(os.path.relpath(p, HERE) for p in missing)}")
+
+    def test_split_declares_every_detail_block(self):
+        split = next(stage for stage in self.stages if stage.name == "split")
+        block_size = split.args.get("block_size", DEFAULT_BLOCK_SIZE)
+        outputs = {os.path.basename(path) for path in split.outputs}
+        for path in split.inputs:
+            match = re.match(r"top-(\d+)-questions\.json$", os.path.basename(path))
+            if not match:
+                continue
+            count = int(match.group(1))
+            expected = {f"top-{count}.details-{block}.json" for block in range(math.ceil(count / block_size))}
+            with self.subTest(tier=count):
+                self.assertLessEqual(expected, outputs)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Memoized Text Normalization for the CSV to JSON Conversion Tool
+Computes the cleaned and lowercased form of each distinct string once.
+Tier CSVs repeat a lot of text (categories, difficulties and the shared
+leading questions), so a bounded LRU cache avoids redoing the regex and
+lowercasing work for every copy.
+"""
+
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Any
+
+DEFAULT_CACHE_SIZE = 4096
+
+_WHITESPACE = re.compile(r'\s+')
+
+def clean_text_uncached(text: str) -> str:
+    """Clean and format text content"""
+    if not text:
+        return ""
+
+    # Remove extra whitespace and normalize line breaks
+    text = _WHITESPACE.sub(' ', text.strip())
+
+    # Fix common encoding issues
+    text = text.replace('\"', '"')
+    text = text.replace('\n', '\n')
+
+    return text
+
+class TextNormalizer:
+    """Bounded LRU caches for cleaned and lowercased strings, with hit-rate stats"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.clean = lru_cache(maxsize=maxsize)(clean_text_uncached)
+        self.lower = lru_cache(maxsize=maxsize)(str.lower)
+
+    def clear(self) -> None:
+        self.clean.cache_clear()
+        self.lower.cache_clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for name, cached in (("clean", self.clean), ("lower", self.lower)):
+            info = cached.cache_info()
+            calls = info.hits + info.misses
+            result[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "hitRate": round(info.hits / calls, 4) if calls else 0.0
+            }
+        return result
+
+# Shared normalizer used by the converter and enrichment functions
+NORMALIZER = TextNormalizer()
+
+def benchmark(repeat: int = 20, input_dir: str = ".") -> Dict[str, Any]:
+    """
+    Run the enrichment functions over every tier CSV repeat times, once with
+    the shared cache and once with caching disabled, and compare the work done
+    """
+    import csv
+    import os
+    import time
+    import convert_csv_to_json as converter
+    from convert_csv_to_json import FILE_MAPPINGS
+    from rule_engine import load_rules
+
+    rows = []
+    for csv_file, _, _ in FILE_MAPPINGS:
+        path = os.path.join(input_dir, csv_file)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                rows.extend(csv.DictReader(file))
+    rows *= repeat
+
+    def run(normalizer: TextNormalizer) -> float:
+        # The rule engine lowercases through its own normalizer, so it is swapped too
+        converter.NORMALIZER = normalizer
+        converter.RULES = load_rules(normalizer=normalizer)
+        started = time.perf_counter()
+        for row in rows:
+            question = converter.clean_text(row['question'])
+            answer = converter.clean_text(row['answer'])
+            converter.clean_text(row['category'])
+            converter.clean_text(row['difficulty'])
+            converter.extract_code_example(answer)
+            converter.generate_key_points(answer, question)
+            converter.generate_follow_up_questions(question, row['category'], row['difficulty'])
+        return time.perf_counter() - started
+
+    original = converter.NORMALIZER, converter.RULES
+    try:
+        uncached = TextNormalizer(maxsize=0)
+        uncached_seconds = run(uncached)
+        cached = TextNormalizer()
+        cached_seconds = run(cached)
+    finally:
+        converter.NORMALIZER, converter.RULES = original
+
+    stats = cached.stats()
+    return {
+        "rows": len(rows),
+        "uncachedSeconds": round(uncached_seconds, 4),
+        "cachedSeconds": round(cached_seconds, 4),
+        "speedup": round(uncached_seconds / cached_seconds, 2) if cached_seconds else None,
+        "normalizationsComputed": {name: s["misses"] for name, s in stats.items()},
+        "normalizationsSaved": {name: s["hits"] for name, s in stats.items()},
+        "cache": stats
+    }
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    result = benchmark(repeat)
+    print(f"Enriched {result['rows']:,} rows")
+    print(f"   Uncached: {result['uncachedSeconds']:.3f}s")
+    print(f"   Cached:   {result['cachedSeconds']:.3f}s ({result['speedup']}x)")
+    for name, s in result["cache"].items():
+        print(f"   {name}: {s['misses']:,} computed, {s['hits']:,} reused (hit rate {s['hitRate']:.1%})")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Score-Driven Tier Builder
+Streams a question bank (a CSV export of the `questions` table, or a tier CSV
+in the converter's format) and keeps one bounded min-heap of the highest
+scoring questions. The Top 10/20/50/100 tiers are prefixes of that ranking,
+so a single pass emits tier-system.json and the rank-ordered tier CSVs that
+convert_csv_to_json.py consumes.
+"""
+
+import csv
+import heapq
+import json
+import os
+import sys
+import time
+from typing import List, Dict, Any, Callable, Iterable, Tuple
+
+from convert_csv_to_json import FILE_MAPPINGS
+
+# Defaults match the column defaults in supabase/migrations/003_confidence_tracking.sql
+COLUMN_DEFAULTS = {"frequency_score": 50, "importance_level": 3}
+
+# frequency_score is 0-100 and importance_level 1-5, so importance is scaled to a comparable range
+DEFAULT_WEIGHTS = {"frequency_score": 1.0, "importance_level": 10.0}
+
+TIER_DEFINITIONS = [
+    {"key": "essential", "size": 10, "name": "Essential Top 10",
+     "description": "Must-know questions for any React interview",
+     "difficulty": "Beginner to Intermediate", "estimatedTime": "30-45 minutes"},
+    {"key": "core", "size": 20, "name": "Core Top 20",
+     "description": "Comprehensive foundation for React mastery",
+     "difficulty": "Intermediate", "estimatedTime": "60-90 minutes"},
+    {"key": "advanced", "size": 50, "name": "Advanced Top 50",
+     "description": "Deep dive into React patterns and optimization",
+     "difficulty": "Intermediate to Advanced", "estimatedTime": "2-3 hours"},
+    {"key": "expert", "size": 100, "name": "Expert Top 100",
+     "description": "Comprehensive mastery for senior positions",
+     "difficulty": "Advanced to Expert", "estimatedTime": "4-6 hours"},
+]
+
+TIER_CSV_FIELDS = ["rank", "question", "answer", "difficulty", "category"]
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """Parse 'frequency_score=1,importance_level=10' into a weights dict"""
+    weights = {}
+    for part in spec.split(','):
+        if part.strip():
+            column, _, weight = part.partition('=')
+            weights[column.strip()] = float(weight) if weight else 1.0
+    return weights
+
+def make_score(weights: Dict[str, float]) -> Callable[[Dict[str, str]], float]:
+    """Build a row -> score function from column weights"""
+    columns = [(column, weight, COLUMN_DEFAULTS.get(column, 0)) for column, weight in weights.items()]
+
+    def score(row: Dict[str, str]) -> float:
+        total = 0.0
+        for column, weight, default in columns:
+            value = row.get(column)
+            total += weight * (float(value) if value not in (None, "") else default)
+        return total
+
+    return score
+
+def select_top(rows: Iterable[Dict[str, str]], k: int,
+               score: Callable[[Dict[str, str]], float]) -> Tuple[List[Tuple[float, Dict[str, str]]], int]:
+    """
+    Return the k highest scoring rows, best first, and the number of rows seen
+
+    Only k rows are held at once. Ties go to the row that appeared first.
+    """
+    heap = []
+    seen = 0
+    for seen, row in enumerate(rows, 1):
+        entry = (score(row), -seen, row)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    ranked = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+    return [(entry[0], entry[2]) for entry in ranked], seen
+
+def build_tiers(bank_path: str, output_dir: str = ".", tier_system_path: str = "tier-system.json",
+                weights: Dict[str, float] = None) -> Dict[str, Any]:
+    """
+    Rank a question bank and write tier-system.json plus one CSV per tier
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    sizes = sorted(tier["size"] for tier in TIER_DEFINITIONS)
+    started = time.perf_counter()
+
+    with open(bank_path, 'r', encoding='utf-8', newline='') as file:
+        ranked, total_rows = select_top(csv.DictReader(file), sizes[-1], make_score(weights))
+
+    os.makedirs(output_dir, exist_ok=True)
+    csv_names = {int(title.split()[-1]): csv_file for csv_file, _, title in FILE_MAPPINGS}
+
+    # Each tier is a prefix of the overall ranking
+    tiers = {}
+    for tier in TIER_DEFINITIONS:
+        members = ranked[:tier["size"]]
+        csv_path = os.path.join(output_dir, csv_names.get(tier["size"], f"top_{tier['size']}_questions.csv"))
+        with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=TIER_CSV_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for rank, (_, row) in enumerate(members, 1):
+                writer.writerow({**row, "rank": rank})
+
+        entry = tiers[tier["key"]] = {
+            "name": tier["name"],
+            "description": tier["description"],
+            "difficulty": tier["difficulty"],
+            "estimatedTime": tier["estimatedTime"],
+            "questions": list(range(1, len(members) + 1)),
+            "minScore": members[-1][0] if members else None
+        }
+        source_ids = [row["id"] for _, row in members if row.get("id")]
+        if source_ids:
+            entry["sourceIds"] = source_ids
+
+    tier_system = {
+        "metadata": {
+            "title": "React Interview Questions - Tiered System",
+            "description": "Structured learning path with difficulty progression",
+            "totalQuestions": len(ranked),
+            "lastUpdated": time.strftime("%Y-%m-%d"),
+            "scoring": {"weights": weights, "bankSize": total_rows}
+        },
+        "tiers": tiers
+    }
+    with open(tier_system_path, 'w', encoding='utf-8') as file:
+        json.dump(tier_system, file, indent=2, ensure_ascii=False)
+
+    elapsed = time.perf_counter() - started
+    print(f"Ranked {total_rows:,} questions in {elapsed:.2f}s")
+    for tier in TIER_DEFINITIONS:
+        print(f"   {tier['name']}: min score {tiers[tier['key']]['minScore']}")
+    print(f"Tier system written to {tier_system_path}")
+    return tier_system
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python tier_builder.py <questions.csv> [output_dir] [tier-system.json] [weights]")
+        sys.exit(1)
+
+    build_tiers(
+        sys.argv[1],
+        sys.argv[2] if len(sys.argv) > 2 else ".",
+        sys.argv[3] if len(sys.argv) > 3 else "tier-system.json",
+        parse_weights(sys.argv[4]) if len(sys.argv) > 4 else None
+    )
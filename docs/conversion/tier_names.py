@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Tier File Names
+Naming shared by the converter's downstream tools. Kept free of imports
+beyond the standard library, so cheap commands (validate, stats) can
+recognise tier and split files without loading the converter or the API
+server.
+"""
+
+import os
+import re
+
+# Matches the summary and detail files summary_split.py writes
+SPLIT_FILE = re.compile(r"^(?P<tier>.+)\.(summary|details-\d+)\.json$")
+
+def tier_key(json_file: str) -> str:
+    """'top-10-questions.json' -> 'top-10'"""
+    stem = os.path.splitext(json_file)[0]
+    return stem[:-len("-questions")] if stem.endswith("-questions") else stem
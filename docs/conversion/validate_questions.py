@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Validation for Converted Question Files
+Checks generated JSON files against the structure the React application expects
+"""
+
+import json
+import sys
+from typing import List, Dict, Any
+
+from question_model import load_questions
+
+REQUIRED_FIELDS = ["id", "question", "difficulty", "category", "answer"]
+VALID_DIFFICULTIES = {"Beginner", "Intermediate", "Advanced"}
+
+def validate_question_data(data: Dict[str, Any]) -> List[str]:
+    """Return a list of problems found in a question file's data"""
+    errors = []
+
+    questions = data.get("questions")
+    if not isinstance(questions, list):
+        return ["Missing 'questions' list"]
+
+    if "totalQuestions" in data and data["totalQuestions"] != len(questions):
+        errors.append(f"totalQuestions is {data['totalQuestions']} but file has {len(questions)} questions")
+
+    seen_ids = set()
+    for index, q in enumerate(questions):
+        label = q.get("id", f"#{index + 1}")
+        for field in REQUIRED_FIELDS:
+            if not q.get(field):
+                errors.append(f"{label}: missing '{field}'")
+        if q.get("id") in seen_ids:
+            errors.append(f"{label}: duplicate id")
+        seen_ids.add(q.get("id"))
+        if q.get("difficulty") and q["difficulty"] not in VALID_DIFFICULTIES:
+            errors.append(f"{label}: unknown difficulty '{q['difficulty']}'")
+        code_example = q.get("codeExample")
+        if code_example is not None and not code_example.get("code"):
+            errors.append(f"{label}: codeExample has no code")
+
+    return errors
+
+def validate_file(path: str) -> List[str]:
+    """Validate a converted JSON file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return [f"File {path} not found"]
+    except json.JSONDecodeError as e:
+        return [f"Invalid JSON: {str(e)}"]
+
+    return validate_question_data(data)
+
+def file_stats(path: str) -> Dict[str, Any]:
+    """Summarize a converted JSON file"""
+    questions = load_questions(path)
+
+    categories = {}
+    difficulties = {}
+    for q in questions:
+        categories[q.category] = categories.get(q.category, 0) + 1
+        difficulties[q.difficulty] = difficulties.get(q.difficulty, 0) + 1
+
+    return {
+        "questions": len(questions),
+        "withCodeExample": sum(1 for q in questions if q.code_example),
+        "categories": categories,
+        "difficulties": difficulties
+    }
+
+if __name__ == "__main__":
+    failed = False
+    for path in sys.argv[1:]:
+        errors = validate_file(path)
+        if errors:
+            failed = True
+            print(f"{path}: {len(errors)} problem(s)")
+            for error in errors:
+                print(f"   - {error}")
+        else:
+            print(f"{path}: OK")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Watch Mode for the CSV to JSON Conversion Tool
+Polls the input directory, debounces bursts of saves, reconverts only the
+sources that changed, copies them into the directory pages fetch data/ from
+and tells open pages over Server-Sent Events that their data is stale.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+from convert_csv_to_json import FILE_MAPPINGS, convert_csv_to_json
+from publish_assets import DEFAULT_DEST_DIR, MANIFEST_NAME, fingerprint
+from summary_split import split_outputs
+from tier_names import SPLIT_FILE, tier_key
+
+DEFAULT_PORT = 35729
+POLL_INTERVAL = 0.25
+DEBOUNCE_SECONDS = 0.4
+HEARTBEAT_SECONDS = 15
+
+class EventBroadcaster:
+    """Fan out events to every connected SSE client"""
+
+    def __init__(self):
+        self._clients: List[queue.Queue] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        client = queue.Queue()
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def unsubscribe(self, client: queue.Queue) -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    def publish(self, event: str, data: Dict) -> int:
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        with self._lock:
+            for client in self._clients:
+                client.put(message)
+            return len(self._clients)
+
+def make_handler(broadcaster: EventBroadcaster):
+    """Build a request handler serving the /events stream"""
+
+    class LiveReloadHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/events':
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+
+            client = broadcaster.subscribe()
+            try:
+                self.wfile.write(b"retry: 1000\n\n")
+                self.wfile.flush()
+                while True:
+                    try:
+                        message = client.get(timeout=HEARTBEAT_SECONDS)
+                    except queue.Empty:
+                        message = ": heartbeat\n\n"
+                    self.wfile.write(message.encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                broadcaster.unsubscribe(client)
+
+        def log_message(self, format, *args):
+            pass
+
+    return LiveReloadHandler
+
+def start_event_server(broadcaster: EventBroadcaster, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """Start the SSE endpoint on a background thread"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(broadcaster))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def snapshot(paths: List[str]) -> Dict[str, Tuple[float, int]]:
+    """Record mtime and size for each existing source file"""
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime, stat.st_size)
+    return state
+
+def list_sources(input_dir: str) -> List[str]:
+    """Return the CSV tiers and markdown question files under input_dir"""
+    sources = [os.path.join(input_dir, csv_file) for csv_file, _, _ in FILE_MAPPINGS]
+    for name in sorted(os.listdir(input_dir)):
+        if name.endswith('.md') and name.startswith('questions'):
+            sources.append(os.path.join(input_dir, name))
+    return sources
+
+def convert_markdown(md_path: str, output_dir: str) -> str:
+    """Convert a markdown question file using scripts/parse_questions.py"""
+    scripts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts')
+    if scripts_dir not in sys.path:
+        sys.path.append(scripts_dir)
+    from parse_questions import parse_blocks
+
+    with open(md_path, 'r', encoding='utf-8') as f:
+        questions = parse_blocks(f.read())
+
+    json_file = os.path.splitext(os.path.basename(md_path))[0] + '.json'
+    output = {
+        "title": f"Top {len(questions)} React Interview Questions",
+        "description": "A comprehensive set of React interview questions with categories, code and key points.",
+        "questions": questions
+    }
+    with open(os.path.join(output_dir, json_file), 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    return json_file
+
+def rebuild(changed: List[str], output_dir: str) -> List[str]:
+    """Reconvert only the changed sources and return the regenerated files, summary and detail blocks included"""
+    mappings = {csv_file: (json_file, title) for csv_file, json_file, title in FILE_MAPPINGS}
+    regenerated = []
+
+    for path in changed:
+        name = os.path.basename(path)
+        if not os.path.exists(path):
+            print(f"Source removed: {name}")
+            continue
+        try:
+            if name in mappings:
+                json_file, title_prefix = mappings[name]
+                convert_csv_to_json(path, os.path.join(output_dir, json_file), title_prefix, split_dir=output_dir)
+                regenerated.append(json_file)
+                regenerated.extend(split_file for split_file in split_outputs(output_dir)
+                                   if SPLIT_FILE.match(split_file).group("tier") == tier_key(json_file))
+            elif name.endswith('.md'):
+                regenerated.append(convert_markdown(path, output_dir))
+        except Exception as e:
+            print(f"Error rebuilding {name}: {str(e)}")
+
+    return regenerated
+
+def serve_files(output_dir: str, data_dir: str, files: List[str], url_prefix: str = "/data/") -> None:
+    """
+    Copy regenerated files into the served data directory under their own
+    names. A published asset manifest there would keep sending pages to the
+    hashed copies of the last release, so its entries for these files are
+    pointed at the fresh copies until the next publish.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    for name in files:
+        target = os.path.join(data_dir, name)
+        shutil.copyfile(os.path.join(output_dir, name), target + ".tmp")
+        os.replace(target + ".tmp", target)
+
+    manifest_path = os.path.join(data_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    assets = manifest.setdefault("assets", {})
+    revisions = {}
+    for name in files:
+        info = fingerprint(os.path.join(data_dir, name))
+        assets[name] = {"url": url_prefix + name, "size": info["size"], "integrity": info["integrity"]}
+        revisions[url_prefix + name] = info["hash"]
+    # Unhashed URLs change content, so precaching needs a revision for them
+    manifest["precache"] = [{"url": asset["url"], "revision": revisions.get(asset["url"]),
+                             "integrity": asset["integrity"]} for asset in assets.values()]
+    with open(manifest_path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+def watch(input_dir: str = ".", output_dir: str = "json_output", port: int = DEFAULT_PORT,
+          poll_interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE_SECONDS,
+          data_dir: str = DEFAULT_DEST_DIR) -> None:
+    """
+    Watch input_dir and rebuild changed sources until interrupted; rebuilt
+    files are also copied into data_dir, which pages fetch data/ from
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    broadcaster = EventBroadcaster()
+    server = start_event_server(broadcaster, port)
+    print(f"Live-reload events on http://127.0.0.1:{port}/events")
+    print(f"Watching {os.path.abspath(input_dir)} (Ctrl+C to stop)")
+
+    state = snapshot(list_sources(input_dir))
+    pending = set()
+    last_change = 0.0
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = snapshot(list_sources(input_dir))
+
+            changed = {path for path in set(state) | set(current) if state.get(path) != current.get(path)}
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            state = current
+
+            # Wait for the burst of saves to settle before rebuilding
+            if pending and time.monotonic() - last_change >= debounce:
+                started = time.perf_counter()
+                regenerated = rebuild(sorted(pending), output_dir)
+                pending.clear()
+                if regenerated:
+                    serve_files(output_dir, data_dir, regenerated)
+
+                if regenerated:
+                    elapsed = time.perf_counter() - started
+                    clients = broadcaster.publish('stale', {"files": regenerated})
+                    print(f"Rebuilt {', '.join(regenerated)} in {elapsed:.2f}s "
+                          f"(notified {clients} page(s))")
+    except KeyboardInterrupt:
+        print("\nStopping watch mode")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    input_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else "json_output"
+    data_dir = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_DEST_DIR
+    watch(input_dir, output_dir, data_dir=data_dir)
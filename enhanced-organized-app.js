@@ -50,24 +50,31 @@ class EnhancedOrganizedApp {
     // =========================
 
     async loadAllData() {
+        // Logical names; DataService.dataUrl maps them to the published (hashed) copies
         const dataFiles = [
-            { file: 'data/top-10-questions.json', key: 'top10' },
-            { file: 'data/top-20-questions.json', key: 'top20' },
-            { file: 'data/top-50-questions.json', key: 'top50' },
-            { file: 'data/top-100-questions.json', key: 'top100' },
-            { file: 'data/flashcards.json', key: 'flashcards' },
-            { file: 'data/challenges.json', key: 'challenges' },
-            { file: 'data/enhanced-questions.json', key: 'enhanced' },
-            { file: 'data/enhanced-interview-system.json', key: 'interview_system' },
-            { file: 'data/react-interview-questions-complete.json', key: 'complete' },
-            { file: 'data/tier-system.json', key: 'tiers' }
+            // Tiers load their compact summary; answers come from detail blocks when opened
+            { file: 'top-10-questions.json', tier: 10, key: 'top10' },
+            { file: 'top-20-questions.json', tier: 20, key: 'top20' },
+            { file: 'top-50-questions.json', tier: 50, key: 'top50' },
+            { file: 'top-100-questions.json', tier: 100, key: 'top100' },
+            { file: 'flashcards.json', key: 'flashcards' },
+            { file: 'challenges.json', key: 'challenges' },
+            { file: 'enhanced-questions.json', key: 'enhanced' },
+            { file: 'enhanced-interview-system.json', key: 'interview_system' },
+            { file: 'react-interview-questions-complete.json', key: 'complete' },
+            { file: 'tier-system.json', key: 'tiers' }
         ];
 
-        const loadPromises = dataFiles.map(async ({ file, key }) => {
+        const loadFile = async (file) => {
+            const response = await fetch(await DataService.dataUrl(file));
+            return response.ok ? response.json() : null;
+        };
+
+        const loadPromises = dataFiles.map(async ({ file, tier, key }) => {
             try {
-                const response = await fetch(file);
-                if (response.ok) {
-                    const data = await response.json();
+                // DataService falls back to the full tier file when no summary is published
+                const data = tier ? await DataService.fetchTierSummary(tier) : await loadFile(file);
+                if (data) {
                     this.allQuestionsData[key] = data;
                     console.log(`✓ Loaded ${file}:`, {
                         hasQuestions: !!data.questions,
@@ -671,8 +678,28 @@ class EnhancedOrganizedApp {
                     </div>
                     
                     <div class="answer-content" id="${answerId}" style="display: none;">
+                        ${this.renderAnswerContent(question)}
+                    </div>
+                </div>
+                
+                <div class="question-footer">
+                    <button class="completion-btn ${isCompleted ? 'completed' : ''}" 
+                            onclick="app.toggleComplete('${question.id}')">
+                        ${isCompleted ? '✓ Completed' : '○ Mark Complete'}
+                    </button>
+                </div>
+            </div>
+        `;
+    }
+
+    renderAnswerContent(question) {
+        if (this.needsDetails(question)) {
+            return '<div class="answer-text">Loading answer...</div>';
+        }
+
+        return `
                         <div class="answer-text">
-                            ${question.answer || 'Answer not available'}
+                            ${question.answerHtml || question.answer || 'Answer not available'}
                         </div>
                         
                         ${question.codeExample ? `
@@ -684,7 +711,9 @@ class EnhancedOrganizedApp {
                                     </button>
                                 </div>
                                 <div class="code-content">
-                                    <pre><code class="language-javascript" id="code-${question.id}">${question.codeExample.code || question.codeExample}</code></pre>
+                                    ${question.codeExample.html
+                                        ? `<pre><code class="hljs language-jsx" data-highlighted="yes" id="code-${question.id}">${question.codeExample.html}</code></pre>`
+                                        : `<pre><code class="language-javascript" id="code-${question.id}">${question.codeExample.code || question.codeExample}</code></pre>`}
                                 </div>
                             </div>
                         ` : ''}
@@ -693,7 +722,7 @@ class EnhancedOrganizedApp {
                             <div class="key-points">
                                 <h4>Key Points:</h4>
                                 <ul>
-                                    ${question.keyPoints.map(point => `<li>${point}</li>`).join('')}
+                                    ${(question.keyPointsHtml || question.keyPoints).map(point => `<li>${point}</li>`).join('')}
                                 </ul>
                             </div>
                         ` : ''}
@@ -706,25 +735,34 @@ class EnhancedOrganizedApp {
                                 </ul>
                             </div>
                         ` : ''}
-                    </div>
-                </div>
-                
-                <div class="question-footer">
-                    <button class="completion-btn ${isCompleted ? 'completed' : ''}" 
-                            onclick="app.toggleComplete('${question.id}')">
-                        ${isCompleted ? '✓ Completed' : '○ Mark Complete'}
-                    </button>
-                </div>
-            </div>
         `;
     }
 
+    // Questions from a tier summary carry a detail block number instead of their answer
+    needsDetails(question) {
+        return DataService.needsDetails(question);
+    }
+
+    async loadQuestionDetails(question) {
+        const summary = this.allQuestionsData[question.source];
+        if (!this.needsDetails(question) || !summary?.blocks) {
+            return question;
+        }
+        // Blocks are cached by DataService, so neighbouring questions share one request
+        return Object.assign(question, await DataService.fetchQuestionDetails(summary, question));
+    }
+
     // =========================
     // INTERACTION HANDLERS
     // =========================
 
-    toggleAnswer(questionId) {
+    async toggleAnswer(questionId) {
         const answerElement = document.getElementById(`answer-${questionId}`);
+        const question = this.findQuestionById(questionId);
+        if (answerElement.style.display === 'none' && question && this.needsDetails(question)) {
+            await this.loadQuestionDetails(question);
+            answerElement.innerHTML = this.renderAnswerContent(question);
+        }
         const expandBtn = answerElement.parentElement.querySelector('.expand-btn');
         const expandIcon = expandBtn.querySelector('.expand-icon');
         const expandText = expandBtn.querySelector('.expand-text');
@@ -735,10 +773,12 @@ class EnhancedOrganizedApp {
             expandText.textContent = 'Hide Answer';
             expandBtn.classList.add('expanded');
             
-            // Highlight code blocks
-            answerElement.querySelectorAll('pre code').forEach((block) => {
-                hljs.highlightElement(block);
-            });
+            // Highlight code blocks the build did not already highlight
+            if (typeof hljs !== 'undefined') {
+                answerElement.querySelectorAll('pre code:not([data-highlighted])').forEach((block) => {
+                    hljs.highlightElement(block);
+                });
+            }
         } else {
             answerElement.style.display = 'none';
             expandIcon.style.transform = 'rotate(0deg)';
@@ -776,9 +816,10 @@ class EnhancedOrganizedApp {
         this.updateQuestionCardState(questionId);
     }
 
-    copyQuestion(questionId) {
+    async copyQuestion(questionId) {
         const question = this.findQuestionById(questionId);
         if (question) {
+            await this.loadQuestionDetails(question);
             const text = `Q: ${question.question}\n\nA: ${question.answer || 'Answer not provided'}`;
             navigator.clipboard.writeText(text).then(() => {
                 this.showToast('Question copied to clipboard', 'success');
@@ -9,14 +9,14 @@ class QuestionDataLoader {
   constructor() {
     this.cache = new Map();
     this.dataFiles = [
-      'data/top-10-questions.json',
-      'data/top-20-questions.json', 
-      'data/top-50-questions.json',
-      'data/top-100-questions.json',
-      'data/flashcards.json',
-      'data/challenges.json',
-      'data/enhanced-questions.json',
-      'data/react-interview-questions-complete.json'
+      'top-10-questions.json',
+      'top-20-questions.json', 
+      'top-50-questions.json',
+      'top-100-questions.json',
+      'flashcards.json',
+      'challenges.json',
+      'enhanced-questions.json',
+      'react-interview-questions-complete.json'
     ];
   }
 
@@ -24,10 +24,10 @@ class QuestionDataLoader {
     const loadedData = {};
     const loadPromises = this.dataFiles.map(async (file) => {
       try {
-        const response = await fetch(file);
+        const response = await fetch(await DataService.dataUrl(file));
         if (response.ok) {
           const data = await response.json();
-          const fileName = file.split('/')[1].replace('.json', '');
+          const fileName = file.replace('.json', '');
           loadedData[fileName] = data;
         }
       } catch (error) {
@@ -331,7 +331,7 @@ function QuestionCard({ question, expanded, onToggle, questionIndex }) {
         React.createElement('h4', {}, 'Expert Answer:'),
         React.createElement('p', {
           dangerouslySetInnerHTML: {
-            __html: question.answer?.replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>') || 'Answer not available'
+            __html: question.answerHtml || question.answer?.replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>') || 'Answer not available'
           }
         })
       ),
@@ -339,18 +339,27 @@ function QuestionCard({ question, expanded, onToggle, questionIndex }) {
       question.codeExample && React.createElement('div', { className: 'code-section' },
         React.createElement('h4', {}, 'Code Example:'),
         React.createElement('pre', {},
-          React.createElement('code', { className: 'language-javascript' },
-            question.codeExample.code || question.codeExample
-          )
+          question.codeExample.html
+            ? React.createElement('code', {
+                className: 'hljs language-jsx',
+                dangerouslySetInnerHTML: { __html: question.codeExample.html }
+              })
+            : React.createElement('code', { className: 'language-javascript' },
+                question.codeExample.code || question.codeExample
+              )
         )
       ),
       
       question.keyPoints && question.keyPoints.length > 0 && React.createElement('div', { className: 'key-points' },
         React.createElement('h4', {}, 'Key Points:'),
         React.createElement('ul', {},
-          question.keyPoints.map((point, index) =>
-            React.createElement('li', { key: index }, point)
-          )
+          question.keyPointsHtml
+            ? question.keyPointsHtml.map((point, index) =>
+                React.createElement('li', { key: index, dangerouslySetInnerHTML: { __html: point } })
+              )
+            : question.keyPoints.map((point, index) =>
+                React.createElement('li', { key: index }, point)
+              )
         )
       ),
       
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Hot-Query Benchmark against a Local Postgres
+For each data size, creates a throwaway database, applies
+supabase/migrations/*.sql on top of a minimal stand-in for Supabase's auth
+schema, bulk-loads generate_load_data.py output and runs the app's hot
+queries (the reads and upserts in config/supabase.js and the
+003_confidence_tracking views and triggers) from concurrent clients.
+
+Queries run the way PostgREST runs them: as the authenticated role, with
+request.jwt.claim.sub set per transaction, so RLS policies and triggers are
+part of every measurement. Per size it reports p50/p95/p99 latency per
+query, captures EXPLAIN (ANALYZE, BUFFERS) for each (writes are rolled
+back), flags sequential scans of per-user tables, and lists the indexes
+the migrations declare that failed to build or were never used.
+
+    python benchmark_queries.py "postgresql://postgres@localhost/postgres" 1000 10000 100000
+
+Connect as a superuser of a local server you do not mind writing to: it
+drops and recreates the query_bench_<users> databases. Needs psycopg 3 and
+psql on PATH.
+"""
+
+import glob
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple
+
+import psycopg
+from psycopg import sql
+from psycopg.conninfo import make_conninfo
+
+from generate_load_data import generate_load_data
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS = os.path.join(REPO_ROOT, "supabase", "migrations", "*.sql")
+DATABASE_PREFIX = "query_bench_"
+DEFAULT_CLIENTS = 8
+DEFAULT_DURATION = 30
+WARMUP_SECONDS = 3
+SAMPLE_USERS = 2000
+
+# Just enough of Supabase's auth schema for the migrations and RLS policies
+AUTH_STUB = """
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+CREATE SCHEMA IF NOT EXISTS auth;
+CREATE TABLE IF NOT EXISTS auth.users (
+  id UUID PRIMARY KEY,
+  email TEXT,
+  raw_user_meta_data JSONB DEFAULT '{}'
+);
+CREATE OR REPLACE FUNCTION auth.uid() RETURNS UUID LANGUAGE sql STABLE AS $$
+  SELECT NULLIF(current_setting('request.jwt.claim.sub', true), '')::uuid
+$$;
+DO $$ BEGIN
+  CREATE ROLE authenticated NOLOGIN;
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+"""
+
+GRANTS = """
+GRANT USAGE ON SCHEMA public, auth TO authenticated;
+GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO authenticated;
+GRANT USAGE ON ALL SEQUENCES IN SCHEMA public TO authenticated;
+"""
+
+# Tables with rows per user; a sequential scan of one of these grows with the user base
+PER_USER_TABLES = {"profiles", "user_stats", "study_sessions", "user_question_progress",
+                   "user_flashcard_progress", "spaced_repetition_data"}
+
+# Name, relative frequency, statement; parameters come from _params
+QUERIES = [
+    ("due_reviews", 20, """
+        SELECT s.flashcard_id, s.next_review, f.front, f.back
+        FROM spaced_repetition_data s JOIN flashcards f ON f.id = s.flashcard_id
+        WHERE s.user_id = %(user_id)s AND s.next_review <= NOW()
+        ORDER BY s.next_review LIMIT 20"""),
+    ("flashcard_progress", 15, """
+        SELECT p.*, f.id, f.front, f.back, f.difficulty
+        FROM user_flashcard_progress p LEFT JOIN flashcards f ON f.id = p.flashcard_id
+        WHERE p.user_id = %(user_id)s"""),
+    ("question_progress", 15, """
+        SELECT question_id, confidence_level, is_favorite, times_reviewed
+        FROM user_question_progress WHERE user_id = %(user_id)s"""),
+    ("tier_progress", 10, """
+        SELECT * FROM tier_progress_summary WHERE user_id = %(user_id)s"""),
+    # The reads of calculate_interview_readiness; its closing UPDATE needs the
+    # 003_confidence_tracking user_stats layout, which 002 has already claimed
+    ("readiness_score", 5, """
+        SELECT
+          (SELECT COALESCE(AVG(uqp.confidence_level), 0) FROM user_question_progress uqp
+           JOIN questions q ON q.id = uqp.question_id
+           WHERE uqp.user_id = %(user_id)s AND q.tier_id = 'top10') AS top10_confidence,
+          (SELECT COALESCE(AVG(uqp.confidence_level), 0) FROM user_question_progress uqp
+           JOIN questions q ON q.id = uqp.question_id
+           WHERE uqp.user_id = %(user_id)s AND q.tier_id = 'top20') AS top20_confidence,
+          (SELECT COUNT(*) FROM user_question_progress
+           WHERE user_id = %(user_id)s AND confidence_level > 0) AS total_studied"""),
+    ("user_stats", 10, """
+        SELECT * FROM user_stats WHERE user_id = %(user_id)s"""),
+    ("recent_sessions", 5, """
+        SELECT session_date, duration, session_type FROM study_sessions
+        WHERE user_id = %(user_id)s AND session_date >= CURRENT_DATE - 30
+        ORDER BY session_date DESC"""),
+    # Fires confidence_history_trigger and update_user_stats_trigger
+    ("confidence_upsert", 10, """
+        INSERT INTO user_question_progress (user_id, question_id, confidence_level)
+        VALUES (%(user_id)s, %(question_id)s, %(confidence)s)
+        ON CONFLICT (user_id, question_id)
+        DO UPDATE SET confidence_level = EXCLUDED.confidence_level, updated_at = NOW()"""),
+    # Fires update_stats_on_study, two UPDATEs of user_stats
+    ("study_session_insert", 5, """
+        INSERT INTO study_sessions (user_id, session_type, duration, items_studied, performance_score)
+        VALUES (%(user_id)s, 'flashcards', %(duration)s, 10, 0.75)"""),
+    # updateSpacedRepetitionData: read, calculate_next_review, upsert
+    ("flashcard_review", 5, """
+        WITH current_state AS (
+          SELECT ease_factor, interval_days, repetitions FROM spaced_repetition_data
+          WHERE user_id = %(user_id)s AND flashcard_id = %(flashcard_id)s
+          UNION ALL SELECT 2.50, 1, 0
+          LIMIT 1
+        ), next_state AS (
+          SELECT n.* FROM current_state c,
+            calculate_next_review(c.ease_factor, c.interval_days, c.repetitions, %(quality)s) n
+        )
+        INSERT INTO spaced_repetition_data (user_id, flashcard_id, ease_factor, interval_days, repetitions,
+                                            last_reviewed, next_review, updated_at)
+        SELECT %(user_id)s::uuid, %(flashcard_id)s::uuid, LEAST(new_ease_factor, 9.99), new_interval, new_repetitions,
+               NOW(), NOW() + make_interval(days => new_interval), NOW()
+        FROM next_state
+        ON CONFLICT (user_id, flashcard_id) DO UPDATE SET
+          ease_factor = EXCLUDED.ease_factor, interval_days = EXCLUDED.interval_days,
+          repetitions = EXCLUDED.repetitions, last_reviewed = EXCLUDED.last_reviewed,
+          next_review = EXCLUDED.next_review, updated_at = EXCLUDED.updated_at"""),
+]
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+def database_dsn(admin_dsn: str, users: int) -> Tuple[str, str]:
+    name = f"{DATABASE_PREFIX}{users}"
+    return name, make_conninfo(admin_dsn, dbname=name)
+
+def run_psql(dsn: str, path: str, stop_on_error: bool = True, cwd: Optional[str] = None) -> List[str]:
+    """Run a SQL file through psql and return the ERROR lines it printed"""
+    result = subprocess.run(
+        ["psql", "-X", "-q", "-v", f"ON_ERROR_STOP={int(stop_on_error)}", "-d", dsn, "-f", path],
+        cwd=cwd, capture_output=True, text=True)
+    errors = [line for line in result.stderr.splitlines() if "ERROR" in line]
+    if result.returncode != 0:
+        raise RuntimeError(f"psql -f {path} failed: {' '.join(errors) or result.stderr.strip()}")
+    return errors
+
+def prepare_database(admin_dsn: str, users: int, data_dir: str, seed: int, as_of: date) -> Dict[str, Any]:
+    """Recreate the size's database, apply the migrations and load the generated rows"""
+    name, dsn = database_dsn(admin_dsn, users)
+    with psycopg.connect(admin_dsn, autocommit=True) as admin:
+        admin.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(name)))
+        admin.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(AUTH_STUB)
+
+    # Applied like the Supabase CLI would, one file at a time; statements that
+    # fail on a fresh database are reported rather than fatal
+    migration_errors = {}
+    for path in sorted(glob.glob(MIGRATIONS)):
+        errors = run_psql(dsn, path, stop_on_error=False)
+        if errors:
+            migration_errors[os.path.basename(path)] = errors
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(GRANTS)
+
+    size_dir = os.path.join(data_dir, str(users))
+    manifest_path = os.path.join(size_dir, "manifest.json")
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    if not manifest or (manifest["users"], manifest["seed"], manifest["asOf"]) != (users, seed, as_of.isoformat()):
+        manifest = generate_load_data(size_dir, users, seed, as_of)
+
+    started = time.perf_counter()
+    run_psql(dsn, "load.sql", cwd=size_dir)
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute("VACUUM ANALYZE")
+    print(f"   Loaded {sum(manifest['rows'].values()):,} rows in {time.perf_counter() - started:.1f}s")
+
+    return {"database": name, "dsn": dsn, "rows": manifest["rows"], "migrationErrors": migration_errors}
+
+def load_sample(dsn: str, seed: int) -> Dict[str, List[str]]:
+    """Ids the clients draw parameters from"""
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute("SELECT setseed(%s)", [(seed % 1000) / 1000])
+        return {
+            "users": [str(row[0]) for row in conn.execute(
+                "SELECT id FROM profiles ORDER BY random() LIMIT %s", [SAMPLE_USERS])],
+            "flashcards": [str(row[0]) for row in conn.execute("SELECT id FROM flashcards")],
+            "questions": [row[0] for row in conn.execute("SELECT id FROM questions")],
+        }
+
+def _params(rng: random.Random, sample: Dict[str, List[str]]) -> Dict[str, Any]:
+    return {
+        "user_id": rng.choice(sample["users"]),
+        "flashcard_id": rng.choice(sample["flashcards"]),
+        "question_id": rng.choice(sample["questions"]),
+        "confidence": rng.randint(0, 5),
+        "quality": rng.randint(0, 5),
+        "duration": rng.randint(5, 90),
+    }
+
+def _connect_as_user(dsn: str) -> psycopg.Connection:
+    conn = psycopg.connect(dsn, autocommit=True)
+    conn.execute("SET ROLE authenticated")
+    return conn
+
+def _run_as(conn: psycopg.Connection, statement: str, params: Dict[str, Any]) -> float:
+    """Run one statement in its own transaction as params' user; returns milliseconds"""
+    with conn.transaction():
+        conn.execute("SELECT set_config('request.jwt.claim.sub', %s, true)", [params["user_id"]])
+        started = time.perf_counter()
+        cursor = conn.execute(statement, params)
+        if cursor.description:
+            cursor.fetchall()
+    # Commit (and, for writes, the WAL flush) is part of what the client waits for
+    return (time.perf_counter() - started) * 1000
+
+def _client(dsn: str, seed: int, sample: Dict[str, List[str]], warmup_until: float,
+            deadline: float) -> Tuple[Dict[str, List[float]], Dict[str, List[str]]]:
+    rng = random.Random(seed)
+    names = [name for name, _, _ in QUERIES]
+    weights = [weight for _, weight, _ in QUERIES]
+    statements = {name: statement for name, _, statement in QUERIES}
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, List[str]] = {name: [] for name in names}
+
+    with _connect_as_user(dsn) as conn:
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            name = rng.choices(names, weights)[0]
+            try:
+                elapsed = _run_as(conn, statements[name], _params(rng, sample))
+            except psycopg.Error as e:
+                errors[name].append(str(e).strip().splitlines()[0])
+                continue
+            if now >= warmup_until:
+                latencies[name].append(elapsed)
+    return latencies, errors
+
+def run_workload(dsn: str, sample: Dict[str, List[str]], clients: int, duration: int,
+                 seed: int) -> Dict[str, Dict[str, Any]]:
+    """Run the weighted query mix from concurrent clients and summarize latencies per query"""
+    warmup_until = time.perf_counter() + WARMUP_SECONDS
+    deadline = warmup_until + duration
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        futures = [pool.submit(_client, dsn, seed * 1000 + client, sample, warmup_until, deadline)
+                   for client in range(clients)]
+        results = [future.result() for future in futures]
+
+    summary = {}
+    for name, _, _ in QUERIES:
+        values = sorted(value for latencies, _ in results for value in latencies[name])
+        errors = [message for _, errors in results for message in errors[name]]
+        summary[name] = {
+            "calls": len(values),
+            "perSecond": round(len(values) / duration, 1),
+            "p50": round(percentile(values, 50), 3),
+            "p95": round(percentile(values, 95), 3),
+            "p99": round(percentile(values, 99), 3),
+            "max": round(values[-1], 3) if values else 0.0,
+            "errors": len(errors),
+            "firstError": errors[0] if errors else None,
+        }
+    return summary
+
+def capture_plans(dsn: str, sample: Dict[str, List[str]], seed: int) -> Dict[str, Dict[str, Any]]:
+    """EXPLAIN (ANALYZE, BUFFERS) each query once as a sampled user, rolling back any writes"""
+    params = _params(random.Random(seed), sample)
+    plans = {}
+    with _connect_as_user(dsn) as conn:
+        for name, _, statement in QUERIES:
+            try:
+                with conn.transaction():
+                    conn.execute("SELECT set_config('request.jwt.claim.sub', %s, true)", [params["user_id"]])
+                    lines = [row[0] for row in conn.execute("EXPLAIN (ANALYZE, BUFFERS) " + statement, params)]
+                    raise psycopg.Rollback()
+            except psycopg.Error as e:
+                plans[name] = {"error": str(e).strip().splitlines()[0]}
+                continue
+
+            plan = "\n".join(lines)
+            seq_scans = sorted(set(table for table in re.findall(r"Seq Scan on (?:public\.)?(\w+)", plan)
+                                   if table in PER_USER_TABLES))
+            indexes = sorted(set(re.findall(r"(?:Index Scan|Index Only Scan) using (\w+)", plan))
+                             | set(re.findall(r"Bitmap Index Scan on (\w+)", plan)))
+            plans[name] = {"plan": plan, "seqScans": seq_scans, "indexes": indexes}
+    return plans
+
+def declared_indexes() -> List[str]:
+    """Index names created by the migrations"""
+    names = []
+    for path in sorted(glob.glob(MIGRATIONS)):
+        with open(path, 'r', encoding='utf-8') as file:
+            names.extend(re.findall(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)",
+                                    file.read(), re.IGNORECASE))
+    return names
+
+def index_usage(dsn: str) -> Dict[str, List[str]]:
+    """Declared indexes that do not exist, and those the workload never scanned"""
+    declared = declared_indexes()
+    # Statistics reach the views shortly after each backend's transactions end
+    time.sleep(1)
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        scans = {name: count for name, count in conn.execute(
+            "SELECT indexrelname, idx_scan FROM pg_stat_user_indexes WHERE schemaname = 'public'")}
+    return {
+        "missing": [name for name in declared if name not in scans],
+        "unused": [name for name in declared if scans.get(name) == 0],
+    }
+
+def print_report(users: int, result: Dict[str, Any]) -> None:
+    print(f"\n{users:,} users, {sum(result['rows'].values()):,} rows")
+    print(f"   {'query':<22}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}  plan")
+    for name, stats in result["latency"].items():
+        plan = result["plans"][name]
+        note = plan.get("error") or ", ".join(f"seq scan on {table}" for table in plan["seqScans"]) \
+            or ", ".join(plan["indexes"]) or "-"
+        print(f"   {name:<22}{stats['calls']:>8,}{stats['p50']:>10.2f}{stats['p95']:>10.2f}"
+              f"{stats['p99']:>10.2f}{stats['errors']:>8,}  {note}")
+        if stats["firstError"]:
+            print(f"      first error: {stats['firstError']}")
+    for migration, errors in result["migrationErrors"].items():
+        print(f"   {migration}: {len(errors)} statement(s) failed, e.g. {errors[0]}")
+    if result["indexes"]["missing"]:
+        print(f"   Declared but missing: {', '.join(result['indexes']['missing'])}")
+    if result["indexes"]["unused"]:
+        print(f"   Never used by the workload: {', '.join(result['indexes']['unused'])}")
+
+def benchmark(admin_dsn: str, sizes: List[int], output_path: str = "query_benchmark.json",
+              data_dir: str = "loaddata", clients: int = DEFAULT_CLIENTS, duration: int = DEFAULT_DURATION,
+              seed: int = 1, as_of: Optional[date] = None) -> Dict[str, Any]:
+    """Benchmark every data size in turn and write latencies and plans as JSON"""
+    as_of = as_of or date.today()
+    report = {"clients": clients, "durationSeconds": duration, "seed": seed, "asOf": as_of.isoformat(),
+              "sizes": {}}
+    for users in sizes:
+        print(f"Preparing {users:,} users...")
+        result = prepare_database(admin_dsn, users, data_dir, seed, as_of)
+        sample = load_sample(result["dsn"], seed)
+        with psycopg.connect(result["dsn"], autocommit=True) as conn:
+            conn.execute("SELECT pg_stat_reset()")
+
+        print(f"   Running {clients} client(s) for {duration}s...")
+        result["latency"] = run_workload(result["dsn"], sample, clients, duration, seed)
+        result["indexes"] = index_usage(result["dsn"])
+        result["plans"] = capture_plans(result["dsn"], sample, seed)
+        del result["dsn"]
+        report["sizes"][str(users)] = result
+        print_report(users, result)
+
+    with open(output_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"\nLatencies and plans -> {output_path}")
+    return report
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python benchmark_queries.py <admin_dsn> <users> [users ...]")
+        sys.exit(1)
+
+    benchmark(sys.argv[1], [int(size) for size in sys.argv[2:]])
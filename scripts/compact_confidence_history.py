@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Compaction of user_question_progress.confidence_history
+The update_confidence_history trigger appends {level, timestamp, session_id}
+on every confidence change and nothing trims the array. This tool streams an
+export of the histories and writes a psql script of batched UPDATEs that keep
+recent points as they are and roll older ones into one summary per day, or
+per ISO week once they are older still:
+
+    {"level": 4, "timestamp": 1718236800.5, "period": "day", "start": 1718150400,
+     "count": 7, "total": 23, "min": 2, "max": 4}
+
+level and timestamp are those of the bucket's last point, so code that plots
+level over time keeps working; total / count gives the average. Compacting
+an already compacted history merges into the existing summaries.
+
+    \\copy (SELECT id, confidence_history FROM user_question_progress WHERE jsonb_array_length(confidence_history) > 30) TO 'history.csv' CSV HEADER
+
+Points the trigger appends between the export and the UPDATE are kept: each
+row is rewritten as its compacted history followed by whatever now sits past
+the exported length.
+"""
+
+import csv
+import json
+import sys
+import time
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+DAY = 86400
+DEFAULT_KEEP_DAYS = 30
+DEFAULT_DAILY_DAYS = 180
+DEFAULT_BATCH_SIZE = 500
+
+def bucket_start(timestamp: float, period: str) -> int:
+    """UTC midnight of the day, or of the Monday starting the ISO week, containing timestamp"""
+    day = int(timestamp // DAY)
+    if period == "week":
+        # 1970-01-01 was a Thursday, three days after a Monday
+        day -= (day + 3) % 7
+    return day * DAY
+
+def _summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """A raw point or an existing summary, as a mergeable summary"""
+    if "period" in entry:
+        return dict(entry)
+    level = int(entry.get("level") or 0)
+    return {"level": level, "timestamp": entry["timestamp"], "count": 1, "total": level,
+            "min": level, "max": level}
+
+def _merge(into: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    if entry["timestamp"] >= into["timestamp"]:
+        into["level"] = entry["level"]
+        into["timestamp"] = entry["timestamp"]
+    into["count"] += entry["count"]
+    into["total"] += entry["total"]
+    into["min"] = min(into["min"], entry["min"])
+    into["max"] = max(into["max"], entry["max"])
+
+def compact_history(history: List[Dict[str, Any]], now: float, keep_days: int = DEFAULT_KEEP_DAYS,
+                    daily_days: int = DEFAULT_DAILY_DAYS) -> List[Dict[str, Any]]:
+    """
+    Return history with points older than keep_days rolled up by day, and
+    by week once older than daily_days; newer points are kept unchanged
+    """
+    keep_after = now - keep_days * DAY
+    daily_after = now - daily_days * DAY
+
+    buckets: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    recent = []
+    for entry in history:
+        timestamp = entry.get("timestamp")
+        if not isinstance(timestamp, (int, float)):
+            # Nothing to bucket by; leave the entry where it is
+            recent.append(entry)
+            continue
+        if "period" not in entry and timestamp >= keep_after:
+            recent.append(entry)
+            continue
+
+        # Summaries are placed by the start of their bucket, raw points by their own time
+        placed_at = entry.get("start", timestamp)
+        period = "day" if placed_at >= bucket_start(daily_after, "day") else "week"
+        if entry.get("period") == "week":
+            period = "week"
+        key = (period, bucket_start(placed_at, period))
+
+        summary = _summary(entry)
+        if key in buckets:
+            _merge(buckets[key], summary)
+        else:
+            summary["period"], summary["start"] = key
+            buckets[key] = summary
+
+    summaries = [{"level": s["level"], "timestamp": s["timestamp"], "period": s["period"], "start": s["start"],
+                  "count": s["count"], "total": s["total"], "min": s["min"], "max": s["max"]}
+                 for _, s in sorted(buckets.items(), key=lambda item: item[0][1])]
+    return summaries + recent
+
+def jsonb_text(value: Any) -> str:
+    """JSON in the layout PostgreSQL prints jsonb with, so sizes compare like for like"""
+    return json.dumps(value, ensure_ascii=False)
+
+def sql_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+def compact_rows(rows: Iterable[Dict[str, str]], now: float, keep_days: int = DEFAULT_KEEP_DAYS,
+                 daily_days: int = DEFAULT_DAILY_DAYS, stats: Optional[Dict[str, int]] = None
+                 ) -> Iterator[Tuple[str, str, int]]:
+    """Yield (id, compacted history JSON, exported length) for every row that gets smaller"""
+    stats = stats if stats is not None else {}
+    for key in ("rows", "compacted", "pointsBefore", "pointsAfter", "bytesBefore", "bytesAfter"):
+        stats.setdefault(key, 0)
+
+    for row in rows:
+        stats["rows"] += 1
+        history = json.loads(row["confidence_history"] or "[]")
+        compacted = compact_history(history, now, keep_days, daily_days)
+        before = len(jsonb_text(history).encode('utf-8'))
+        text = jsonb_text(compacted)
+        after = len(text.encode('utf-8'))
+        if after >= before:
+            continue
+
+        stats["compacted"] += 1
+        stats["pointsBefore"] += len(history)
+        stats["pointsAfter"] += len(compacted)
+        stats["bytesBefore"] += before
+        stats["bytesAfter"] += after
+        yield row["id"], text, len(history)
+
+def write_update_script(updates: Iterable[Tuple[str, str, int]], out, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Write one UPDATE ... FROM (VALUES ...) per batch, each in its own short transaction"""
+    def flush(batch: List[Tuple[str, str, int]]) -> None:
+        values = ",\n  ".join(f"({sql_literal(row_id)}::uuid, {sql_literal(text)}::jsonb, {length})"
+                              for row_id, text, length in batch)
+        out.write("BEGIN;\n")
+        out.write("UPDATE user_question_progress AS p\n")
+        out.write("SET confidence_history = c.history || CASE\n"
+                  "    WHEN jsonb_array_length(p.confidence_history) > c.exported\n"
+                  "    THEN jsonb_path_query_array(p.confidence_history, format('$[%s to last]', c.exported)::jsonpath)\n"
+                  "    ELSE '[]'::jsonb END\n")
+        out.write(f"FROM (VALUES\n  {values}\n) AS c(id, history, exported)\n")
+        # A shorter array means the row was rewritten since the export; leave it for the next run
+        out.write("WHERE p.id = c.id AND jsonb_array_length(p.confidence_history) >= c.exported;\n")
+        out.write("COMMIT;\n")
+
+    count = 0
+    batch = []
+    for update in updates:
+        batch.append(update)
+        count += 1
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return count
+
+def compact_export(export_path: str, output_path: str, keep_days: int = DEFAULT_KEEP_DAYS,
+                   daily_days: int = DEFAULT_DAILY_DAYS, batch_size: int = DEFAULT_BATCH_SIZE,
+                   now: Optional[float] = None) -> Dict[str, int]:
+    """Compact every history in the export and write the UPDATE script"""
+    # Histories are the reason for this tool, so they can exceed csv's default field limit
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    now = time.time() if now is None else now
+    stats: Dict[str, int] = {}
+    with open(export_path, 'r', encoding='utf-8', newline='') as file, \
+            open(output_path, 'w', encoding='utf-8', newline='') as out:
+        updates = compact_rows(csv.DictReader(file), now, keep_days, daily_days, stats)
+        write_update_script(updates, out, batch_size)
+
+    reclaimed = stats["bytesBefore"] - stats["bytesAfter"]
+    print(f"Compacted {stats['compacted']:,} of {stats['rows']:,} histories: "
+          f"{stats['pointsBefore']:,} -> {stats['pointsAfter']:,} entries")
+    print(f"Reclaimed {reclaimed:,} bytes of JSON ({stats['bytesBefore']:,} -> {stats['bytesAfter']:,}) -> {output_path}")
+    if stats["compacted"]:
+        print(f"Apply with: psql -f {output_path}, then VACUUM user_question_progress")
+    stats["bytesReclaimed"] = reclaimed
+    return stats
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python compact_confidence_history.py <history.csv> <output.sql> "
+              "[keep_days] [daily_days] [batch_size]")
+        sys.exit(1)
+
+    compact_export(
+        sys.argv[1], sys.argv[2],
+        int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_KEEP_DAYS,
+        int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_DAILY_DAYS,
+        int(sys.argv[5]) if len(sys.argv) > 5 else DEFAULT_BATCH_SIZE
+    )
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Synthetic Load Data for the Supabase Schema
+Generates reproducible, foreign-key consistent rows for load testing:
+auth.users, profiles, user_stats, study_sessions, user_question_progress,
+user_flashcard_progress and spaced_repetition_data, plus the categories,
+flashcards and questions they reference. Output is PostgreSQL COPY text,
+one file per table and shard, with a load.sql that loads them in FK order:
+
+    python generate_load_data.py loaddata 100000 [seed] [as-of YYYY-MM-DD]
+    psql -d loadtest -f loaddata/load.sql
+
+Users are generated in fixed-size shards on a process pool. Each shard has
+its own seed derived from the run seed, so the output is identical whatever
+the number of workers.
+
+Distributions follow how people actually study: engagement is heavy-tailed
+(Pareto), study days come from a two-state Markov chain (so streaks form
+and break), session lengths are log-normal, confidence rises with the number
+of reviews, and flashcard schedules come from running the same SM-2 update
+as calculate_next_review.
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+
+from refresh_user_stats import compute_streaks, copy_value
+
+SHARD_USERS = 5000
+DEFAULT_FLASHCARDS = 400
+DEFAULT_QUESTIONS = 100
+HISTORY_DAYS = 365
+# Review intervals are capped as the app does, or repeated ease growth overflows INTEGER
+MAX_INTERVAL_DAYS = 365
+
+# Table, columns, and whether the rows come per shard (True) or from the shared catalog
+TABLES = [
+    ("public.categories", ["id", "name", "description", "sort_order"], False),
+    ("public.flashcards", ["id", "category_id", "front", "back", "difficulty"], False),
+    ("public.questions", ["id", "tier_id", "question", "answer", "difficulty", "category", "order_index",
+                          "frequency_score", "importance_level"], False),
+    ("auth.users", ["id", "email"], True),
+    ("public.profiles", ["id", "email", "full_name", "username", "interview_date", "target_company",
+                         "experience_level", "preferred_study_time", "created_at"], True),
+    ("public.user_stats", ["user_id", "current_streak", "longest_streak", "total_study_time",
+                           "flashcards_mastered", "challenges_completed", "last_study_date", "weekly_goal"], True),
+    ("public.study_sessions", ["id", "user_id", "session_type", "duration", "items_studied", "performance_score",
+                               "session_date", "created_at"], True),
+    ("public.user_question_progress", ["id", "user_id", "question_id", "confidence_level", "is_favorite",
+                                       "times_reviewed", "first_reviewed_at", "last_reviewed_at",
+                                       "time_spent_seconds", "confidence_history", "created_at", "updated_at"], True),
+    ("public.user_flashcard_progress", ["id", "user_id", "flashcard_id", "confidence_level", "times_reviewed",
+                                        "last_reviewed_at", "next_review_at", "is_mastered", "review_history",
+                                        "created_at", "updated_at"], True),
+    ("public.spaced_repetition_data", ["id", "user_id", "flashcard_id", "ease_factor", "interval_days",
+                                       "repetitions", "last_reviewed", "next_review", "created_at",
+                                       "updated_at"], True),
+]
+
+TIERS = [("top10", 10), ("top20", 10), ("top50", 30), ("top100", 50)]
+DIFFICULTIES = ["Beginner", "Intermediate", "Advanced"]
+CATEGORIES = ["React Fundamentals", "React Hooks", "State Management", "Performance", "Next.js",
+              "Testing", "JavaScript Core", "System Design"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", None]
+EXPERIENCE = (["junior", "mid", "senior", "lead"], [35, 35, 22, 8])
+SESSION_TYPES = (["flashcards", "challenges", "checklist", "mixed"], [45, 15, 10, 30])
+STUDY_MINUTES = ([15, 30, 45, 60, 90], [15, 45, 20, 15, 5])
+EPOCH = date(1970, 1, 1)
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def _day_start(day: date) -> int:
+    return (day - EPOCH).days * 86400
+
+def _moment(day_start: int, rng: random.Random) -> int:
+    """Epoch seconds on the day starting at day_start, weighted towards evenings the way study sessions cluster"""
+    hour = min(23, max(6, int(rng.gauss(19, 3))))
+    return day_start + hour * 3600 + int(rng.random() * 3600)
+
+def _at(seconds: int) -> datetime:
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+def _timestamp(day: date, rng: random.Random) -> datetime:
+    return _at(_moment(_day_start(day), rng))
+
+def sm2(ease: float, interval: int, repetitions: int, quality: int) -> Tuple[float, int, int]:
+    """One SM-2 step, as calculate_next_review in 004_security_and_functions.sql"""
+    if quality >= 3:
+        new_interval = 1 if repetitions == 0 else 6 if repetitions == 1 else round(interval * ease)
+        repetitions += 1
+    else:
+        new_interval, repetitions = 1, 0
+    ease = max(1.3, ease + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
+    return ease, new_interval, repetitions
+
+def build_catalog(seed: int, flashcards: int = DEFAULT_FLASHCARDS,
+                  questions: int = DEFAULT_QUESTIONS) -> Dict[str, List[tuple]]:
+    """The content rows every user references, derived from the seed alone"""
+    rng = random.Random(f"{seed}:catalog")
+    categories = [(_uuid(rng), f"Load Test: {name}", f"Synthetic {name} cards", position)
+                  for position, name in enumerate(CATEGORIES, 1)]
+    cards = [(_uuid(rng), rng.choice(categories)[0], f"Synthetic flashcard {i}?", f"Answer to flashcard {i}.",
+              rng.choices(["beginner", "intermediate", "advanced"], [50, 35, 15])[0])
+             for i in range(1, flashcards + 1)]
+
+    tier_of = [tier for tier, count in TIERS for _ in range(count)]
+    rows = []
+    for i in range(1, questions + 1):
+        tier = tier_of[(i - 1) * len(tier_of) // questions]
+        rows.append((f"lt-q{i:05d}", tier, f"Synthetic interview question {i}?", f"Answer to question {i}.",
+                     rng.choices(DIFFICULTIES, [30, 45, 25])[0], rng.choice(CATEGORIES), i,
+                     max(1, min(100, int(rng.gauss(95 - 60 * i / questions, 8)))), rng.randint(1, 5)))
+    return {"public.categories": categories, "public.flashcards": cards, "public.questions": rows}
+
+def _study_days(rng: random.Random, signup: date, as_of: date, engagement: float) -> List[date]:
+    """Days with a session: a two-state chain over the user's active span"""
+    age = (as_of - signup).days
+    span = max(1, min(age, int(rng.expovariate(1 / 45) * engagement)))
+    start = min(0.6, 0.08 * engagement)
+    keep_going = min(0.9, 0.5 + 0.1 * engagement)
+
+    days = []
+    studied = True
+    for offset in range(span + 1):
+        if offset and not rng.random() < (keep_going if studied else start):
+            studied = False
+            continue
+        studied = True
+        days.append(signup + timedelta(days=offset))
+    return days
+
+def _user_rows(rng: random.Random, index: int, as_of: date, catalog: Dict[str, List[tuple]]) -> Dict[str, List[tuple]]:
+    rows: Dict[str, List[tuple]] = {table: [] for table, _, per_shard in TABLES if per_shard}
+    user_id = _uuid(rng)
+    signup = as_of - timedelta(days=rng.randrange(HISTORY_DAYS))
+    signed_up_at = _timestamp(signup, rng)
+    engagement = rng.paretovariate(1.4)
+    email = f"user{index}@load.test"
+
+    rows["auth.users"].append((user_id, email))
+    interview = signed_up_at + timedelta(days=rng.randint(14, 120)) if rng.random() < 0.4 else None
+    study_minutes = rng.choices(*STUDY_MINUTES)[0]
+    rows["public.profiles"].append((user_id, email, f"Load User {index}", f"user{index}", interview,
+                                    rng.choice(COMPANIES), rng.choices(*EXPERIENCE)[0], study_minutes, signed_up_at))
+
+    days = _study_days(rng, signup, as_of, engagement)
+    total_minutes = 0
+    for day in days:
+        for _ in range(1 if rng.random() < 0.85 else 2):
+            minutes = min(240, max(5, int(rng.lognormvariate(math.log(study_minutes * 0.8), 0.55))))
+            total_minutes += minutes
+            rows["public.study_sessions"].append((
+                _uuid(rng), user_id, rng.choices(*SESSION_TYPES)[0], minutes,
+                max(1, int(minutes * rng.uniform(0.4, 1.2))), f"{rng.betavariate(5, 3):.2f}", day,
+                _timestamp(day, rng)))
+
+    # Review times are drawn by the thousand, so they stay epoch seconds until written
+    day_starts = [_day_start(day) for day in days]
+    skill = rng.betavariate(2, 3)
+    questions = catalog["public.questions"]
+    # Users work down the ranking, with some wandering
+    attempted = min(len(questions), int(len(days) * rng.uniform(0.5, 2.5)))
+    order = sorted(range(len(questions)), key=lambda i: i * rng.uniform(0.3, 1.7))[:attempted]
+    for position in order:
+        reviews = min(200, 1 + int(rng.expovariate(1 / (1 + 2 * engagement))))
+        final = max(0, min(5, round(rng.gauss(1 + 2.5 * skill + 0.6 * math.log1p(reviews), 0.9))))
+        stamps = sorted([_moment(rng.choice(day_starts), rng) for _ in range(reviews)])
+        history = []
+        for step, stamp in enumerate(stamps, 1):
+            level = max(0, min(5, round(final * step / reviews + rng.gauss(0, 0.6))))
+            history.append({"level": level, "timestamp": stamp, "session_id": f"s{rng.getrandbits(20)}"})
+        history[-1]["level"] = final
+        first, last = _at(stamps[0]), _at(stamps[-1])
+        rows["public.user_question_progress"].append((
+            _uuid(rng), user_id, questions[position][0], final, rng.random() < 0.08, reviews, first, last,
+            int(reviews * rng.lognormvariate(math.log(90), 0.5)), json.dumps(history), first, last))
+
+    mastered = 0
+    cards = catalog["public.flashcards"]
+    for card in rng.sample(cards, min(len(cards), int(len(days) * rng.uniform(1, 4)))):
+        reviews = min(60, 1 + int(rng.expovariate(1 / (1 + engagement))))
+        ease, interval, repetitions = 2.5, 1, 0
+        stamps = sorted([_moment(rng.choice(day_starts), rng) for _ in range(reviews)])
+        review_history = []
+        for stamp in stamps:
+            quality = max(0, min(5, round(rng.gauss(2 + 3 * skill, 1.1))))
+            ease, interval, repetitions = sm2(ease, interval, repetitions, quality)
+            interval = min(interval, MAX_INTERVAL_DAYS)
+            review_history.append({"timestamp": stamp, "confidence": max(1, quality),
+                                   "response_time": round(rng.lognormvariate(math.log(8), 0.6), 1)})
+        confidence = review_history[-1]["confidence"]
+        is_mastered = confidence >= 4 and repetitions >= 3
+        mastered += is_mastered
+        first, last = _at(stamps[0]), _at(stamps[-1])
+        next_review = last + timedelta(days=interval)
+        rows["public.user_flashcard_progress"].append((
+            _uuid(rng), user_id, card[0], confidence, reviews, last, next_review, is_mastered,
+            json.dumps(review_history[-50:]), first, last))
+        rows["public.spaced_repetition_data"].append((
+            _uuid(rng), user_id, card[0], f"{ease:.2f}", interval, repetitions, last, next_review, first, last))
+
+    current, longest = compute_streaks(days, as_of)
+    rows["public.user_stats"].append((user_id, current, longest, total_minutes, mastered, 0,
+                                      days[-1] if days else None, study_minutes * 7))
+    return rows
+
+def shard_path(out_dir: str, table: str, shard: Optional[int] = None) -> str:
+    suffix = "" if shard is None else f".{shard:05d}"
+    return os.path.join(out_dir, f"{table}{suffix}.copy")
+
+def _write_copy(path: str, rows: List[tuple]) -> None:
+    with open(path + ".tmp", 'w', encoding='utf-8', newline='') as file:
+        for row in rows:
+            file.write("\t".join(copy_value(value) for value in row) + "\n")
+    os.replace(path + ".tmp", path)
+
+def generate_shard(out_dir: str, seed: int, shard: int, first_user: int, users: int, as_of: date,
+                   catalog: Dict[str, List[tuple]]) -> Dict[str, int]:
+    """Generate users [first_user, first_user + users) and write one COPY file per table"""
+    rng = random.Random(f"{seed}:shard:{shard}")
+    tables: Dict[str, List[tuple]] = {table: [] for table, _, per_shard in TABLES if per_shard}
+    for index in range(first_user, first_user + users):
+        for table, rows in _user_rows(rng, index, as_of, catalog).items():
+            tables[table].extend(rows)
+
+    for table, rows in tables.items():
+        _write_copy(shard_path(out_dir, table, shard), rows)
+    return {table: len(rows) for table, rows in tables.items()}
+
+def write_load_script(out_dir: str, shards: int) -> str:
+    """psql script that loads every file in FK order, skipping triggers for the bulk load"""
+    path = os.path.join(out_dir, "load.sql")
+    with open(path, 'w', encoding='utf-8') as out:
+        out.write("-- Generated by generate_load_data.py; run from this directory with psql -f load.sql\n")
+        out.write("-- Rows are FK-consistent and user_stats is precomputed, so triggers and FK checks are\n")
+        out.write("-- skipped while loading (needs a superuser, as on a local throwaway database).\n")
+        out.write("SET session_replication_role = replica;\n")
+        for table, columns, per_shard in TABLES:
+            files = [shard_path(".", table, shard) for shard in range(shards)] if per_shard else [shard_path(".", table)]
+            for file in files:
+                out.write(f"\\copy {table} ({', '.join(columns)}) FROM '{file}'\n")
+        out.write("SET session_replication_role = DEFAULT;\n")
+        for table, _, _ in TABLES:
+            out.write(f"ANALYZE {table};\n")
+    return path
+
+def generate_load_data(out_dir: str, users: int, seed: int = 1, as_of: Optional[date] = None,
+                       flashcards: int = DEFAULT_FLASHCARDS, questions: int = DEFAULT_QUESTIONS,
+                       jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Write the catalog, every user shard and load.sql; returns row counts per table"""
+    as_of = as_of or date.today()
+    os.makedirs(out_dir, exist_ok=True)
+
+    catalog = build_catalog(seed, flashcards, questions)
+    for table, rows in catalog.items():
+        _write_copy(shard_path(out_dir, table), rows)
+
+    counts = {table: len(rows) for table, rows in catalog.items()}
+    shards = [(shard, first, min(SHARD_USERS, users - first))
+              for shard, first in enumerate(range(0, users, SHARD_USERS))]
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        futures = [pool.submit(generate_shard, out_dir, seed, shard, first, count, as_of, catalog)
+                   for shard, first, count in shards]
+        for future in futures:
+            for table, count in future.result().items():
+                counts[table] = counts.get(table, 0) + count
+
+    write_load_script(out_dir, len(shards))
+    manifest = {"seed": seed, "asOf": as_of.isoformat(), "users": users, "shardUsers": SHARD_USERS,
+                "shards": len(shards), "rows": counts}
+    with open(os.path.join(out_dir, "manifest.json"), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2)
+
+    print(f"Generated {sum(counts.values()):,} rows for {users:,} users in {len(shards)} shard(s) -> {out_dir}")
+    for table, count in counts.items():
+        print(f"   {table}: {count:,}")
+    print(f"Load with: cd {out_dir} && psql -f load.sql")
+    return manifest
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python generate_load_data.py <output_dir> <users> [seed] [as-of YYYY-MM-DD]")
+        sys.exit(1)
+
+    generate_load_data(
+        sys.argv[1], int(sys.argv[2]),
+        int(sys.argv[3]) if len(sys.argv) > 3 else 1,
+        date.fromisoformat(sys.argv[4]) if len(sys.argv) > 4 else None
+    )
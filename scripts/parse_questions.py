@@ -37,10 +37,8 @@ def parse_blocks(text):
         blocks.append(data)
     return blocks
 
-def main():
+def main(input_path="questions_input.md", output_path="react-top-20.json"):
     # Input file can be provided as CLI argument
-    input_path = "questions_input.md"
-    output_path = "react-top-20.json"
     with open(input_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -54,4 +52,5 @@ def main():
         json.dump(o, f, indent=2, ensure_ascii=False)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import sys
+    main(*sys.argv[1:3])
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Batch Interview-Readiness Scoring
+Computes the calculate_interview_readiness(p_user_id) score from
+003_confidence_tracking.sql for every user at once, plus each user's
+percentile rank, from CSV exports of user_question_progress and questions.
+Rows are loaded into numpy arrays and aggregated with bincount group-bys
+instead of three queries per user.
+
+    \\copy (SELECT user_id, question_id, confidence_level FROM user_question_progress) TO 'progress.csv' CSV HEADER
+    \\copy (SELECT id, tier_id FROM questions) TO 'questions.csv' CSV HEADER
+
+Requires numpy.
+"""
+
+import csv
+import sys
+from array import array
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+from refresh_user_stats import copy_value
+
+# Tier codes stored per progress row; 0 means the question is in neither scored tier
+TIER_CODES = {"top10": 1, "top20": 2}
+
+# Same weights as the SQL function: max 50 points from top10, 30 from top20, 20 from questions studied
+TOP10_WEIGHT = 10
+TOP20_WEIGHT = 6
+STUDIED_CAP = 20
+
+def load_question_tiers(path: str) -> Dict[str, int]:
+    """Map question id -> tier code for the tiers the score uses"""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        return {row["id"]: TIER_CODES[row["tier_id"]]
+                for row in csv.DictReader(file) if row.get("tier_id") in TIER_CODES}
+
+def load_progress(path: str, question_tiers: Dict[str, int]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Load progress rows into (user ids, user index, tier code, confidence) arrays"""
+    users: Dict[str, int] = {}
+    user_index = array('q')
+    tier_code = array('b')
+    confidence = array('b')
+
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        for row in csv.DictReader(file):
+            user_index.append(users.setdefault(row["user_id"], len(users)))
+            tier_code.append(question_tiers.get(row["question_id"], 0))
+            confidence.append(int(row["confidence_level"] or 0))
+
+    return (list(users),
+            np.frombuffer(user_index, dtype=np.int64),
+            np.frombuffer(tier_code, dtype=np.int8),
+            np.frombuffer(confidence, dtype=np.int8))
+
+def compute_scores(user_index: np.ndarray, tier_code: np.ndarray, confidence: np.ndarray,
+                   user_count: int) -> np.ndarray:
+    """
+    Readiness score per user, identical to the SQL function
+
+    The score is ROUND(avg10 * 10 + avg20 * 6 + LEAST(20, studied)). It is
+    evaluated as an exact fraction in integers so that halves round up the
+    way Postgres numeric ROUND does, with no float error.
+    """
+    confidence = confidence.astype(np.int64)
+
+    def per_user(mask, weights=None):
+        weights = weights[mask] if weights is not None else None
+        return np.bincount(user_index[mask], weights=weights, minlength=user_count).astype(np.int64)
+
+    in_top10 = tier_code == TIER_CODES["top10"]
+    in_top20 = tier_code == TIER_CODES["top20"]
+
+    # AVG over no rows is COALESCEd to 0; a denominator of 1 with a sum of 0 gives the same term
+    count10 = np.maximum(per_user(in_top10), 1)
+    count20 = np.maximum(per_user(in_top20), 1)
+    sum10 = per_user(in_top10, confidence)
+    sum20 = per_user(in_top20, confidence)
+    studied = np.minimum(per_user(confidence > 0), STUDIED_CAP)
+
+    numerator = sum10 * TOP10_WEIGHT * count20 + sum20 * TOP20_WEIGHT * count10 + studied * count10 * count20
+    denominator = count10 * count20
+    scores = (2 * numerator + denominator) // (2 * denominator)
+    return np.clip(scores, 0, 100)
+
+def percentile_ranks(scores: np.ndarray) -> np.ndarray:
+    """PERCENT_RANK() * 100: share of other users with a strictly lower score"""
+    if len(scores) < 2:
+        return np.zeros(len(scores))
+    lower = np.searchsorted(np.sort(scores), scores, side='left')
+    return lower * 100.0 / (len(scores) - 1)
+
+def write_outputs(user_ids: List[str], scores: np.ndarray, percentiles: np.ndarray,
+                  csv_path: str, sql_path: str = None) -> None:
+    """Write scores and percentiles as CSV, and optionally a psql refresh script"""
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["user_id", "interview_readiness_score", "percentile_rank"])
+        for user_id, score, percentile in zip(user_ids, scores.tolist(), percentiles.tolist()):
+            writer.writerow([user_id, score, f"{percentile:.1f}"])
+
+    if sql_path:
+        with open(sql_path, 'w', encoding='utf-8', newline='') as out:
+            out.write("BEGIN;\n")
+            out.write("CREATE TEMP TABLE readiness_refresh (user_id UUID PRIMARY KEY, "
+                      "interview_readiness_score INTEGER) ON COMMIT DROP;\n")
+            out.write("COPY readiness_refresh (user_id, interview_readiness_score) FROM STDIN;\n")
+            for user_id, score in zip(user_ids, scores.tolist()):
+                out.write(f"{copy_value(user_id)}\t{score}\n")
+            out.write("\\.\n")
+            out.write("UPDATE user_stats us\n"
+                      "SET interview_readiness_score = r.interview_readiness_score, updated_at = NOW()\n"
+                      "FROM readiness_refresh r\n"
+                      "WHERE us.user_id = r.user_id;\n")
+            out.write("COMMIT;\n")
+
+def score_all_users(progress_path: str, questions_path: str, csv_path: str = "readiness_scores.csv",
+                    sql_path: str = None) -> Dict[str, float]:
+    """Score every user in the progress export"""
+    import time
+
+    started = time.perf_counter()
+    user_ids, user_index, tier_code, confidence = load_progress(progress_path, load_question_tiers(questions_path))
+    loaded = time.perf_counter()
+
+    scores = compute_scores(user_index, tier_code, confidence, len(user_ids))
+    percentiles = percentile_ranks(scores)
+    scored = time.perf_counter()
+
+    write_outputs(user_ids, scores, percentiles, csv_path, sql_path)
+
+    print(f"Scored {len(user_ids):,} users from {len(user_index):,} progress rows")
+    print(f"   load {loaded - started:.2f}s, score {scored - loaded:.3f}s, "
+          f"write {time.perf_counter() - scored:.2f}s")
+    if len(scores):
+        print(f"   median score {float(np.median(scores)):.0f}, mean {float(scores.mean()):.1f}")
+    return {"users": len(user_ids), "rows": len(user_index)}
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python readiness_scores.py <progress.csv> <questions.csv> [scores.csv] [refresh.sql]")
+        sys.exit(1)
+
+    score_all_users(
+        sys.argv[1], sys.argv[2],
+        sys.argv[3] if len(sys.argv) > 3 else "readiness_scores.csv",
+        sys.argv[4] if len(sys.argv) > 4 else None
+    )
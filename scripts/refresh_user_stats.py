@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Bulk user_stats Refresh from Table Exports
+Streams CSV exports of user_question_progress and study_sessions, computes
+every user's aggregates and study streaks in one grouped pass, and writes a
+psql script that COPYs the results into a staging table and upserts them
+into user_stats. Running this nightly lets the per-row update_user_stats
+triggers be dropped or deferred.
+
+Both exports must be ordered by user_id so each user is handled once and
+memory stays constant:
+
+    \\copy (SELECT user_id, confidence_level, is_favorite FROM user_question_progress ORDER BY user_id) TO 'progress.csv' CSV HEADER
+    \\copy (SELECT * FROM study_sessions ORDER BY user_id) TO 'sessions.csv' CSV HEADER
+"""
+
+import csv
+import sys
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import groupby
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Column layouts of user_stats in the two migrations that define it
+SCHEMAS = {
+    # 003_confidence_tracking.sql
+    "confidence": {
+        "total_questions_studied": "total_questions_studied",
+        "favorite_questions_count": "favorite_questions_count",
+        "average_confidence_level": "average_confidence_level",
+        "mastered_questions_count": "mastered_questions_count",
+        "total_study_time": "total_study_time_minutes",
+        "current_streak": "current_study_streak",
+        "longest_streak": "longest_study_streak",
+        "last_study_date": "last_study_date",
+    },
+    # 002_progress_tracking.sql / 004_security_and_functions.sql
+    "progress": {
+        "total_study_time": "total_study_time",
+        "current_streak": "current_streak",
+        "longest_streak": "longest_streak",
+        "last_study_date": "last_study_date",
+    },
+}
+
+MASTERED_CONFIDENCE = 4
+
+def _is_true(value: Optional[str]) -> bool:
+    return (value or "").strip().lower() in ("t", "true", "1", "yes")
+
+def _session_date(row: Dict[str, str]) -> Optional[date]:
+    value = row.get("session_date") or row.get("session_start") or row.get("created_at")
+    return date.fromisoformat(value[:10]) if value else None
+
+def _session_minutes(row: Dict[str, str]) -> int:
+    value = row.get("duration") or row.get("total_time_minutes")
+    return int(float(value)) if value else 0
+
+def grouped_by_user(rows: Iterable[Dict[str, str]], source: str) -> Iterator[Tuple[str, List[Dict[str, str]]]]:
+    """Group a user_id-ordered export, failing loudly if it is not ordered"""
+    previous = None
+    for user_id, group in groupby(rows, key=lambda row: row["user_id"]):
+        if previous is not None and user_id < previous:
+            raise ValueError(f"{source} is not ordered by user_id ({user_id} after {previous}); "
+                             "export it with ORDER BY user_id")
+        previous = user_id
+        yield user_id, list(group)
+
+def compute_streaks(study_dates: Iterable[date], as_of: date) -> Tuple[int, int]:
+    """
+    Return (current, longest) runs of consecutive study days
+
+    The current streak only counts if the last study day is as_of or the day
+    before, matching the rule in the update_user_stats trigger.
+    """
+    days = sorted(set(study_dates))
+    if not days:
+        return 0, 0
+
+    longest = run = 1
+    for previous, day in zip(days, days[1:]):
+        run = run + 1 if day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+
+    current = run if as_of - days[-1] <= timedelta(days=1) else 0
+    return current, longest
+
+def user_stats(user_id: str, progress: List[Dict[str, str]], sessions: List[Dict[str, str]],
+               as_of: date) -> Dict[str, Any]:
+    """Aggregate one user's progress rows and study sessions"""
+    levels = [int(row.get("confidence_level") or 0) for row in progress]
+    study_dates = [d for d in (_session_date(row) for row in sessions) if d]
+    current, longest = compute_streaks(study_dates, as_of)
+
+    average = None
+    if levels:
+        average = (Decimal(sum(levels)) / len(levels)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    return {
+        "user_id": user_id,
+        "total_questions_studied": sum(1 for level in levels if level > 0),
+        "favorite_questions_count": sum(1 for row in progress if _is_true(row.get("is_favorite"))),
+        "average_confidence_level": average if average is not None else Decimal("0.00"),
+        "mastered_questions_count": sum(1 for level in levels if level >= MASTERED_CONFIDENCE),
+        "total_study_time": sum(_session_minutes(row) for row in sessions),
+        "current_streak": current,
+        "longest_streak": longest,
+        "last_study_date": max(study_dates) if study_dates else None,
+    }
+
+def compute_all_stats(progress_rows: Iterable[Dict[str, str]], session_rows: Iterable[Dict[str, str]],
+                      as_of: date) -> Iterator[Dict[str, Any]]:
+    """Merge-join the two user_id-ordered exports and yield stats per user"""
+    progress = grouped_by_user(progress_rows, "progress export")
+    sessions = grouped_by_user(session_rows, "sessions export")
+    next_progress = next(progress, None)
+    next_sessions = next(sessions, None)
+
+    while next_progress or next_sessions:
+        candidates = [group[0] for group in (next_progress, next_sessions) if group]
+        user_id = min(candidates)
+
+        user_progress, user_sessions = [], []
+        if next_progress and next_progress[0] == user_id:
+            user_progress = next_progress[1]
+            next_progress = next(progress, None)
+        if next_sessions and next_sessions[0] == user_id:
+            user_sessions = next_sessions[1]
+            next_sessions = next(sessions, None)
+
+        yield user_stats(user_id, user_progress, user_sessions, as_of)
+
+def copy_value(value: Any) -> str:
+    """Format a value for COPY text format"""
+    if value is None:
+        return "\\N"
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def write_refresh_script(stats: Iterable[Dict[str, Any]], out, schema: str = "confidence",
+                         data_only: bool = False) -> int:
+    """Write a psql script (or bare COPY data) that bulk-refreshes user_stats"""
+    columns = SCHEMAS[schema]
+    target_columns = ["user_id"] + list(columns.values())
+    column_list = ", ".join(target_columns)
+
+    if not data_only:
+        out.write("BEGIN;\n")
+        out.write("CREATE TEMP TABLE user_stats_refresh (LIKE user_stats INCLUDING DEFAULTS) ON COMMIT DROP;\n")
+        out.write(f"COPY user_stats_refresh ({column_list}) FROM STDIN;\n")
+
+    count = 0
+    for row in stats:
+        values = [row["user_id"]] + [row[key] for key in columns]
+        out.write("\t".join(copy_value(value) for value in values) + "\n")
+        count += 1
+
+    if not data_only:
+        updates = ",\n  ".join(f"{column} = EXCLUDED.{column}" for column in target_columns[1:])
+        out.write("\\.\n")
+        out.write(f"INSERT INTO user_stats ({column_list})\n")
+        out.write(f"SELECT {column_list} FROM user_stats_refresh\n")
+        out.write(f"ON CONFLICT (user_id) DO UPDATE SET\n  {updates},\n  updated_at = NOW();\n")
+        out.write("COMMIT;\n")
+
+    return count
+
+def refresh_user_stats(progress_path: str, sessions_path: str, output_path: str,
+                       schema: str = "confidence", as_of: Optional[date] = None,
+                       data_only: bool = False) -> int:
+    """Compute stats from the two exports and write the refresh script"""
+    as_of = as_of or date.today()
+    with open(progress_path, 'r', encoding='utf-8', newline='') as progress_file, \
+            open(sessions_path, 'r', encoding='utf-8', newline='') as sessions_file, \
+            open(output_path, 'w', encoding='utf-8', newline='') as out:
+        stats = compute_all_stats(csv.DictReader(progress_file), csv.DictReader(sessions_file), as_of)
+        count = write_refresh_script(stats, out, schema, data_only)
+
+    print(f"Computed stats for {count:,} users -> {output_path}")
+    if not data_only:
+        print(f"Apply with: psql -f {output_path}")
+    return count
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Usage: python refresh_user_stats.py <progress.csv> <sessions.csv> <output.sql> "
+              "[confidence|progress] [as-of YYYY-MM-DD]")
+        sys.exit(1)
+
+    refresh_user_stats(
+        sys.argv[1], sys.argv[2], sys.argv[3],
+        sys.argv[4] if len(sys.argv) > 4 else "confidence",
+        date.fromisoformat(sys.argv[5]) if len(sys.argv) > 5 else None
+    )
@@ -0,0 +1,51 @@
+// utils/contentStore.js
+// Reads content-store.json, written by docs/conversion/content_store.py: every legacy
+// data file is a view of shared entities, so one request replaces them all
+class ContentStore {
+  constructor(store) {
+    this.store = store;
+  }
+
+  // Plain JSON for any part of the store: {"$t": n} is a shared string, {"$ref": ...}
+  // an entity with this copy's "$set" fields applied and "$unset" fields removed, or
+  // those of patches[n] for {"$ref": ..., "$p": n}
+  resolve(node) {
+    if (Array.isArray(node)) {
+      return node.map(value => this.resolve(value));
+    }
+    if (node === null || typeof node !== 'object') {
+      return node;
+    }
+    if ('$t' in node) {
+      return this.store.texts[node.$t];
+    }
+    if ('$ref' in node) {
+      const patch = '$p' in node ? this.store.patches[node.$p] : node;
+      const resolved = { ...this.resolve(this.store.entities[node.$ref]), ...this.resolve(patch.$set || {}) };
+      (patch.$unset || []).forEach(key => delete resolved[key]);
+      return resolved;
+    }
+    return Object.fromEntries(Object.entries(node).map(([key, value]) => [key, this.resolve(value)]));
+  }
+
+  // A legacy file by name, e.g. 'flashcards.json'
+  view(name) {
+    return this.store.views[name] ? this.resolve(this.store.views[name]) : null;
+  }
+
+  // The sections data-integrated-app.js used to build in organizeAllData
+  organized() {
+    return this.store.organized ? this.resolve(this.store.organized) : null;
+  }
+
+  entity(ref) {
+    return this.store.entities[ref] ? this.resolve(this.store.entities[ref]) : null;
+  }
+
+  // Cross-links of an entity: { related: [refs], tiers: [tier keys] }
+  links(ref) {
+    return this.store.links[ref] || {};
+  }
+}
+
+window.ContentStore = ContentStore;
@@ -1,8 +1,21 @@
 // utils/dataService.js
 class DataService {
+  // Maps logical data file names to content-hashed URLs written by publish_assets.py
+  static manifest = null;
+
+  static async dataUrl(name) {
+    if (!DataService.manifest) {
+      DataService.manifest = fetch('/data/asset-manifest.json', { cache: 'no-cache' })
+        .then(response => (response.ok ? response.json() : {}))
+        .catch(() => ({}));
+    }
+    const { assets = {} } = await DataService.manifest;
+    return assets[name] ? assets[name].url : `/data/${name}`;
+  }
+
   static async fetchFlashcards() {
     try {
-      const response = await fetch('/data/flashcards.json');
+      const response = await fetch(await DataService.dataUrl('flashcards.json'));
       return await response.json();
     } catch (error) {
       console.error('Error fetching flashcards:', error);
@@ -12,7 +25,7 @@ class DataService {
 
   static async fetchTopQuestions(count = 10) {
     try {
-      const response = await fetch(`/data/top-${count}-questions.json`);
+      const response = await fetch(await DataService.dataUrl(`top-${count}-questions.json`));
       return await response.json();
     } catch (error) {
       console.error(`Error fetching top ${count} questions:`, error);
@@ -20,9 +33,58 @@ class DataService {
     }
   }
 
+  // Detail blocks by file name, shared by every question they contain
+  static detailBlocks = {};
+
+  // Compact tier index (id, question, difficulty, category, block) written by summary_split.py;
+  // falls back to the full tier file when no summary is published
+  static async fetchTierSummary(count = 10) {
+    try {
+      const response = await fetch(await DataService.dataUrl(`top-${count}.summary.json`));
+      if (response.ok) {
+        return await response.json();
+      }
+    } catch (error) {
+      console.warn(`Summary for top ${count} unavailable, loading the full tier:`, error);
+    }
+    return DataService.fetchTopQuestions(count);
+  }
+
+  static async fetchDetailBlock(name) {
+    if (!DataService.detailBlocks[name]) {
+      DataService.detailBlocks[name] = fetch(await DataService.dataUrl(name))
+        .then(response => response.json())
+        .then(data => new Map(data.questions.map(question => [question.id, question])))
+        .catch(error => {
+          delete DataService.detailBlocks[name];
+          throw error;
+        });
+    }
+    return DataService.detailBlocks[name];
+  }
+
+  // Summary entries carry a detail block number instead of their answer
+  static needsDetails(entry) {
+    return entry.answer === undefined && entry.block !== undefined;
+  }
+
+  // Full question for a summary entry; entries from a full tier file are returned as they are
+  static async fetchQuestionDetails(summary, entry) {
+    if (!DataService.needsDetails(entry)) {
+      return entry;
+    }
+    try {
+      const details = await DataService.fetchDetailBlock(summary.blocks[entry.block]);
+      return { ...entry, ...details.get(entry.id) };
+    } catch (error) {
+      console.error(`Error fetching details for ${entry.id}:`, error);
+      return entry;
+    }
+  }
+
   static async fetchChallenges() {
     try {
-      const response = await fetch('/data/challenges.json');
+      const response = await fetch(await DataService.dataUrl('challenges.json'));
       return await response.json();
     } catch (error) {
       console.error('Error fetching challenges:', error);
@@ -32,7 +94,7 @@ class DataService {
 
   static async fetchEnhancedQuestions() {
     try {
-      const response = await fetch('/data/enhanced-questions.json');
+      const response = await fetch(await DataService.dataUrl('enhanced-questions.json'));
       return await response.json();
     } catch (error) {
       console.error('Error fetching enhanced questions:', error);
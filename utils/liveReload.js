@@ -0,0 +1,28 @@
+// utils/liveReload.js
+// Connects to the conversion watcher (python convert_csv_to_json.py watch)
+// and reloads the page when regenerated question data is available.
+(function () {
+  const isLocal = ['localhost', '127.0.0.1'].includes(window.location.hostname);
+  if (!isLocal || typeof EventSource === 'undefined') return;
+
+  const source = new EventSource('http://127.0.0.1:35729/events');
+  let connected = false;
+
+  source.addEventListener('stale', (event) => {
+    const { files } = JSON.parse(event.data);
+    console.log('Question data updated:', files.join(', '));
+    window.dispatchEvent(new CustomEvent('data-stale', { detail: { files } }));
+    window.location.reload();
+  });
+
+  source.onopen = () => {
+    connected = true;
+  };
+
+  source.onerror = () => {
+    // Once connected, EventSource reconnects by itself (the watcher sends
+    // retry: 1000), so a restarted watcher picks the page up again. Only a
+    // page opened while no watcher was running stops trying.
+    if (!connected && source.readyState === EventSource.CONNECTING) source.close();
+  };
+})();